@@ -0,0 +1,23 @@
+'''
+File name: __init__.py
+           Benchmark suite for the graph algorithms (file: graphalgorithms.py). Contains
+           the following modules:
+           - generators: Seeded synthetic graph generators.
+           - cases: The benchmark cases, one per algorithm engine / backend.
+           - runner: Runs the cases, writes JSON results, compares with a baseline.
+           
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os, sys
+
+# The graphalgorithms.py file is in the parent folder of the package
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from .runner import runBenchmarks, compareResults
+
+__all__ = ['runBenchmarks', 'compareResults']
@@ -0,0 +1,17 @@
+'''
+File name: __main__.py
+           Runs the benchmark suite: python -m benchmarks -h
+           
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import sys
+
+from .runner import main
+
+
+sys.exit(main())
@@ -0,0 +1,333 @@
+'''
+File name: cases.py
+           The benchmark cases: every algorithm of the GraphAlgorithms and MST classes,
+           for each of its engines and backends, and the main data structures. A case
+           is created by a setup function of the scale, which builds its input (not
+           timed) and returns the function to time, or a (function to time, before, 
+           after) tuple: before (if not None) is called before each timed run and 
+           after (if not None) once the case is done, neither one is timed.
+           
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os, random, shutil, tempfile
+
+import graphalgorithms as ga
+from . import generators
+
+
+# The generated graphs of each scale, shared by the cases
+_graphs = {}
+
+
+def graphs(scale):
+    '''
+    Returns the benchmark graphs of a scale, generated once. At scale 1 the graphs
+    have a few thousand nodes, the sizes grow linearly with the scale.
+    '''
+    if scale not in _graphs:
+        k = max(2, int(40 * scale ** 0.5))
+        _graphs[scale] = {
+            'er': generators.erdosRenyi(int(2000 * scale), int(8000 * scale), seed = 1),
+            'er_undirected': generators.erdosRenyi(int(2000 * scale), int(4000 * scale), seed = 2, 
+                undirected = True),
+            'er_dense': generators.erdosRenyi(int(100 * scale ** (1 / 3)), int(2500 * scale ** (2 / 3)), 
+                seed = 3),
+            'grid': generators.grid(k, seed = 4),
+            'grid_small': generators.grid(max(2, k // 2), seed = 5),
+            'powerlaw': generators.powerLaw(int(2000 * scale), 3, seed = 6),
+            'path': generators.path(int(20000 * scale)),
+            'dag': generators.dag(int(2000 * scale), int(8000 * scale), seed = 7),
+            'dag_small': generators.dag(int(200 * scale), int(800 * scale), seed = 8),
+        }
+        _graphs[scale]['grid_k'] = k
+        
+    return _graphs[scale]
+    
+    
+def _dijkstraCase(graph, frozen = False, **kwargs):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        if frozen:
+            g = g.freeze()
+        return lambda: ga.GraphAlgorithms().dijkstra(g, g.getLengths(), 0, **kwargs)
+    return setup
+    
+    
+def _bfsCase(graph, mode):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        return lambda: ga.GraphAlgorithms().bfs(g, 0, mode = mode)
+    return setup
+    
+    
+def _dfsCase(graph):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        return lambda: ga.GraphAlgorithms().dfs(g)
+    return setup
+    
+    
+def _iterCase(method, graph):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        algorithms = ga.GraphAlgorithms()
+        if method == 'iterDijkstra':
+            return lambda: sum(1 for _ in algorithms.iterDijkstra(g, g.getLengths(), 0))
+        if method == 'iterBfs':
+            return lambda: sum(1 for _ in algorithms.iterBfs(g, 0))
+        return lambda: sum(1 for _ in algorithms.iterDfs(g))
+    return setup
+    
+    
+def _bellmanFordCase(graph, **kwargs):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        return lambda: ga.GraphAlgorithms().bellmanFord(g, g.getLengths(), 0, **kwargs)
+    return setup
+    
+    
+def _dagCase(graph, longest):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        return lambda: ga.GraphAlgorithms().dagShortestPaths(g, g.getLengths(), 0, longest = longest)
+    return setup
+    
+    
+def _floydWarshallCase(backend):
+    def setup(scale):
+        g = graphs(scale)['er_dense']
+        return lambda: ga.GraphAlgorithms().floydWarshall(g, g.getLengths(), backend = backend)
+    return setup
+    
+    
+def _queries(g, count, seed):
+    rng = random.Random(seed)
+    V = g.getVertices()
+    return [(rng.choice(V), rng.choice(V)) for _ in range(count)]
+    
+    
+def _shortestPathCase(method):
+    def setup(scale):
+        g = graphs(scale)['grid']
+        queries = _queries(g, 20, 9)
+        algorithms = ga.GraphAlgorithms()
+        def run():
+            for s, t in queries:
+                algorithms.shortestPath(g, g.getLengths(), s, t, method = method)
+        return run
+    return setup
+    
+    
+def _astarCase(heuristic):
+    def setup(scale):
+        g = graphs(scale)['grid']
+        queries = _queries(g, 20, 9)
+        if heuristic == 'euclidean':
+            h = ga.EuclideanHeuristic(generators.gridCoordinates(graphs(scale)['grid_k']))
+        else:
+            h = ga.LandmarkHeuristic(g, g.getLengths(), 4)
+        algorithms = ga.GraphAlgorithms()
+        def run():
+            for s, t in queries:
+                algorithms.astar(g, g.getLengths(), s, t, h)
+        return run
+    return setup
+    
+    
+def _batchCase(method, workers, graph = 'er', sources = 8):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        chosen = None if method == 'johnson' else g.getVertices()[:sources]
+        return lambda: list(ga.GraphAlgorithms().batchShortestPaths(g, g.getLengths(), chosen, 
+            method = method, workers = workers))
+    return setup
+    
+    
+def _repairCase():
+    def setup(scale):
+        g = generators.grid(graphs(scale)['grid_k'], seed = 4)
+        g.reverse()
+        algorithms = ga.GraphAlgorithms()
+        previous, distance = algorithms.dijkstra(g, g.getLengths(), 0)
+        rng = random.Random(10)
+        edges = [(u, v) for u in g.getVertices() for v in g.getEdges()[u]]
+        def run():
+            changes = rng.sample(edges, 10)
+            for u, v in changes:
+                g.updateWeight(u, v, rng.randint(1, 20))
+            algorithms.repairShortestPaths(g, g.getLengths(), 0, previous, distance, changes)
+        return run
+    return setup
+    
+    
+def _sccCase(graph):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        return lambda: ga.GraphAlgorithms().scc(g)
+    return setup
+    
+    
+def _topologicalSortCase(graph):
+    def setup(scale):
+        g = graphs(scale)[graph]
+        return lambda: ga.GraphAlgorithms().topologicalSort(g)
+    return setup
+    
+    
+def _cacheCase():
+    def setup(scale):
+        g = graphs(scale)['er']
+        algorithms = ga.GraphAlgorithms(cache = ga.ShortestPathCache())
+        sources = g.getVertices()[:4]
+        def run():
+            for _ in range(25):
+                for s in sources:
+                    algorithms.dijkstra(g, g.getLengths(), s)
+        return run
+    return setup
+    
+    
+def _contractionHierarchyCase(part):
+    def setup(scale):
+        g = graphs(scale)['grid_small']
+        if part == 'build':
+            return lambda: ga.ContractionHierarchy(g, g.getLengths())
+        index = ga.ContractionHierarchy(g, g.getLengths())
+        queries = _queries(g, 100, 11)
+        def run():
+            for s, t in queries:
+                index.query(s, t)
+        return run
+    return setup
+    
+    
+def _mstCase(method, **kwargs):
+    def setup(scale):
+        g = graphs(scale)['er_undirected']
+        edges = {u: list(l_u.items()) for u, l_u in g.getLengths().items()}
+        graph = [g]
+        def before():
+            # A new graph per run, so the sorted edges order cached by a run (or by 
+            # another case) is not reused
+            graph[0] = ga.Graph(g.getVertices(), edges)
+        def run():
+            return getattr(ga.MST(), method)(graph[0], graph[0].getLengths(), **kwargs)
+        return run, before, None
+    return setup
+    
+    
+def _priorityQueueCase(kind, arity = 2):
+    def setup(scale):
+        n = int(500 * scale)
+        rng = random.Random(12)
+        priorities = [rng.randint(n, 10 * n) for _ in range(n)]
+        updates = [(rng.randrange(n), rng.randint(0, n - 1)) for _ in range(n)]
+        def run():
+            current = list(priorities)
+            if kind == 'updatable':
+                q = ga.UpdatablePriorityQueue()
+                for key, p in enumerate(priorities):
+                    q.put((p, key))
+                for key, p in updates:
+                    if p < current[key]:
+                        current[key] = p
+                        q.updatePriority(key, p)
+                while not q.empty():
+                    q.get()
+            else:
+                q = ga.IndexedPriorityQueue(arity)
+                for key, p in enumerate(priorities):
+                    q.push(key, p)
+                for key, p in updates:
+                    if p < current[key]:
+                        current[key] = p
+                        q.decreaseKey(key, p)
+                while not q.empty():
+                    q.popMin()
+        return run
+    return setup
+    
+    
+def _ioCase(kind):
+    def setup(scale):
+        g = graphs(scale)['er']
+        directory = tempfile.mkdtemp()
+        edgelist = os.path.join(directory, 'graph.txt')
+        binary = os.path.join(directory, 'graph.bin')
+        with open(edgelist, 'w') as f:
+            for u in g.getVertices():
+                for v, length in g.getLengths()[u].items():
+                    f.write(str(u) + ' ' + str(v) + ' ' + str(length) + '\n')
+        g.save(binary)
+        after = lambda: shutil.rmtree(directory, ignore_errors = True)
+        if kind == 'fromEdgelist':
+            return lambda: ga.Graph.fromEdgelist(edgelist, nodetype = int), None, after
+        if kind == 'save':
+            return lambda: g.save(binary), None, after
+        return lambda: ga.Graph.open(binary, mmap = kind == 'open_mmap'), None, after
+    return setup
+    
+    
+# The benchmark cases, (name, setup function, needs NumPy)
+CASES = [
+    ('pq.updatable', _priorityQueueCase('updatable'), False),
+    ('pq.indexed_d2', _priorityQueueCase('indexed', 2), False),
+    ('pq.indexed_d4', _priorityQueueCase('indexed', 4), False),
+    ('dijkstra.er.indexed', _dijkstraCase('er'), False),
+    ('dijkstra.er.lazy', _dijkstraCase('er', queue = 'lazy'), False),
+    ('dijkstra.er.radix', _dijkstraCase('er', engine = 'radix'), False),
+    ('dijkstra.er.buckets', _dijkstraCase('er', engine = 'buckets'), False),
+    ('dijkstra.er.delta', _dijkstraCase('er', engine = 'delta'), True),
+    ('dijkstra.grid.indexed', _dijkstraCase('grid'), False),
+    ('dijkstra.grid.radix', _dijkstraCase('grid', engine = 'radix'), False),
+    ('dijkstra.powerlaw.indexed', _dijkstraCase('powerlaw'), False),
+    ('dijkstra.powerlaw.delta', _dijkstraCase('powerlaw', engine = 'delta'), True),
+    ('dijkstra.er_csr.indexed', _dijkstraCase('er', frozen = True), False),
+    ('iterDijkstra.er', _iterCase('iterDijkstra', 'er'), False),
+    ('bfs.er.queue', _bfsCase('er', 'queue'), False),
+    ('bfs.powerlaw.queue', _bfsCase('powerlaw', 'queue'), False),
+    ('bfs.powerlaw.level', _bfsCase('powerlaw', 'level'), False),
+    ('bfs.powerlaw.hybrid', _bfsCase('powerlaw', 'hybrid'), False),
+    ('iterBfs.er', _iterCase('iterBfs', 'er'), False),
+    ('dfs.path', _dfsCase('path'), False),
+    ('dfs.er', _dfsCase('er'), False),
+    ('iterDfs.er', _iterCase('iterDfs', 'er'), False),
+    ('scc.er', _sccCase('er'), False),
+    ('topologicalSort.dag', _topologicalSortCase('dag'), False),
+    ('bellmanFord.er.passes', _bellmanFordCase('er'), False),
+    ('bellmanFord.er.queue', _bellmanFordCase('er', mode = 'queue'), False),
+    ('bellmanFord.er.numpy', _bellmanFordCase('er', backend = 'numpy'), True),
+    ('bellmanFord.dag.passes', _bellmanFordCase('dag'), False),
+    ('bellmanFord.dag.detect', _bellmanFordCase('dag', dag = None), False),
+    ('dagShortestPaths.dag', _dagCase('dag', False), False),
+    ('dagShortestPaths.dag.longest', _dagCase('dag', True), False),
+    ('floydWarshall.python', _floydWarshallCase('python'), False),
+    ('floydWarshall.numpy', _floydWarshallCase('numpy'), True),
+    ('shortestPath.grid.dijkstra', _shortestPathCase('dijkstra'), False),
+    ('shortestPath.grid.bidijkstra', _shortestPathCase('bidijkstra'), False),
+    ('shortestPath.grid.bfs', _shortestPathCase('bfs'), False),
+    ('shortestPath.grid.bibfs', _shortestPathCase('bibfs'), False),
+    ('astar.grid.euclidean', _astarCase('euclidean'), False),
+    ('astar.grid.landmark', _astarCase('landmark'), False),
+    ('batchShortestPaths.er.dijkstra.w1', _batchCase('dijkstra', 1), False),
+    ('batchShortestPaths.er.dijkstra.w2', _batchCase('dijkstra', 2), False),
+    ('batchShortestPaths.dag.johnson.w1', _batchCase('johnson', 1, 'dag_small'), False),
+    ('repairShortestPaths.grid', _repairCase(), False),
+    ('cache.er.dijkstra', _cacheCase(), False),
+    ('contractionHierarchy.build', _contractionHierarchyCase('build'), False),
+    ('contractionHierarchy.query', _contractionHierarchyCase('query'), False),
+    ('kruskal.er', _mstCase('kruskal'), False),
+    ('kruskal.er.lazy', _mstCase('kruskal', lazy = True), False),
+    ('prim.er', _mstCase('prim'), False),
+    ('boruvka.er.python', _mstCase('boruvka'), False),
+    ('boruvka.er.numpy', _mstCase('boruvka', backend = 'numpy'), True),
+    ('io.fromEdgelist', _ioCase('fromEdgelist'), False),
+    ('io.save', _ioCase('save'), False),
+    ('io.open', _ioCase('open'), False),
+    ('io.open_mmap', _ioCase('open_mmap'), False),
+]
@@ -0,0 +1,129 @@
+'''
+File name: generators.py
+           Seeded synthetic graph generators for the benchmarks (file: graphalgorithms.py).
+           All the generators return a Graph object with integer edge lengths, the
+           same seed always gives the same graph.
+           
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import random
+
+import graphalgorithms as ga
+
+
+def erdosRenyi(n, m, seed = 0, undirected = False, max_length = 100):
+    '''
+    Returns an Erdos-Renyi G(n, m) random graph of n nodes and m distinct edges, with
+    integer lengths in [1, max_length]. If undirected, each edge is added in both
+    directions with the same length.
+    '''
+    rng = random.Random(seed)
+    m = min(m, n * (n - 1) // (2 if undirected else 1))
+    edges = {v: {} for v in range(n)}
+    count = 0
+    while count < m:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        if u == v or v in edges[u]:
+            continue
+        length = rng.randint(1, max_length)
+        edges[u][v] = length
+        if undirected:
+            edges[v][u] = length
+        count += 1
+        
+    return ga.Graph(list(range(n)), {u: list(e.items()) for u, e in edges.items()})
+    
+    
+def grid(k, seed = 0, max_length = 20):
+    '''
+    Returns a road-like k x k grid graph, where the node i * k + j is connected to its
+    (up to 4) neighbours in both directions, with integer lengths in [1, max_length].
+    The coordinates of the nodes are returned by gridCoordinates.
+    '''
+    rng = random.Random(seed)
+    edges = {v: [] for v in range(k * k)}
+    for i in range(k):
+        for j in range(k):
+            u = i * k + j
+            if j + 1 < k:
+                length = rng.randint(1, max_length)
+                edges[u].append((u + 1, length))
+                edges[u + 1].append((u, length))
+            if i + 1 < k:
+                length = rng.randint(1, max_length)
+                edges[u].append((u + k, length))
+                edges[u + k].append((u, length))
+                
+    return ga.Graph(list(range(k * k)), edges)
+    
+    
+def gridCoordinates(k):
+    '''
+    Returns the (x, y) coordinates of the nodes of a k x k grid graph.
+    '''
+    return {i * k + j: (j, i) for i in range(k) for j in range(k)}
+    
+    
+def powerLaw(n, d = 3, seed = 0, max_length = 100):
+    '''
+    Returns a Barabasi-Albert preferential attachment graph of n nodes, where each new
+    node is connected (in both directions) to d existing nodes chosen with probability
+    proportional to their degree, so the degrees follow a power law.
+    '''
+    rng = random.Random(seed)
+    edges = {v: {} for v in range(n)}
+    
+    # Each node appears in the targets list once per edge end
+    targets = list(range(min(d, n)))
+    for u in range(min(d, n), n):
+        chosen = set()
+        while len(chosen) < d:
+            chosen.add(rng.choice(targets))
+        for v in chosen:
+            length = rng.randint(1, max_length)
+            edges[u][v] = edges[v][u] = length
+            targets.extend((u, v))
+            
+    return ga.Graph(list(range(n)), {u: list(e.items()) for u, e in edges.items()})
+    
+    
+def path(n, length = 1):
+    '''
+    Returns a long path graph of n nodes, 0 -> 1 -> ... -> n-1.
+    '''
+    edges = {v: [(v + 1, length)] for v in range(n - 1)}
+    
+    return ga.Graph(list(range(n)), edges)
+    
+    
+def dag(n, m, seed = 0, min_length = -10, max_length = 100):
+    '''
+    Returns a random directed acyclic graph of n nodes and m distinct edges, where
+    all the edges go from a smaller to a larger node, with integer lengths in 
+    [min_length, max_length] (negative lengths by default). Node 0 reaches all the
+    nodes, through the edges (v, v + 1).
+    '''
+    rng = random.Random(seed)
+    edges = {v: {} for v in range(n)}
+    for v in range(n - 1):
+        edges[v][v + 1] = rng.randint(min_length, max_length)
+    count = n - 1
+    m = min(m, n * (n - 1) // 2)
+    while count < m:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        if u == v:
+            continue
+        u, v = min(u, v), max(u, v)
+        if v in edges[u]:
+            continue
+        edges[u][v] = rng.randint(min_length, max_length)
+        count += 1
+        
+    return ga.Graph(list(range(n)), {u: list(e.items()) for u, e in edges.items()})
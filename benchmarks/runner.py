@@ -0,0 +1,146 @@
+'''
+File name: runner.py
+           Runs the benchmark cases (file: cases.py), recording the time and the peak
+           memory of each one, writes the results in a JSON file and compares them 
+           against a baseline results file, to flag the regressions.
+           
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import argparse, fnmatch, json, platform, time, timeit, tracemalloc
+
+import graphalgorithms as ga
+from .cases import CASES
+
+
+def runBenchmarks(scale = 1, pattern = '*', repeat = 3, verbose = True):
+    '''
+    Runs the benchmark cases whose name matches the pattern (i.e. 'dijkstra.*'). The
+    time of a case is the minimum of repeat runs, its peak memory is the peak of the
+    memory allocated (tracemalloc) in an extra run. The cases which need NumPy are 
+    skipped when it is not installed.
+    
+    Returns the results {'meta': {...}, 'results': {case: {'seconds': t, 'peak_bytes': m}}}.
+    '''
+    results = {}
+    
+    for name, setup, needs_numpy in CASES:
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+        if needs_numpy and ga.np is None:
+            if verbose:
+                print('{:40} {:>12}'.format(name, 'skipped'))
+            continue
+            
+        case = setup(scale)
+        run, before, after = case if isinstance(case, tuple) else (case, None, None)
+        
+        try:
+            seconds = min(timeit.repeat(run, before or 'pass', number = 1, repeat = repeat))
+            
+            if before is not None:
+                before()
+            tracemalloc.start()
+            try:
+                run()
+                peak_bytes = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        finally:
+            if after is not None:
+                after()
+            
+        results[name] = {'seconds': seconds, 'peak_bytes': peak_bytes}
+        if verbose:
+            print('{:40} {:10.4f} sec {:10.2f} MB'.format(name, seconds, peak_bytes / 2 ** 20))
+            
+    meta = {'scale': scale, 'repeat': repeat, 'python': platform.python_version(), 
+        'numpy': getattr(ga.np, '__version__', None), 'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%d %H:%M:%S')}
+        
+    return {'meta': meta, 'results': results}
+    
+    
+def compareResults(current, baseline, tolerance = 0.25, min_seconds = 0.001):
+    '''
+    Compares benchmark results against baseline results, of the same scale. A case is
+    a regression when its time or peak memory is more than (1 + tolerance) times the
+    baseline one. Cases faster than min_seconds in the baseline are not compared on 
+    time, as their timings are noise.
+    
+    Returns the regressions, a list of (case, metric, baseline value, current value).
+    '''
+    if current['meta']['scale'] != baseline['meta']['scale']:
+        raise ValueError('Results of different scales (' + str(current['meta']['scale']) + 
+            ', ' + str(baseline['meta']['scale']) + ').')
+            
+    regressions = []
+    for name, result in sorted(current['results'].items()):
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            if metric == 'seconds' and base[metric] < min_seconds:
+                continue
+            if result[metric] > base[metric] * (1 + tolerance):
+                regressions.append((name, metric, base[metric], result[metric]))
+                
+    return regressions
+    
+    
+def main(argv = None):
+    '''
+    Command line interface of the benchmarks, see the -h option.
+    '''
+    # Parsing input arguments
+    description_message = 'Benchmark suite for the Graph Algorithms'
+    epilog_message = 'Example: \npython -m benchmarks -s 1 -k "dijkstra.*" -o results.json -c baseline.json'
+    
+    args_parser = argparse.ArgumentParser(prog = 'benchmarks', description = description_message, 
+                epilog = epilog_message, formatter_class=argparse.RawTextHelpFormatter)
+    args_parser.add_argument('-s', action = 'store', type = float, default = 1, 
+                            help = 'graphs scale (default 1, a few thousand nodes)', metavar = 'scale')
+    args_parser.add_argument('-k', action = 'store', default = '*', 
+                            help = 'cases name pattern (default all)', metavar = 'pattern')
+    args_parser.add_argument('-r', action = 'store', type = int, default = 3, 
+                            help = 'timing repeats (default 3)', metavar = 'repeat')
+    args_parser.add_argument('-o', action = 'store', help = 'results JSON file', metavar = 'output')
+    args_parser.add_argument('-c', action = 'store', help = 'baseline JSON file to compare with',
+                            metavar = 'baseline')
+    args_parser.add_argument('-t', action = 'store', type = float, default = 0.25, 
+                            help = 'regression tolerance (default 0.25)', metavar = 'tolerance')
+    args_parser.add_argument('-l', action = 'store_true', help = 'list the cases')
+    args = args_parser.parse_args(argv)
+    
+    if args.l:
+        for name, _, needs_numpy in CASES:
+            print(name + (' (numpy)' if needs_numpy else ''))
+        return 0
+        
+    scale = int(args.s) if args.s == int(args.s) else args.s
+    results = runBenchmarks(scale, args.k, args.r)
+    
+    if args.o is not None:
+        with open(args.o, 'w') as f:
+            json.dump(results, f, indent = 2, sort_keys = True)
+            
+    if args.c is not None:
+        with open(args.c) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compareResults(results, baseline, args.t)
+        except ValueError as e:
+            print('Not compared:', e)
+            return 2
+        for name, metric, base, value in regressions:
+            print('Regression: {} {} {:.4g} -> {:.4g} ({:+.0%})'.format(name, metric, base, value, 
+                value / base - 1))
+        if regressions:
+            return 1
+        print('No regressions against', args.c)
+        
+    return 0
@@ -34,20 +34,14 @@ def demoDijkstra():
     g = ga.Graph(vertices, edges_with_lengths)
     
     # Run Dijkstra's algorithm for the defined graph
-    paths, cost = ga.GraphAlgorithms().dijkstra(G = (g.getVertices(), g.getEdges()), l = g.getLengths(), s = 'A')
+    algorithms = ga.GraphAlgorithms()
+    paths, cost = algorithms.dijkstra(G = (g.getVertices(), g.getEdges()), l = g.getLengths(), s = 'A')
     
     # Back tracking the paths, we can get the shortest path for any destination node
     print('Dijkstra shortest paths for the given graph, where starting node is \'A\':')
     start_node = 'A'
     for end_node in ['B', 'C', 'D', 'E']:
-        done = False
-        shortest_path = [end_node]
-        current = end_node
-        while not done:
-            shortest_path.insert(0, paths[current])       
-            current = shortest_path[0]
-            if current == start_node:
-                done = True
+        shortest_path = algorithms.reconstructPath(paths, start_node, end_node)
         
         print('Shortest path from \'', start_node, '\' to \'', end_node, '\' is: ', shortest_path, 
               ' with cost ', cost[end_node], sep = '')
@@ -71,19 +65,13 @@ def demoBfs():
     g = ga.Graph(vertices, edges_with_lengths)
     
     # Run BFS algorithm for the defined graph
-    paths, cost = ga.GraphAlgorithms().bfs(G = (g.getVertices(), g.getEdges()), s = 'B')
+    algorithms = ga.GraphAlgorithms()
+    paths, cost = algorithms.bfs(G = (g.getVertices(), g.getEdges()), s = 'B')
     
     print('BFS shortest paths for the given graph, where starting node is \'B\':')
     start_node = 'B'
     for end_node in ['A', 'C', 'D', 'E', 'S']:
-        done = False
-        shortest_path = [end_node]
-        current = end_node
-        while not done:
-            shortest_path.insert(0, paths[current])       
-            current = shortest_path[0]
-            if current == start_node:
-                done = True
+        shortest_path = algorithms.reconstructPath(paths, start_node, end_node)
         
         print('Shortest path from \'', start_node, '\' to \'', end_node, '\' is: ', shortest_path, 
               ' with cost ', cost[end_node], sep = '')
@@ -144,20 +132,14 @@ def demoBellmanFord():
     g = ga.Graph(vertices, edges_with_lengths)
     
     # Run Bellman-Ford algorithm for the defined graph
-    paths, cost = ga.GraphAlgorithms().bellmanFord(G = (g.getVertices(), g.getEdges()), l = g.getLengths(), s = 'S')
+    algorithms = ga.GraphAlgorithms()
+    paths, cost = algorithms.bellmanFord(G = (g.getVertices(), g.getEdges()), l = g.getLengths(), s = 'S')
 
     # Back tracking the paths, we can get the shortest path for any destination node
     print('Bellman-Ford shortest paths for the given graph, where starting node is \'S\':')
     start_node = 'S'
     for end_node in ['A', 'B', 'C', 'D', 'E', 'F', 'G']:
-        done = False
-        shortest_path = [end_node]
-        current = end_node
-        while not done:
-            shortest_path.insert(0, paths[current])       
-            current = shortest_path[0]
-            if current == start_node:
-                done = True
+        shortest_path = algorithms.reconstructPath(paths, start_node, end_node)
         
         print('Shortest path from \'', start_node, '\' to \'', end_node, '\' is: ', shortest_path, 
               ' with cost ', cost[end_node], sep = '')
@@ -214,17 +196,42 @@ def demoPrim():
     print('MST total weight:', total_weight)
     
 
+def demoBoruvka():
+    '''
+    Example code for the Boruvka's algorithm.
+    '''
+    # Define the vertices and edges of the graph, in the structure 
+    # the class Graph expects them
+    vertices = ['A', 'B', 'C', 'D', 'E', 'F']   
+    edges_with_lengths = {'A': [('B', 5), ('C', 6), ('D', 4)], 
+                          'B': [('A', 5), ('C', 1), ('D', 2)],
+                          'C': [('A', 6), ('B', 1), ('D', 2), ('F', 3), ('E', 5)],
+                          'D': [('A', 4), ('B', 2), ('C', 2), ('F', 4)],
+                          'E': [('C', 5), ('F', 4)],
+                          'F': [('D', 4), ('C', 3), ('E', 4)]}
+
+    # Create the graph object G = (V, E) given the V and E
+    g = ga.Graph(vertices, edges_with_lengths)
+    
+    # Run Boruvka's algorithm for the defined graph
+    mst, total_weight = ga.MST().boruvka(G = g, w = g.getLengths())
+    
+    print('Boruvka\'s Minimum Spanning Tree, for the given graph:')
+    print('MST:', mst)
+    print('MST total weight:', total_weight)
+    
+
 if __name__ == '__main__':
 
     # Parsing input arguments
     description_message = 'Demonstration script for the Graph Algorithms'
     epilog_message = 'Supported values for \'algorithm\' are (\'dfs\', \'bfs\', \'dijkstra\', '+\
-        '\'bellman_ford\', \'kruskal\', \'prim\')\n\nExample: \npython demoga.py -a dijkstra'
+        '\'bellman_ford\', \'kruskal\', \'prim\', \'boruvka\')\n\nExample: \npython demoga.py -a dijkstra'
         
     args_parser = argparse.ArgumentParser(description = description_message, epilog = epilog_message,
                 formatter_class=argparse.RawTextHelpFormatter)
     args_parser.add_argument('-a', action = 'store', required = True, help = 'demonstration algorithm',
-                            choices = ('dfs', 'bfs', 'dijkstra', 'bellman_ford', 'kruskal', 'prim'), metavar = 'algorithm')
+                            choices = ('dfs', 'bfs', 'dijkstra', 'bellman_ford', 'kruskal', 'prim', 'boruvka'), metavar = 'algorithm')
     args = args_parser.parse_args()
       
     # Execute the requested demonstration code
@@ -240,5 +247,7 @@ if __name__ == '__main__':
         demoKruskal()
     elif args.a == 'prim':
         demoPrim()
+    elif args.a == 'boruvka':
+        demoBoruvka()
     else:
         print('Demonstration code for algorithm \'', args.a, '\' is missing', sep = '')
@@ -3,19 +3,69 @@ File name: graphalgorithms.py
            Graph Algorithms implementations. Contains the following classes:
            - GraphAlgorithms: Graph algorithms implementation class. 
            - Graph: Graph data structure. Supplementary class.
+           - CSRGraph: Compact (CSR) graph data structure. Supplementary class.
            - UpdatablePriorityQueue: Extends PriorityQueue python class.
+           - IndexedPriorityQueue: Indexed d-ary heap with O(log n) decrease-key.
+           - DisjointSet: Union-find data structure.
+           - NegativeCycleError: Raised when a negative cycle is found.
+           - ShortestPathCache: LRU cache of the shortest paths results.
+           - ContractionHierarchy: Contraction hierarchies shortest paths index.
+           - EuclideanHeuristic, HaversineHeuristic, LandmarkHeuristic: A* search heuristics.
            
 Author: Vasileios Saveris
 enail: vsaveris@gmail.com
 
 License: MIT
 
-Date last modified: 12.01.2020
+Date last modified: 18.10.2026
 
-Python Version: 3.6
+Python Version: 3.7
 '''
 
-from queue import PriorityQueue, Queue
+from queue import PriorityQueue
+from array import array
+from collections import deque, ChainMap, OrderedDict
+from collections.abc import Mapping, Sequence
+import csv
+import hashlib
+import gzip
+import heapq
+import itertools
+import io
+import json
+import mmap as _mmap
+import math
+import multiprocessing
+import pickle
+import os
+import struct
+import sys
+
+# NumPy is optional, it is needed only by the 'numpy' backend of the algorithms
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NegativeCycleError(ValueError):
+    '''
+    Raised by the shortest paths algorithms when a negative cycle, reachable from 
+    the starting node, is found. In this case the shortest paths are not defined.
+
+    Args:
+        cycle (list): The vertices of the negative cycle, in the order of its edges.
+                      i.e. ['a', 'b', 'c'] for the cycle a -> b -> c -> a
+
+    Attributes:
+        cycle (list): The vertices of the negative cycle.
+    '''
+    
+    def __init__(self, cycle):
+    
+        super().__init__('Negative cycle found (' + ' -> '.join(str(v) for v in cycle + cycle[:1]) + ').')
+        self.cycle = cycle
+        
 
 class Graph(object):
     '''
@@ -51,27 +101,54 @@ class Graph(object):
         getVertices() : Returns the vertices of the graph (V)
         getEdges()    : Returns the edges of the graph (E)
         getLengths()  : Returns the length of the edges (le)
+        getEdgeList() : Returns the edges as (sources, destinations, lengths) lists
+        sortEdges()   : Returns the edges sorted in increasing lengths
+        iterSortedEdges(lazy) : Iterates the edges in increasing lengths
+        getUid()      : Returns the unique id of the graph
+        getVersion()  : Returns the version of the graph
+        getFingerprint() : Returns a hash of the graph contents
+        addEdge(u, v, length) : Adds an edge to the graph
+        removeEdge(u, v) : Removes an edge from the graph
+        updateWeight(u, v, length) : Changes the length of an edge
+        freeze()      : Returns a compact CSRGraph copy of the graph
+        reverse()     : Returns the graph with all the edges reversed
+        fromEdgelist(path) : Loads a compact CSRGraph from an edge list file
+        fromCsv(path) : Loads a compact CSRGraph from a CSV file
+        save(path)    : Saves the graph in the binary graph file format
+        open(path, mmap) : Opens a compact CSRGraph from a binary graph file
     '''
     
     def __init__(self, vertices, edges_with_lengths):
         
-        # Store vertices
-        self.__vertices = vertices
+        # Store a copy of the vertices, the nodes added by addEdge do not change the
+        # caller's list
+        self.__vertices = list(vertices)
             
-        # If a vertex is missing from the edges dictionary then add it with none connected nodes.
-        for v in self.__vertices:
-            try:
-                edges_with_lengths[v]
-            except:
-                edges_with_lengths[v] = []
-                
         # Store edges and lengths
         self.__edges = {}
         self.__lengths = {}
-        for key, value in zip(edges_with_lengths.keys(), edges_with_lengths.values()):
+        for key, value in edges_with_lengths.items():
             self.__edges[key] = [e[0] for e in value]
             self.__lengths[key] = {e[0]: e[1] for e in value}
             
+        # If a vertex is missing from the edges dictionary then add it with none connected nodes.
+        for v in self.__vertices:
+            if v not in self.__edges:
+                self.__edges[v] = []
+                self.__lengths[v] = {}
+                
+        # The reversed graph, created on the first call of reverse()
+        self.__reverse = None
+        
+        # The edge list and its increasing lengths order, created on first use
+        self.__edge_list = None
+        self.__sorted_order = None
+        
+        # The graph unique id and version, the cached results of the algorithms
+        # (ShortestPathCache) are valid for the same (uid, version)
+        self.__uid = next(_graph_uids)
+        self.__version = 0
+            
     
     def getVertices(self):
         '''
@@ -127,6 +204,37 @@ class Graph(object):
         return self.__lengths
         
         
+    def getEdgeList(self):
+        '''
+        Returns the edges of the graph as an edge list of three parallel lists. It is
+        created once and cached.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            sources (list): The source node of each edge.
+            destinations (list): The destination node of each edge.
+            lengths (list): The length of each edge.
+        '''
+        
+        if self.__edge_list is None:
+            sources = []
+            destinations = []
+            lengths = []
+            for source, destinations_lengths in self.__lengths.items():
+                for destination, length in destinations_lengths.items():
+                    sources.append(source)
+                    destinations.append(destination)
+                    lengths.append(length)
+            self.__edge_list = (sources, destinations, lengths)
+            
+        return self.__edge_list
+        
+        
     def sortEdges(self):
         '''
         Returns the edges sorted in increasing lengths, for the graph (le from the G = (V, E)).
@@ -138,325 +246,5480 @@ class Graph(object):
             -
 
         Returns:
-            sorted_edges (dictionary): { edge: edge_length, ...}
+            sorted_edges (dictionary): { (source, destination): edge_length, ...}
 
         '''
         
-        sorted_edges = {}
+        return {(u, v): length for u, v, length in self.iterSortedEdges()}
         
-        edges = []
-        lengths = []
         
-        # Decompose __lengths dictionary to edges and lengths
-        for source, destinations in self.__lengths.items():
-            for destination in destinations:
-                edges.append(source + destination)
-                lengths.append(destinations[destination])
-                
-        # Get sorted indices on increasing lengths order
-        sorted_indices = sorted(range(len(lengths)), key = lambda k: lengths[k])
+    def iterSortedEdges(self, lazy = False):
+        '''
+        Iterates the edges in increasing lengths order. Edges of equal length keep
+        the edge list order.
         
-        # Create sorted edges dictionary
-        for i in sorted_indices:
-            sorted_edges[edges[i]] = lengths[i]
+        Args:
+            lazy (boolean, default = False): If False, the edges are sorted once (with 
+                NumPy argsort when available) and the order is cached. If True and the
+                order is not cached, the edges are popped from a heap while iterated,
+                so stopping early (i.e. Kruskal's algorithm) avoids sorting all of them.
+
+        Raises:
+            -
+
+        Returns:
+            edges (generator): Yields (source, destination, length) tuples.
+        '''
         
-        return sorted_edges
+        sources, destinations, lengths = self.getEdgeList()
         
+        if lazy and self.__sorted_order is None:
+            order = _lazySortedOrder(lengths)
+        else:
+            if self.__sorted_order is None:
+                self.__sorted_order = _sortedOrder(lengths)
+            order = self.__sorted_order
+            
+        for i in order:
+            yield sources[i], destinations[i], lengths[i]
         
-
-class UpdatablePriorityQueue(PriorityQueue):
-    '''
-    Updatable priority queue. Extends the PriorityQueue python class.
-
-    Args:
-        maxsize (int, default = 0): The maximum size of the queue. If zero, 
-                                    the queue is not bounded.
-
-    Attributes:
-        -
         
-    Methods:
-        updatePriority(self, key, new_priority): Updates the priority of the key item. 
-
-    Note: Each item in the queue has the type of (priority, key)
-    '''
-    
-    def __init__(self, maxsize = 0):
-    
-        # Call the constructor of the parent class.
-        super().__init__(maxsize)
-
-    
-    def updatePriority(self, key, new_priority):
+    def getUid(self):
         '''
-        Updates the priority of an item in the queue, in time O(n).
-
+        Returns the unique id of the graph. Unlike id(), it is not reused by other 
+        graphs, when the graph is garbage collected.
+        
         Args:
-            key (string): The item to be updated.
-            new_priority (number): The new priority of the key item.
+            -
 
         Raises:
             -
 
         Returns:
-            edges (dictionary)
+            uid (int): The unique id of the graph.
         '''
+        
+        return self.__uid
+        
+        
+    def getVersion(self):
+        '''
+        Returns the version of the graph, which changes every time the graph is modified.
+        
+        Args:
+            -
 
-        # The updated queue
-        updated_queue = PriorityQueue()
-
-        # Copy the items to the updated queue, by modifying the priority of the 
-        # requested one.
-        while not self.empty():
-            item = self.get()
-
-            if item[1] != key:  
-                updated_queue.put(item)
-            else:
-                updated_queue.put((new_priority, key))
+        Raises:
+            -
 
-        # Put the updated items in the original queue. Copy was not used for keeping
-        # the object unchanged.
-        while not updated_queue.empty():
-            self.put(updated_queue.get())
+        Returns:
+            version (int): The version of the graph.
+        '''
         
-    
-class GraphAlgorithms(object):
-    '''
-    Graph algorithms implementation. See methods for the implemented algorithms.
+        return self.__version
+        
+        
+    def getFingerprint(self):
+        '''
+        Returns a hash of the graph contents (vertices, edges and lengths), which is the
+        same for equal graphs in any process. It is computed on every call.
+        
+        Args:
+            -
 
-    Args:
-        -
+        Raises:
+            -
 
-    Attributes:
-        -
+        Returns:
+            fingerprint (string): The SHA-1 hex digest of the graph.
+        '''
         
-    Methods:
-        dijkstra(self, G, l, s) : Implementation of the Dijkstra's algorithm.
-        bfs(self, G, s): Implementation of the Breadth-first search algorithm.
-        dfs(self, G): Implementation of the Depth-first search algorithm.
-        bellmanFord(self, G, l, s): Implementation of the Bellman-Ford algorithm.
-    '''
-
-    def __init__(self):
-  
-        pass
+        fingerprint = hashlib.sha1()
+        for u in self.__vertices:
+            l_u = self.__lengths[u]
+            fingerprint.update(repr((u, [(v, l_u[v]) for v in self.__edges[u]])).encode('utf-8'))
+            
+        return fingerprint.hexdigest()
         
         
-    def dijkstra(self, G, l, s):
+    def addEdge(self, u, v, length):
         '''
-        Dijkstra's algorithm for finding the shortest paths in a graph.
-        Returns the shortest paths from node 's' to any other node together with the
-        related path cost.
-
+        Adds the edge (u, v) to the graph. The nodes not in the graph are added. 
+        Changes the version of the graph.
+        
         Args:
-            G (tuple(list,dictionary)): The graph G = (V,E).
-            l (dictionary): The edges lengths of the graph G = (V,E).
-            s (string): Starting node.
+            u (string): The source node.
+            v (string): The destination node.
+            length (number): The length of the edge.
 
         Raises:
-            'Non positive edge length found.' : Edge lengths in the Dijkstra's 
-                                                algorithm should be positives numbers.
+            'Edge already exists.' : The graph has already the edge (u, v).
 
         Returns:
-            previous (dictionary): The previous data structure of the algorithm.
-            distance (dictionary): The distance data structure of the algorithm.
-            
-            Backtracking the previous structure we can get the shortest path from
-            the starting node to any other node. Path cost is the distance[terminating_node].
+            -
         '''
+        
+        if u in self.__lengths and v in self.__lengths[u]:
+            raise ValueError('Edge already exists (' + str((u, v)) + ').')
+            
+        for x in (u, v):
+            if x not in self.__edges:
+                self.__addVertex(x)
+                if self.__reverse is not None:
+                    self.__reverse.__addVertex(x)
+                
+        self.__edges[u].append(v)
+        self.__lengths[u][v] = length
+        
+        # The reversed graph is kept up to date, it is not created again
+        if self.__reverse is not None:
+            self.__reverse.addEdge(v, u, length)
+                
+        self.__modified()
+        
+        
+    def __addVertex(self, x):
     
-        # Initializations
-        V = G[0]
-        E = G[1]
-        # Initialize distances as defined in the algorithm
-        distance = {key: float('inf') for key in V}
-        distance[s] = 0
+        self.__vertices.append(x)
+        self.__edges[x] = []
+        self.__lengths[x] = {}
         
-        # Initialize the previous structure as defined in the algorithm
-        previous = {key: None for key in V}
         
-        # Updatable priority queue contains items of the type (priority, node)
-        priority_queue = UpdatablePriorityQueue()
-        # Initialize the queue as defined in the algorithm
-        for v in V:
-            priority_queue.put((distance[v], v))
+    def removeEdge(self, u, v):
+        '''
+        Removes the edge (u, v) from the graph. The nodes are kept. Changes the version
+        of the graph.
         
-        # Loop until all the nodes are explored
-        while not priority_queue.empty():
-            u = priority_queue.get()[1]
-            
-            # For all connected nodes v to the node u with length l
-            for v in E[u]:
-
-                # Algorithm supports only positive lengths
-                if l[u][v] <= 0:
-                    raise ValueError('Non positive edge length (' + str(l[u][v]) + ') found.')
-                    
-                if distance[v] > distance[u] + l[u][v]:
-                    distance[v] = distance[u] + l[u][v]
-                    previous[v] = u
+        Args:
+            u (string): The source node.
+            v (string): The destination node.
 
-                    # Update priority
-                    priority_queue.updatePriority(v, distance[v])
+        Raises:
+            'Edge not found.' : The graph has not the edge (u, v).
 
-        return previous, distance
-         
+        Returns:
+            -
+        '''
+        
+        if u not in self.__lengths or v not in self.__lengths[u]:
+            raise ValueError('Edge not found (' + str((u, v)) + ').')
+            
+        self.__edges[u].remove(v)
+        del self.__lengths[u][v]
+        
+        if self.__reverse is not None:
+            self.__reverse.removeEdge(v, u)
+            
+        self.__modified()
+        
         
-    def bfs(self, G, s):
+    def updateWeight(self, u, v, length):
         '''
-        BFS algorithm for finding the shortest paths in a graph.
-        Returns the shortest paths from node 's' to any other node together with the
-        related path cost.
-
+        Changes the length of the edge (u, v). Changes the version of the graph.
+        
         Args:
-            G (tuple(list,dictionary)): The graph G = (V,E).
-            s (string): Starting node.
-            
-            Note: The edges of the graph considered as having unit length.
+            u (string): The source node.
+            v (string): The destination node.
+            length (number): The new length of the edge.
+
+        Raises:
+            'Edge not found.' : The graph has not the edge (u, v).
 
         Returns:
-            previous (dictionary): The previous data structure of the algorithm.
-            distance (dictionary): The distance data structure of the algorithm.
-            
-            Backtracking the previous structure we can get the shortest path from
-            the starting node to any other node. Path cost is the distance[terminating_node].
+            -
         '''
         
-        # Initializations
-        V = G[0]
-        E = G[1]
-        # Initialize distances as defined in the algorithm
-        distance = {key: float('inf') for key in V}
-        distance[s] = 0
+        if u not in self.__lengths or v not in self.__lengths[u]:
+            raise ValueError('Edge not found (' + str((u, v)) + ').')
+            
+        self.__lengths[u][v] = length
         
-        # FIFO queue contains nodes
-        Q = Queue()
-        # Initialize the queue as defined in the algorithm
-        Q.put(s)
+        if self.__reverse is not None:
+            self.__reverse.updateWeight(v, u, length)
+            
+        self.__modified()
         
-        # Initialize the previous structure. This is for bactracking the shortest path.
-        # Is not included in the original algorithm.
-        previous = {}
         
-        while not Q.empty():
-            u = Q.get()
-
-             # For all connected nodes v to the node u
-            for v in E[u]:
-                
-                if distance[v] == float('inf'):
-                    Q.put(v)
-                    distance[v] = distance[u] + 1
-                    previous[v] = u
-         
-        return previous, distance
+    def __modified(self):
+    
+        # The edge list and its order are created again on next use, the cached results
+        # of the older versions are not valid
+        self.__edge_list = None
+        self.__sorted_order = None
+        self.__version += 1
         
         
-    def dfs(self, G):
+    def freeze(self):
         '''
-        DFS algorithm for revealing a wealth of information about a graph. 
-        Returns information about the feasible paths among all the nodes in 
-        the graph.
-
+        Returns a compact, read-only copy of the graph, where the vertices are mapped
+        to dense integers and the adjacency is stored in flat arrays.
+        
         Args:
-            G (tuple(list,dictionary)): The graph G = (V,E).
+            -
+
+        Raises:
+            -
 
         Returns:
-            pre (dictionary): The time of the first discovery to each node.
-            post (dictionary): The time of the last departure from each node.
-            ccnum (dictionary): The connected component id of each node.
+            csr_graph (CSRGraph): The compact graph. See CSRGraph class docstring.
         '''
-
-        # Nested functions used only by DFS
-        # See DPV, Algorithms, Chapter 3.2
-        def previsit(v):
-            nonlocal clock
-            nonlocal cc
-            pre[v] = clock
-            clock = clock +  1
-            ccnum[v] = cc
         
-        def postvisit(v):
-            nonlocal clock
-            post[v] = clock
-            clock += 1
+        # The arrays are filled from the edges lists and the lengths dictionaries. The
+        # vertices are copied, the nodes added by addEdge do not change the CSRGraph.
+        vertices = list(self.__vertices)
+        edges = self.__edges
+        lengths = self.__lengths
         
-        def explore(v):
-            visited[v] = True
-            previsit(v)
-            for u in E[v]:
-                if not visited[u]:
-                    explore(u)
-            postvisit(v)
-                    
+        offsets, targets, weights = _csrArrays(vertices, {v: i for i, v in enumerate(vertices)},
+            lambda u: ((v, lengths[u][v]) for v in edges[u]))
+            
+        return CSRGraph.fromArrays(vertices, offsets, targets, weights)
         
-        # Initializations
-        V = G[0]
-        E = G[1]
         
-        # Time of first visit to a node
-        pre = {}
-        # Time of final departure from a node
-        post = {}
-        # Time
-        clock = 1
+    def reverse(self):
+        '''
+        Returns the graph with all the edges reversed (G^R). It is created once and 
+        cached, it is used by the algorithms that need the in-edges of the nodes.
         
-        # Connected components identification
-        ccnum = {}
-        cc = 0
+        Args:
+            -
+
+        Raises:
+            -
 
-        # Visited is initialized to False for all vertices of the graph
-        visited = {v: False for v in V}
+        Returns:
+            reversed_graph (Graph): The reversed graph.
+        '''
         
-        for v in V:
-            if not visited[v]:
-                cc += 1
-                explore(v)
-                
-        return pre, post, ccnum
+        if self.__reverse is None:
+            reversed_edges = {v: [] for v in self.__vertices}
+            for u, destinations in self.__edges.items():
+                for v in destinations:
+                    reversed_edges.setdefault(v, []).append((u, self.__lengths[u][v]))
+            self.__reverse = Graph(self.__vertices, reversed_edges)
+            
+        return self.__reverse
         
         
-    def bellmanFord(self, G, l, s):
+    @staticmethod
+    def fromEdgelist(path, directed = True, delimiter = None, comments = '#', nodetype = None,
+        default_length = 1, progress = None, chunk_size = 1000000):
         '''
-        Bellman-Ford algorithm for finding the shortest paths in a graph.
+        Loads a graph from an edge list text file, with one 'u v [length]' edge per line.
+        The file is streamed twice, the first pass counts the degree of each vertex and 
+        the second fills the edges directly in the CSR arrays, so the memory used is 
+        close to the size of the final graph. Gzip compressed files (.gz) are supported.
+
+        Args:
+            path (string): The edge list file.
+            directed (boolean, default = True): If False, each edge is added in both directions.
+            delimiter (string, default = None): The fields delimiter, any whitespace if None.
+            comments (string, default = '#'): Lines starting with it are skipped.
+            nodetype (callable, default = None): Converts the labels, i.e. int. The labels 
+                                                 are kept strings if None.
+            default_length (number, default = 1): The length of the edges without one.
+            progress (callable, default = None): Called as progress(pass_number, lines) 
+                                                 every chunk_size lines and at the end 
+                                                 of each of the two passes.
+            chunk_size (int, default = 1000000): The number of lines between progress calls.
+
+        Raises:
+            'Invalid edge list line.' : A line has less than two fields.
+
+        Returns:
+            csr_graph (CSRGraph): The graph. The vertices are in the order they appear 
+                                  in the file.
+        '''
+        
+        def records():
+            with _openText(path) as f:
+                for line in f:
+                    if comments and line.startswith(comments):
+                        continue
+                    fields = line.split(delimiter)
+                    if not fields or (len(fields) == 1 and not fields[0].strip()):
+                        continue
+                    if len(fields) < 2:
+                        raise ValueError('Invalid edge list line (' + line.rstrip() + ').')
+                    yield fields[0].strip(), fields[1].strip(), \
+                        fields[2].strip() if len(fields) > 2 else None
+                        
+        return _streamCSR(records, directed, nodetype, default_length, progress, chunk_size)
+        
+        
+    @staticmethod
+    def fromCsv(path, source = 0, target = 1, length = None, header = True, directed = True, 
+        delimiter = ',', nodetype = None, default_length = 1, progress = None, chunk_size = 1000000):
+        '''
+        Loads a graph from a CSV file, with one edge per row. The file is streamed twice,
+        the same way as in fromEdgelist. Gzip compressed files (.gz) are supported.
+
+        Args:
+            path (string): The CSV file.
+            source, target (int or string, default = 0, 1): The column of the source and 
+                                        target vertices, as an index or a header name.
+            length (int or string, default = None): The column of the edges lengths. All
+                                        the edges have the default_length if None.
+            header (boolean, default = True): If the first row is a header.
+            directed (boolean, default = True): If False, each edge is added in both directions.
+            delimiter (string, default = ','): The fields delimiter.
+            nodetype, default_length, progress, chunk_size: See fromEdgelist.
+
+        Raises:
+            'Column not found in the CSV header.' : A column name is not in the header.
+
+        Returns:
+            csr_graph (CSRGraph): The graph. The vertices are in the order they appear 
+                                  in the file.
+        '''
+        
+        def records():
+            with _openText(path) as f:
+                reader = csv.reader(f, delimiter = delimiter)
+                columns = [source, target, length]
+                if header:
+                    names = next(reader, [])
+                    for i, column in enumerate(columns):
+                        if isinstance(column, str):
+                            try:
+                                columns[i] = names.index(column)
+                            except ValueError:
+                                raise ValueError('Column not found in the CSV header (' + column + ').')
+                s, t, w = columns
+                for row in reader:
+                    if not row:
+                        continue
+                    yield row[s], row[t], row[w] if w is not None and w < len(row) else None
+                    
+        return _streamCSR(records, directed, nodetype, default_length, progress, chunk_size)
+        
+        
+    def save(self, path):
+        '''
+        Saves the graph in the binary graph file format, see CSRGraph.save.
+
+        Args:
+            path (string): The binary graph file.
+
+        Raises:
+            'Not supported vertex label.' : See CSRGraph.save.
+
+        Returns:
+            -
+        '''
+        
+        self.freeze().save(path)
+        
+        
+    @staticmethod
+    def open(path, mmap = True):
+        '''
+        Opens a graph from a binary graph file, see CSRGraph.open.
+
+        Args:
+            path (string): The binary graph file.
+            mmap (boolean, default = True): If the arrays are memory-mapped.
+
+        Raises:
+            'Not a binary graph file.' : See CSRGraph.open.
+
+        Returns:
+            csr_graph (CSRGraph): The graph.
+        '''
+        
+        return CSRGraph.open(path, mmap)
+        
+        
+class CSRGraph(object):
+    '''
+    Compact graph G = (V, E) object, where V vertices and E edges. The vertices are
+    mapped to dense integers once, and the adjacency is stored in compressed sparse
+    row (CSR) format, in flat arrays: the out-edges of the vertex with index i are the
+    targets[offsets[i]:offsets[i+1]] with lengths weights[offsets[i]:offsets[i+1]].
+    The graph is read-only.
+    
+    getEdges() and getLengths() return read-only views with the same structure as
+    the Graph dictionaries, which translate the indices back to the vertex labels when
+    accessed. So a CSRGraph can be used by all the algorithms of this module, the 
+    same way as a Graph. Given the graph with its own lengths (getLengths()), the 
+    traversal, shortest paths and minimum spanning tree algorithms run on the indices
+    over the arrays instead, and translate the labels only for their results.
+
+    Args:
+        vertices (list)   : A list containing the nodes of the graph.
+                            i.e. ['a', 'b', 'c', 'd']
+        edges_with_lengths (dictionary): A dictionary containing the edges of the graph with
+                            their lengths. See Graph class docstring.
+
+    Attributes:
+        __vertices (list)     : Where vertices are stored.
+        __index (dictionary)  : The index of each vertex, i.e. {'a': 0, 'b': 1, ...}
+        __offsets (array)     : Where the start of the out-edges of each vertex is stored (|V|+1 items).
+        __targets (array)     : Where the index of the destination of each edge is stored (|E| items).
+        __weights (array)     : Where the length of each edge is stored (|E| items). Integer
+                                lengths are stored as integers, any other as floats.
+                                
+    Methods:
+        getVertices() : Returns the vertices of the graph (V)
+        getEdges()    : Returns the edges of the graph (E), as a read-only view
+        getLengths()  : Returns the length of the edges (le), as a read-only view
+        getEdgeList() : Returns the edges as (sources, targets, weights) index arrays
+        sortEdges()   : Returns the edges sorted in increasing lengths
+        iterSortedEdges(lazy) : Iterates the edges in increasing lengths
+        reverse()     : Returns the graph with all the edges reversed
+        getIndex()    : Returns the index of each vertex
+        getUid()      : Returns the unique id of the graph
+        getVersion()  : Returns the version of the graph (always 0, it is read-only)
+        getFingerprint() : Returns a hash of the graph contents
+        getOffsets()  : Returns the CSR offsets array
+        getTargets()  : Returns the CSR targets array
+        getWeights()  : Returns the CSR weights array
+        fromArrays(vertices, offsets, targets, weights): Creates a graph from CSR arrays
+        save(path)    : Saves the graph in the binary graph file format
+        open(path, mmap) : Opens a graph from a binary graph file
+    '''
+    
+    def __init__(self, vertices, edges_with_lengths):
+    
+        index = {v: i for i, v in enumerate(vertices)}
+        
+        offsets, targets, weights = _csrArrays(vertices, index, 
+            lambda u: edges_with_lengths.get(u, ()))
+            
+        for u in edges_with_lengths:
+            if u not in index and edges_with_lengths[u]:
+                raise ValueError('Edge from unknown vertex (' + str(u) + ') found.')
+        
+        self.__setArrays(vertices, index, offsets, targets, weights)
+        
+        
+    @classmethod
+    def fromArrays(cls, vertices, offsets, targets, weights):
+        '''
+        Creates a graph directly from CSR arrays, without copying them.
+        
+        Args:
+            vertices (list): The nodes of the graph.
+            offsets (sequence of int): The start of the out-edges of each vertex (|V|+1 items).
+            targets (sequence of int): The index of the destination of each edge.
+            weights (sequence of number): The length of each edge.
+
+        Raises:
+            'Invalid CSR arrays.' : The arrays sizes do not match.
+
+        Returns:
+            csr_graph (CSRGraph): The graph.
+        '''
+        
+        if len(offsets) != len(vertices) + 1 or len(targets) != len(weights) or \
+            offsets[len(vertices)] != len(targets):
+            raise ValueError('Invalid CSR arrays.')
+            
+        graph = cls.__new__(cls)
+        graph.__setArrays(vertices, {v: i for i, v in enumerate(vertices)}, offsets, targets, weights)
+        
+        return graph
+        
+        
+    def __setArrays(self, vertices, index, offsets, targets, weights):
+    
+        self.__vertices = vertices
+        self.__index = index
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__weights = weights
+        
+        # The binary graph file, if the arrays are memory-mapped from it
+        self.__path = None
+        
+        # The graph unique id, see Graph.getUid
+        self.__uid = next(_graph_uids)
+        
+        # The lengths view, created on the first call of getLengths()
+        self.__lengths = None
+        
+        # The reversed graph, created on the first call of reverse()
+        self.__reverse = None
+        
+        # The source index of each edge and the increasing lengths order of the edges,
+        # created on first use
+        self.__sources = None
+        self.__sorted_order = None
+        
+        
+    def __reduce__(self):
+    
+        # A memory-mapped graph is pickled (i.e. sent to worker processes) as its file,
+        # which is mapped again on unpickling, so all the processes share the page cache
+        if self.__path is not None:
+            return CSRGraph.open, (self.__path, True)
+            
+        return CSRGraph.fromArrays, (self.__vertices, self.__offsets, self.__targets, self.__weights)
+        
+        
+    def save(self, path):
+        '''
+        Saves the graph in the binary graph file format: A header, the vertex labels
+        table (JSON) and the offsets, targets and weights arrays, each one aligned to
+        8 bytes. The header is (magic, version, byte order, weights typecode, |V|, |E|,
+        labels table size), see _GRAPH_FILE_HEADER.
+
+        Args:
+            path (string): The binary graph file.
+
+        Raises:
+            'Not supported vertex label.' : The vertex labels should be strings, 
+                                            numbers, booleans or None (JSON values).
+
+        Returns:
+            -
+        '''
+        
+        labels = _encodeLabels(self.__vertices)
+        typecode = _typecode(self.__weights)
+        
+        with open(path, 'wb') as f:
+            f.write(struct.pack(_GRAPH_FILE_HEADER, _GRAPH_FILE_MAGIC, _GRAPH_FILE_VERSION,
+                sys.byteorder[0].encode('ascii'), typecode.encode('ascii'), len(self.__vertices),
+                len(self.__targets), len(labels)))
+            f.write(labels)
+            _writeArrays(f, ((self.__offsets, 'q'), (self.__targets, 'q'), (self.__weights, typecode)))
+                
+                
+    @classmethod
+    def open(cls, path, mmap = True):
+        '''
+        Opens a graph from a binary graph file, see save. With mmap, the offsets, 
+        targets and weights arrays are memory-mapped read-only views of the file 
+        (memoryview), without copying them, so the graph opens in the time of reading
+        the labels table and processes opening the same file share one copy of it 
+        in the page cache.
+
+        Args:
+            path (string): The binary graph file.
+            mmap (boolean, default = True): If False, the arrays are read in memory.
+                                            Files saved with another byte order are
+                                            always read in memory.
+
+        Raises:
+            'Not a binary graph file.' : The file header is not valid.
+            'Not supported binary graph file version.' : The file is of a newer version.
+
+        Returns:
+            csr_graph (CSRGraph): The graph.
+        '''
+        
+        header_size = struct.calcsize(_GRAPH_FILE_HEADER)
+        
+        with open(path, 'rb') as f:
+            header = f.read(header_size)
+            if len(header) != header_size or not header.startswith(_GRAPH_FILE_MAGIC):
+                raise ValueError('Not a binary graph file (' + str(path) + ').')
+            magic, version, byteorder, typecode, n, m, labels_size = \
+                struct.unpack(_GRAPH_FILE_HEADER, header)
+            if version > _GRAPH_FILE_VERSION:
+                raise ValueError('Not supported binary graph file version (' + str(version) + ').')
+            vertices = json.loads(f.read(labels_size).decode('utf-8'))
+            typecode = typecode.decode('ascii')
+            native = byteorder.decode('ascii') == sys.byteorder[0]
+            
+            start = header_size + labels_size
+            if len(vertices) != n:
+                raise ValueError('Not a binary graph file (' + str(path) + ').')
+                
+            arrays = _readArrays(f, path, start, ((n + 1, 'q'), (m, 'q'), (m, typecode)), 
+                native, mmap and m > 0)
+                    
+        graph = cls.fromArrays(vertices, *arrays)
+        if len(arrays[1]) and isinstance(arrays[1], memoryview):
+            graph.__path = os.path.abspath(path)
+            
+        return graph
+        
+        
+    def getVertices(self):
+        '''
+        Returns the vertices of the graph (V from the G = (V, E))
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            vertices (list): The graph nodes.
+        '''
+        
+        return self.__vertices
+        
+        
+    def getEdges(self):
+        '''
+        Returns the edges of the graph (E from the G = (V, E)), as a read-only mapping
+        with the same structure as the Graph edges dictionary. The lists are created
+        when accessed.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            edges (Mapping): The graph edges, i.e. {'a': ['b', 'c'], 'd': ['a']}
+        '''
+    
+        return _CSREdgesView(self, self.__vertices, self.__index, self.__offsets, self.__targets)
+        
+        
+    def getLengths(self):
+        '''
+        Returns the edges lengths of the graph (le from the G = (V, E)), as a read-only
+        mapping with the same structure as the Graph lengths dictionary. The inner
+        dictionaries are created when accessed.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            lengths (Mapping): The graph edges with their lengths, i.e.
+                               {'a': {'b': 10, 'c': 20}, 'd': {'a': 30}}
+        '''
+    
+        if self.__lengths is None:
+            self.__lengths = _CSRLengthsView(self, self.__vertices, self.__index, self.__offsets, 
+                self.__targets, self.__weights)
+            
+        return self.__lengths
+        
+        
+    def getEdgeList(self):
+        '''
+        Returns the edges of the graph as an edge list of three parallel arrays, where
+        the nodes are given by their index. The sources array is created once and 
+        cached, the other two are the CSR arrays.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            sources (array): The index of the source node of each edge.
+            targets (array): The index of the destination node of each edge.
+            weights (array): The length of each edge.
+        '''
+        
+        if self.__sources is None:
+            offsets = self.__offsets
+            sources = array('q')
+            for u in range(len(self.__vertices)):
+                sources.extend([u] * (offsets[u + 1] - offsets[u]))
+            self.__sources = sources
+            
+        return self.__sources, self.__targets, self.__weights
+        
+        
+    def sortEdges(self):
+        '''
+        Returns the edges sorted in increasing lengths, for the graph (le from the G = (V, E)).
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            sorted_edges (dictionary): { (source, destination): edge_length, ...}
+        '''
+        
+        return {(u, v): length for u, v, length in self.iterSortedEdges()}
+        
+        
+    def iterSortedEdges(self, lazy = False):
+        '''
+        Iterates the edges in increasing lengths order. Edges of equal length keep
+        the edge list order.
+        
+        Args:
+            lazy (boolean, default = False): If False, the edges are sorted once (with 
+                NumPy argsort when available) and the order is cached. If True and the
+                order is not cached, the edges are popped from a heap while iterated,
+                so stopping early (i.e. Kruskal's algorithm) avoids sorting all of them.
+
+        Raises:
+            -
+
+        Returns:
+            edges (generator): Yields (source, destination, length) tuples.
+        '''
+        
+        sources, targets, weights = self.getEdgeList()
+        vertices = self.__vertices
+        
+        if lazy and self.__sorted_order is None:
+            order = _lazySortedOrder(weights)
+        else:
+            if self.__sorted_order is None:
+                self.__sorted_order = _sortedOrder(weights)
+            order = self.__sorted_order
+            
+        for i in order:
+            yield vertices[sources[i]], vertices[targets[i]], weights[i]
+        
+        
+    def reverse(self):
+        '''
+        Returns the graph with all the edges reversed (G^R). It is created once and 
+        cached, it is used by the algorithms that need the in-edges of the nodes.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            reversed_graph (CSRGraph): The reversed graph.
+        '''
+        
+        if self.__reverse is None:
+            n = len(self.__vertices)
+            offsets = self.__offsets
+            targets = self.__targets
+            weights = self.__weights
+            
+            # Counting sort of the edges on their destination
+            reversed_offsets = array('q', [0]) * (n + 1)
+            for t in targets:
+                reversed_offsets[t + 1] += 1
+            for v in range(n):
+                reversed_offsets[v + 1] += reversed_offsets[v]
+                
+            position = array('q', reversed_offsets[:n])
+            reversed_targets = array('q', [0]) * len(targets)
+            reversed_weights = array(_typecode(weights), [0]) * len(targets)
+            for u in range(n):
+                for i in range(offsets[u], offsets[u + 1]):
+                    j = position[targets[i]]
+                    reversed_targets[j] = u
+                    reversed_weights[j] = weights[i]
+                    position[targets[i]] = j + 1
+                    
+            self.__reverse = CSRGraph.fromArrays(self.__vertices, reversed_offsets, reversed_targets,
+                reversed_weights)
+            
+        return self.__reverse
+        
+        
+    def getIndex(self):
+        '''
+        Returns the index of each vertex in the CSR arrays.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            index (dictionary): i.e. {'a': 0, 'b': 1, ...}
+        '''
+        
+        return self.__index
+        
+        
+    def getUid(self):
+        '''
+        Returns the unique id of the graph, see Graph.getUid.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            uid (int): The unique id of the graph.
+        '''
+        
+        return self.__uid
+        
+        
+    def getVersion(self):
+        '''
+        Returns the version of the graph. The graph is read-only, so it is always 0.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            version (int): The version of the graph.
+        '''
+        
+        return 0
+        
+        
+    def getFingerprint(self):
+        '''
+        Returns a hash of the graph contents (vertices and CSR arrays), which is the
+        same for equal graphs in any process. It is computed on every call.
+        
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            fingerprint (string): The SHA-1 hex digest of the graph.
+        '''
+        
+        fingerprint = hashlib.sha1(repr(list(self.__vertices)).encode('utf-8'))
+        for a, code in ((self.__offsets, 'q'), (self.__targets, 'q'), (self.__weights, _typecode(self.__weights))):
+            if not isinstance(a, (array, memoryview)):
+                a = array(code, a)
+            fingerprint.update(code.encode('ascii'))
+            fingerprint.update(memoryview(a).cast('B'))
+            
+        return fingerprint.hexdigest()
+        
+        
+    def getOffsets(self):
+        '''
+        Returns the CSR offsets array (|V|+1 items).
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            offsets (array): The start of the out-edges of each vertex.
+        '''
+        
+        return self.__offsets
+        
+        
+    def getTargets(self):
+        '''
+        Returns the CSR targets array (|E| items).
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            targets (array): The index of the destination of each edge.
+        '''
+        
+        return self.__targets
+        
+        
+    def getWeights(self):
+        '''
+        Returns the CSR weights array (|E| items).
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            weights (array): The length of each edge.
+        '''
+        
+        return self.__weights
+        
+        
+class _CSREdgesView(Mapping):
+    '''
+    Read-only {vertex: [destination, ...]} view of the edges of a CSRGraph. It is 
+    pickled as its graph (see CSRGraph.__reduce__).
+    '''
+    
+    def __init__(self, graph, vertices, index, offsets, targets):
+    
+        self.__graph = graph
+        self.__vertices = vertices
+        self.__index = index
+        self.__offsets = offsets
+        self.__targets = targets
+        
+        
+    def __getitem__(self, u):
+    
+        i = self.__index[u]
+        vertices = self.__vertices
+        
+        return [vertices[t] for t in self.__targets[self.__offsets[i]:self.__offsets[i + 1]]]
+        
+        
+    def __reduce__(self):
+    
+        return CSRGraph.getEdges, (self.__graph,)
+        
+        
+    def __iter__(self):
+    
+        return iter(self.__vertices)
+        
+        
+    def __len__(self):
+    
+        return len(self.__vertices)
+        
+        
+class _CSRLengthsView(Mapping):
+    '''
+    Read-only {vertex: {destination: length, ...}} view of the edges lengths of a CSRGraph.
+    It is pickled as its graph (see CSRGraph.__reduce__).
+    '''
+    
+    def __init__(self, graph, vertices, index, offsets, targets, weights):
+    
+        self.__graph = graph
+        self.__vertices = vertices
+        self.__index = index
+        self.__offsets = offsets
+        self.__targets = targets
+        self.__weights = weights
+        
+        
+    def __getitem__(self, u):
+    
+        i = self.__index[u]
+        start = self.__offsets[i]
+        end = self.__offsets[i + 1]
+        vertices = self.__vertices
+        
+        return {vertices[t]: w for t, w in zip(self.__targets[start:end], self.__weights[start:end])}
+        
+        
+    def __reduce__(self):
+    
+        return CSRGraph.getLengths, (self.__graph,)
+        
+        
+    def __iter__(self):
+    
+        return iter(self.__vertices)
+        
+        
+    def __len__(self):
+    
+        return len(self.__vertices)
+        
+        
+# Unique ids of the graph objects, see Graph.getUid. Unlike id(), they are never reused.
+_graph_uids = itertools.count()
+
+
+# The binary graph file format, see CSRGraph.save
+_GRAPH_FILE_MAGIC = b'GAGRAPH\0'
+_GRAPH_FILE_VERSION = 1
+_GRAPH_FILE_HEADER = '<8sIccxxQQQ'
+
+# The binary contraction hierarchy file format, see ContractionHierarchy.save
+_CH_FILE_MAGIC = b'GACHIDX\0'
+_CH_FILE_VERSION = 1
+_CH_FILE_HEADER = '<8sIccxxQQQQ'
+
+
+def _csrArrays(vertices, index, adjacency):
+    '''
+    Returns the (offsets, targets, weights) CSR arrays of a graph, filled directly
+    from adjacency(u), which iterates the (destination, length) edges of the vertex u.
+    The integer lengths are kept integers (so the results of the algorithms keep the
+    same type as for the Graph object), any other length turns the weights to floats.
+    '''
+    
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array('q')
+    
+    for u in vertices:
+        for v, w in adjacency(u):
+            try:
+                targets.append(index[v])
+            except KeyError:
+                raise ValueError('Edge to unknown vertex (' + str(v) + ') found.')
+            if type(w) is not int and weights.typecode == 'q':
+                weights = array('d', weights)
+            weights.append(w)
+        offsets.append(len(targets))
+        
+    return offsets, targets, weights
+    
+    
+def _typecode(a):
+    '''
+    Returns the typecode of an array, the format of a memoryview, or the typecode
+    of the values of any other sequence ('q' for integers, otherwise 'd').
+    '''
+    
+    if isinstance(a, array):
+        return a.typecode
+    if isinstance(a, memoryview):
+        return a.format
+        
+    return 'q' if all(type(x) is int for x in a) else 'd'
+    
+    
+def _encodeLabels(vertices):
+    '''
+    Returns the vertex labels table of the binary files, the JSON list of the labels
+    padded to 8 bytes.
+    '''
+    
+    for v in vertices:
+        if isinstance(v, (list, tuple, dict)):
+            raise ValueError('Not supported vertex label (' + str(v) + ').')
+            
+    try:
+        labels = json.dumps(list(vertices), separators = (',', ':')).encode('utf-8')
+    except TypeError as e:
+        raise ValueError('Not supported vertex label (' + str(e) + ').')
+        
+    return labels + b' ' * (-len(labels) % 8)
+    
+    
+def _writeArrays(f, arrays):
+    '''
+    Writes the (array, typecode) items of the binary files. Sequences which are not
+    arrays or memoryviews are converted to arrays of the typecode.
+    '''
+    
+    for a, code in arrays:
+        if not isinstance(a, (array, memoryview)):
+            a = array(code, a)
+        f.write(memoryview(a).cast('B'))
+        
+        
+def _readArrays(f, path, start, specs, native, mmap):
+    '''
+    Reads the arrays of the binary files, given as (number of items, typecode) from
+    the start offset. With mmap, the arrays are read-only memoryviews of the file 
+    mapped in memory, otherwise they are read in arrays.
+    '''
+    
+    sizes = [count * array(code).itemsize for count, code in specs]
+    if os.fstat(f.fileno()).st_size < start + sum(sizes):
+        raise ValueError('Not a binary graph file (' + str(path) + ').')
+        
+    arrays = []
+    if mmap and native:
+        buffer = memoryview(_mmap.mmap(f.fileno(), 0, access = _mmap.ACCESS_READ))
+        for size, (count, code) in zip(sizes, specs):
+            arrays.append(buffer[start:start + size].cast(code))
+            start += size
+    else:
+        f.seek(start)
+        for size, (count, code) in zip(sizes, specs):
+            a = array(code)
+            a.frombytes(f.read(size))
+            if not native:
+                a.byteswap()
+            arrays.append(a)
+            
+    return arrays
+    
+    
+def _openText(path):
+    '''
+    Opens a text file for reading, decompressing it if it is gzip compressed.
+    '''
+    
+    with open(path, 'rb') as f:
+        compressed = f.read(2) == b'\x1f\x8b'
+        
+    if compressed:
+        return io.TextIOWrapper(gzip.open(path, 'rb'), encoding = 'utf-8', newline = '')
+        
+    return open(path, 'r', encoding = 'utf-8', newline = '')
+    
+    
+def _parseLength(token, default_length):
+    '''
+    Parses an edge length, as int if possible, otherwise as float.
+    '''
+    
+    if token is None or token == '':
+        return default_length
+        
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+        
+        
+def _streamCSR(records, directed, nodetype, default_length, progress, chunk_size):
+    '''
+    Creates a CSRGraph in two passes over the (u, v, length) records of a file. The 
+    first pass maps the vertices to indices and counts their degrees, the second one
+    fills the targets and weights arrays at the offsets of the edges sources.
+    '''
+    
+    # First pass: vertices, degrees and lengths type
+    index = {}
+    vertices = []
+    degrees = array('q')
+    integer = True
+    lines = 0
+    
+    for u, v, w in records():
+        if nodetype is not None:
+            u, v = nodetype(u), nodetype(v)
+        for x in (u, v):
+            if x not in index:
+                index[x] = len(vertices)
+                vertices.append(x)
+                degrees.append(0)
+        degrees[index[u]] += 1
+        if not directed and u != v:
+            degrees[index[v]] += 1
+        if integer and type(_parseLength(w, default_length)) is not int:
+            integer = False
+        lines += 1
+        if progress is not None and lines % chunk_size == 0:
+            progress(1, lines)
+            
+    if progress is not None:
+        progress(1, lines)
+        
+    offsets = array('q', [0])
+    for d in degrees:
+        offsets.append(offsets[-1] + d)
+    del degrees
+    
+    m = offsets[-1]
+    targets = array('q', [0]) * m
+    weights = array('q' if integer else 'd', [0]) * m
+    
+    # Second pass: the next free position of each vertex edges
+    position = array('q', offsets)
+    lines = 0
+    
+    for u, v, w in records():
+        if nodetype is not None:
+            u, v = nodetype(u), nodetype(v)
+        i = index[u]
+        j = index[v]
+        w = _parseLength(w, default_length)
+        targets[position[i]] = j
+        weights[position[i]] = w
+        position[i] += 1
+        if not directed and i != j:
+            targets[position[j]] = i
+            weights[position[j]] = w
+            position[j] += 1
+        lines += 1
+        if progress is not None and lines % chunk_size == 0:
+            progress(2, lines)
+            
+    if progress is not None:
+        progress(2, lines)
+        
+    return CSRGraph.fromArrays(vertices, offsets, targets, weights)
+    
+    
+def _unpackGraph(G):
+    '''
+    Returns the vertices and the edges of a graph given either as a (V, E) tuple
+    or as a Graph / CSRGraph object.
+    '''
+    
+    if isinstance(G, (Graph, CSRGraph)):
+        return G.getVertices(), G.getEdges()
+        
+    return G[0], G[1]
+    
+    
+def _reverseGraph(G, l):
+    '''
+    Returns the edges and the edges lengths of the reversed graph G^R. For Graph and
+    CSRGraph objects with their own lengths (or None) the cached reversed graph is
+    used, otherwise it is created with the lengths l.
+    '''
+    
+    if isinstance(G, (Graph, CSRGraph)) and (l is None or l is G.getLengths()):
+        R = G.reverse()
+        return R.getEdges(), R.getLengths()
+        
+    V, E = _unpackGraph(G)
+    reversed_edges = {v: [] for v in V}
+    reversed_lengths = {v: {} for v in V}
+    for u in V:
+        l_u = l[u] if l is not None else None
+        for v in E[u]:
+            reversed_edges[v].append(u)
+            reversed_lengths[v][u] = l_u[v] if l_u is not None else 1
+            
+    return reversed_edges, reversed_lengths
+    
+    
+def _neighbors(G, V, E, index):
+    '''
+    Returns a function which gives the out-neighbors of the node with index i in V, as
+    indices. The targets array of a CSRGraph is sliced, the edges of any other graph
+    are translated with the index of the nodes.
+    '''
+    
+    if isinstance(G, CSRGraph):
+        offsets = G.getOffsets()
+        targets = G.getTargets()
+        return lambda i: targets[offsets[i]:offsets[i + 1]]
+        
+    return lambda i: [index[v] for v in E[V[i]]]
+    
+    
+def _inNeighbors(G, V, index):
+    '''
+    Returns a function which gives the in-neighbors of the node with index i in V, as
+    indices, from the reversed graph, see _neighbors and _reverseGraph.
+    '''
+    
+    if isinstance(G, CSRGraph):
+        R = G.reverse()
+        return _neighbors(R, V, None, index)
+        
+    # The in-edges are translated while iterated, the search of an in-neighbor may 
+    # stop early
+    RE, _ = _reverseGraph(G, None)
+    return lambda i: (index[u] for u in RE[V[i]])
+    
+    
+def _degrees(G, V, E):
+    '''
+    Returns the list of the out-degrees of the nodes in V.
+    '''
+    
+    if isinstance(G, CSRGraph):
+        offsets = G.getOffsets()
+        return [offsets[i + 1] - offsets[i] for i in range(len(V))]
+        
+    return [len(E[v]) for v in V]
+    
+    
+def _edgeTriples(G, V, E, l, index):
+    '''
+    Iterates the (source, target, length) triples of the edges of a graph, where the 
+    nodes are the indices in V. The arrays of a CSRGraph with its own lengths are 
+    iterated, without creating the edges lists and lengths dictionaries.
+    '''
+    
+    if isinstance(G, CSRGraph) and l is G.getLengths():
+        offsets = G.getOffsets()
+        targets = G.getTargets()
+        weights = G.getWeights()
+        for i in range(len(V)):
+            start = offsets[i]
+            end = offsets[i + 1]
+            for j, length in zip(targets[start:end], weights[start:end]):
+                yield i, j, length
+        return
+        
+    for u in V:
+        i = index[u]
+        l_u = l[u]
+        for v in E[u]:
+            yield i, index[v], l_u[v]
+            
+            
+def _pathTo(previous, t):
+    '''
+    Returns the path from the root of the previous structure to the node 't'.
+    '''
+    
+    path = []
+    while t is not None:
+        path.append(t)
+        t = previous[t]
+    path.reverse()
+    
+    return path
+    
+    
+def _edgeKey(u, v):
+    '''
+    Returns the key of the undirected edge u - v in the MST dictionaries, the tuple
+    of its nodes in increasing order (or as given, for not comparable nodes).
+    '''
+    
+    try:
+        return (u, v) if u <= v else (v, u)
+    except TypeError:
+        return (u, v)
+        
+        
+def _sortedOrder(lengths):
+    '''
+    Returns the indices of the lengths in increasing lengths order (stable sort).
+    '''
+    
+    if np is not None:
+        return np.argsort(np.asarray(lengths), kind = 'stable').tolist()
+        
+    return sorted(range(len(lengths)), key = lengths.__getitem__)
+    
+    
+def _lazySortedOrder(lengths):
+    '''
+    Generator of the indices of the lengths in increasing lengths order (stable), 
+    popped from a heap. Heapify is O(n), each index costs O(log n) when consumed.
+    '''
+    
+    heap = [(length, i) for i, length in enumerate(lengths)]
+    heapq.heapify(heap)
+    
+    while heap:
+        yield heapq.heappop(heap)[1]
+        
+        
+def _checkBackend(backend):
+    '''
+    Checks that a backend of the algorithms is supported and available.
+    '''
+    
+    if backend not in ('python', 'numpy'):
+        raise ValueError('Not supported backend (' + str(backend) + ').')
+        
+    if backend == 'numpy' and np is None:
+        raise ImportError('NumPy is required by the numpy backend.')
+        
+        
+def _edgeArrays(G, V, E, l):
+    '''
+    Returns the (sources, targets, weights) NumPy arrays of the edges of a graph, where
+    the nodes are the indices in V. The arrays of a CSRGraph with its own lengths are 
+    used without copying.
+    '''
+    
+    if isinstance(G, CSRGraph) and l is G.getLengths():
+        offsets = np.frombuffer(G.getOffsets(), dtype = np.int64)
+        targets = np.frombuffer(G.getTargets(), dtype = np.int64)
+        weights = G.getWeights()
+        weights = np.frombuffer(weights, dtype = np.int64 if _typecode(weights) == 'q' else np.float64)
+        sources = np.repeat(np.arange(len(V), dtype = np.int64), np.diff(offsets))
+        return sources, targets, weights
+        
+    sources, targets, weights = _edgeLists(G, V, E, l)
+    integer = all(type(w) is int for w in weights)
+    
+    return np.array(sources, dtype = np.int64), np.array(targets, dtype = np.int64), \
+        np.array(weights, dtype = np.int64 if integer else np.float64)
+        
+        
+def _edgeLists(G, V, E, l):
+    '''
+    Returns the (sources, targets, weights) lists of the edges of a graph, where the 
+    nodes are the indices in V. The edge list arrays of a CSRGraph with its own lengths
+    are used.
+    '''
+    
+    if isinstance(G, CSRGraph) and l is G.getLengths():
+        return G.getEdgeList()
+        
+    index = {v: i for i, v in enumerate(V)}
+    sources = []
+    targets = []
+    weights = []
+    for u in V:
+        i = index[u]
+        l_u = l[u]
+        for v in E[u]:
+            sources.append(i)
+            targets.append(index[v])
+            weights.append(l_u[v])
+            
+    return sources, targets, weights
+        
+        
+def _poolContext(context):
+    '''
+    Returns the multiprocessing context of a start method name, the default context
+    if None, or the given context.
+    '''
+    
+    if context is None or isinstance(context, str):
+        return multiprocessing.get_context(context)
+        
+    return context
+    
+    
+def _predecessorCycle(previous, starts):
+    '''
+    Returns a cycle of the predecessor graph given by the previous structure, 
+    searching from the start vertices first. Returns None if there is no cycle.
+    '''
+    
+    # Each walk is colored with its own id, so that every vertex is walked once
+    walk = {}
+    for i, v in enumerate(starts):
+        while v is not None and v not in walk:
+            walk[v] = i
+            v = previous[v]
+            
+        # The walk closed on itself, v is on the cycle
+        if v is not None and walk[v] == i:
+            cycle = [v]
+            u = previous[v]
+            while u != v:
+                cycle.append(u)
+                u = previous[u]
+            cycle.reverse()
+            return cycle
+            
+    return None
+        
+        
+
+class DisjointSet(object):
+    '''
+    Disjoint sets (union-find) data structure. The elements are mapped to dense
+    integers, and the parent pointers and the sets sizes are stored in integer arrays.
+    find uses iterative path halving and union links by size, so any sequence of m
+    operations takes O(m a(n)) time. Elements can be added at any time, so it can
+    be used for incremental connectivity queries on a stream of edges.
+
+    Args:
+        elements (iterable, default = ()): The initial elements, each one in its own set.
+
+    Attributes:
+        __index (dictionary): The index of each element, i.e. {'a': 0, 'b': 1, ...}
+        __elements (list): The elements, in index order.
+        __parent (array): The parent index of each element.
+        __size (array): The size of the set of each root element.
+        __count (int): The number of disjoint sets.
+        
+    Methods:
+        add(self, x): Adds the element x in its own set.
+        find(self, x): Returns the representative element of the set of x.
+        union(self, x, y): Merges the sets of x and y.
+        unionMany(self, pairs): Merges the sets of each (x, y) pair.
+        connected(self, x, y): Checks if x and y are in the same set.
+        getCount(self): Returns the number of disjoint sets.
+    '''
+    
+    def __init__(self, elements = ()):
+    
+        self.__index = {}
+        self.__elements = []
+        self.__parent = array('q')
+        self.__size = array('q')
+        self.__count = 0
+        
+        for x in elements:
+            self.add(x)
+            
+            
+    def __len__(self):
+    
+        return len(self.__elements)
+        
+        
+    def __contains__(self, x):
+    
+        return x in self.__index
+        
+        
+    def add(self, x):
+        '''
+        Adds an element in its own set. Nothing is done if the element exists.
+
+        Args:
+            x (hashable): The element.
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+        
+        if x in self.__index:
+            return
+            
+        self.__index[x] = len(self.__elements)
+        self.__parent.append(len(self.__elements))
+        self.__size.append(1)
+        self.__elements.append(x)
+        self.__count += 1
+        
+        
+    def __findIndex(self, i):
+    
+        # Path halving: every node on the path is linked to its grandparent
+        parent = self.__parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+            
+        return i
+        
+        
+    def __indexOf(self, x):
+    
+        try:
+            return self.__index[x]
+        except KeyError:
+            raise ValueError('Unknown element (' + str(x) + ').')
+            
+            
+    def find(self, x):
+        '''
+        Returns the representative element of the set of an element.
+
+        Args:
+            x (hashable): The element.
+
+        Raises:
+            'Unknown element.' : The element was never added.
+
+        Returns:
+            representative (hashable): The representative element of the set.
+        '''
+        
+        return self.__elements[self.__findIndex(self.__indexOf(x))]
+        
+        
+    def connected(self, x, y):
+        '''
+        Checks if two elements are in the same set.
+
+        Args:
+            x (hashable): The first element.
+            y (hashable): The second element.
+
+        Raises:
+            'Unknown element.' : An element was never added.
+
+        Returns:
+            connected (boolean): True if the elements are in the same set.
+        '''
+        
+        return self.__findIndex(self.__indexOf(x)) == self.__findIndex(self.__indexOf(y))
+        
+        
+    def union(self, x, y):
+        '''
+        Merges the sets of two elements. Elements not added yet are added first.
+
+        Args:
+            x (hashable): The first element.
+            y (hashable): The second element.
+
+        Raises:
+            -
+
+        Returns:
+            merged (boolean): True if the elements were in different sets.
+        '''
+        
+        self.add(x)
+        self.add(y)
+        
+        root_x = self.__findIndex(self.__index[x])
+        root_y = self.__findIndex(self.__index[y])
+        
+        if root_x == root_y:
+            return False
+            
+        # Link the root of the smaller set to the root of the larger one
+        size = self.__size
+        if size[root_x] < size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.__parent[root_y] = root_x
+        size[root_x] += size[root_y]
+        self.__count -= 1
+        
+        return True
+        
+        
+    def unionMany(self, pairs):
+        '''
+        Merges the sets of the elements of each pair, i.e. for a stream of edges.
+
+        Args:
+            pairs (iterable): (x, y) pairs of elements.
+
+        Raises:
+            -
+
+        Returns:
+            merges (int): The number of pairs whose elements were in different sets.
+        '''
+        
+        union = self.union
+        merges = 0
+        for x, y in pairs:
+            if union(x, y):
+                merges += 1
+                
+        return merges
+        
+        
+    def getCount(self):
+        '''
+        Returns the number of disjoint sets.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            count (int): The number of disjoint sets.
+        '''
+        
+        return self.__count
+        
+        
+class UpdatablePriorityQueue(PriorityQueue):
+    '''
+    Updatable priority queue. Extends the PriorityQueue python class.
+
+    Args:
+        maxsize (int, default = 0): The maximum size of the queue. If zero, 
+                                    the queue is not bounded.
+
+    Attributes:
+        -
+        
+    Methods:
+        updatePriority(self, key, new_priority): Updates the priority of the key item. 
+
+    Note: Each item in the queue has the type of (priority, key)
+    '''
+    
+    def __init__(self, maxsize = 0):
+    
+        # Call the constructor of the parent class.
+        super().__init__(maxsize)
+
+    
+    def updatePriority(self, key, new_priority):
+        '''
+        Updates the priority of an item in the queue, in time O(n).
+
+        Args:
+            key (string): The item to be updated.
+            new_priority (number): The new priority of the key item.
+
+        Raises:
+            -
+
+        Returns:
+            edges (dictionary)
+        '''
+
+        # The updated queue
+        updated_queue = PriorityQueue()
+
+        # Copy the items to the updated queue, by modifying the priority of the 
+        # requested one.
+        while not self.empty():
+            item = self.get()
+
+            if item[1] != key:  
+                updated_queue.put(item)
+            else:
+                updated_queue.put((new_priority, key))
+
+        # Put the updated items in the original queue. Copy was not used for keeping
+        # the object unchanged.
+        while not updated_queue.empty():
+            self.put(updated_queue.get())
+
+
+class IndexedPriorityQueue(object):
+    '''
+    Indexed d-ary min heap. Keeps a position map from each key to its slot in the
+    heap, so that decrease-key, pop-min and membership tests do not need to scan
+    the queue. It is not thread-safe (no locking), it is meant to be used by the
+    single threaded graph algorithms of this module.
+
+    Args:
+        arity (int, default = 2): The number of children of each heap node (2, 4 or 8).
+
+    Attributes:
+        __arity (int)       : The arity of the heap.
+        __keys (list)       : The keys, stored in heap order.
+        __priorities (list) : The priorities of the keys, parallel to __keys.
+        __position (dictionary): The heap slot of each key, i.e. {key: index, ...}
+        
+    Methods:
+        push(self, key, priority): Inserts a new key in the queue, in time O(log n).
+        decreaseKey(self, key, new_priority): Decreases the priority of a key, in time O(log n).
+        popMin(self): Removes and returns the item with the minimum priority, in time O(log n).
+        contains(self, key): Checks if a key is in the queue, in time O(1).
+        empty(self): Checks if the queue is empty.
+
+    Note: Ties between equal priorities are broken by comparing the keys, the same as
+          the (priority, key) items of the UpdatablePriorityQueue.
+    '''
+    
+    def __init__(self, arity = 2):
+    
+        if arity not in (2, 4, 8):
+            raise ValueError('Not supported heap arity (' + str(arity) + ').')
+            
+        self.__arity = arity
+        self.__keys = []
+        self.__priorities = []
+        self.__position = {}
+        
+        
+    def __len__(self):
+    
+        return len(self.__keys)
+        
+        
+    def __contains__(self, key):
+    
+        return key in self.__position
+        
+        
+    def empty(self):
+        '''
+        Checks if the queue is empty.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            empty (boolean): True if the queue has no items.
+        '''
+        
+        return not self.__keys
+        
+        
+    def contains(self, key):
+        '''
+        Checks if a key is in the queue, in time O(1).
+
+        Args:
+            key (hashable): The key to be checked.
+
+        Raises:
+            -
+
+        Returns:
+            contained (boolean): True if the key is in the queue.
+        '''
+        
+        return key in self.__position
+        
+        
+    def push(self, key, priority):
+        '''
+        Inserts a new key in the queue, in time O(log n).
+
+        Args:
+            key (hashable): The key to be inserted.
+            priority (number): The priority of the key.
+
+        Raises:
+            'Key already in the queue.' : Use decreaseKey for keys already in the queue.
+
+        Returns:
+            -
+        '''
+        
+        if key in self.__position:
+            raise ValueError('Key (' + str(key) + ') already in the queue.')
+            
+        self.__keys.append(key)
+        self.__priorities.append(priority)
+        self.__position[key] = len(self.__keys) - 1
+        self.__siftUp(len(self.__keys) - 1)
+        
+        
+    def decreaseKey(self, key, new_priority):
+        '''
+        Decreases the priority of a key in the queue, in time O(log n).
+
+        Args:
+            key (hashable): The key to be updated.
+            new_priority (number): The new priority of the key. It should not be 
+                                   larger than the current one.
+
+        Raises:
+            'Key not in the queue.' : The key should be pushed first.
+            'Priority increase.' : The new priority is larger than the current one.
+
+        Returns:
+            -
+        '''
+        
+        try:
+            i = self.__position[key]
+        except KeyError:
+            raise ValueError('Key (' + str(key) + ') not in the queue.')
+            
+        if new_priority > self.__priorities[i]:
+            raise ValueError('Priority increase (' + str(self.__priorities[i]) + ' -> ' + 
+                str(new_priority) + ') for key (' + str(key) + ').')
+                
+        self.__priorities[i] = new_priority
+        self.__siftUp(i)
+        
+        
+    def popMin(self):
+        '''
+        Removes and returns the item with the minimum priority, in time O(log n).
+
+        Args:
+            -
+
+        Raises:
+            'Pop from an empty queue.' : The queue has no items.
+
+        Returns:
+            item (tuple): The (priority, key) item with the minimum priority.
+        '''
+        
+        keys = self.__keys
+        priorities = self.__priorities
+        
+        if not keys:
+            raise IndexError('Pop from an empty queue.')
+            
+        item = (priorities[0], keys[0])
+        del self.__position[keys[0]]
+        
+        # Move the last item to the root and restore the heap property
+        last_key = keys.pop()
+        last_priority = priorities.pop()
+        if keys:
+            keys[0] = last_key
+            priorities[0] = last_priority
+            self.__position[last_key] = 0
+            self.__siftDown(0)
+            
+        return item
+        
+        
+    def __siftUp(self, i):
+    
+        keys = self.__keys
+        priorities = self.__priorities
+        position = self.__position
+        arity = self.__arity
+        
+        key = keys[i]
+        priority = priorities[i]
+        
+        # Move the parents down until the place of the item is found
+        while i > 0:
+            parent = (i - 1) // arity
+            if (priorities[parent], keys[parent]) <= (priority, key):
+                break
+            keys[i] = keys[parent]
+            priorities[i] = priorities[parent]
+            position[keys[i]] = i
+            i = parent
+            
+        keys[i] = key
+        priorities[i] = priority
+        position[key] = i
+        
+        
+    def __siftDown(self, i):
+    
+        keys = self.__keys
+        priorities = self.__priorities
+        position = self.__position
+        arity = self.__arity
+        size = len(keys)
+        
+        key = keys[i]
+        priority = priorities[i]
+        
+        # Move the smallest child up until the place of the item is found
+        while True:
+            first = arity * i + 1
+            if first >= size:
+                break
+                
+            smallest = first
+            for c in range(first + 1, min(first + arity, size)):
+                if (priorities[c], keys[c]) < (priorities[smallest], keys[smallest]):
+                    smallest = c
+                    
+            if (priority, key) <= (priorities[smallest], keys[smallest]):
+                break
+                
+            keys[i] = keys[smallest]
+            priorities[i] = priorities[smallest]
+            position[keys[i]] = i
+            i = smallest
+            
+        keys[i] = key
+        priorities[i] = priority
+        position[key] = i
+        
+    
+class EuclideanHeuristic(object):
+    '''
+    A* search heuristic, the straight line distance between the coordinates of two
+    nodes. It is admissible when no edge is shorter than the straight line distance
+    of its nodes (multiplied by scale).
+
+    Args:
+        coordinates (dictionary): The coordinates of each node, i.e. {'a': (0, 1), 'b': (2, 3)}
+        scale (number, default = 1): Multiplies the distance, i.e. to convert coordinates
+                                     units to edges lengths units.
+
+    Attributes:
+        __coordinates (dictionary): Where the coordinates are stored.
+        __scale (number): Where the scale is stored.
+        
+    Methods:
+        __call__(self, v, t): Returns the estimated distance from node v to node t.
+    '''
+    
+    def __init__(self, coordinates, scale = 1):
+    
+        self.__coordinates = coordinates
+        self.__scale = scale
+        
+        
+    def __call__(self, v, t):
+    
+        return self.__scale * math.sqrt(sum((a - b) ** 2 for a, b in 
+            zip(self.__coordinates[v], self.__coordinates[t])))
+            
+            
+class HaversineHeuristic(object):
+    '''
+    A* search heuristic, the great circle distance between the (latitude, longitude)
+    coordinates of two nodes. It is admissible when no edge is shorter than the great
+    circle distance of its nodes (multiplied by scale).
+
+    Args:
+        coordinates (dictionary): The (latitude, longitude) of each node, in degrees.
+                                  i.e. {'a': (37.98, 23.72), 'b': (40.64, 22.94)}
+        radius (number, default = 6371.0088): The radius of the sphere, by default the mean
+                                              earth radius in kilometers.
+        scale (number, default = 1): Multiplies the distance, i.e. to convert radius units
+                                     to edges lengths units.
+
+    Attributes:
+        __coordinates (dictionary): Where the coordinates are stored, in radians.
+        __scale (number): Where the radius multiplied by the scale is stored.
+        
+    Methods:
+        __call__(self, v, t): Returns the estimated distance from node v to node t.
+    '''
+    
+    def __init__(self, coordinates, radius = 6371.0088, scale = 1):
+    
+        self.__coordinates = {v: (math.radians(c[0]), math.radians(c[1])) for v, c in coordinates.items()}
+        self.__scale = radius * scale
+        
+        
+    def __call__(self, v, t):
+    
+        lat_v, lon_v = self.__coordinates[v]
+        lat_t, lon_t = self.__coordinates[t]
+        
+        a = math.sin((lat_t - lat_v) / 2) ** 2 + \
+            math.cos(lat_v) * math.cos(lat_t) * math.sin((lon_t - lon_v) / 2) ** 2
+            
+        return self.__scale * 2 * math.asin(min(1, math.sqrt(a)))
+        
+        
+class LandmarkHeuristic(object):
+    '''
+    A* search heuristic based on landmarks and the triangle inequality (ALT). The 
+    shortest paths distances from and to each landmark are precomputed, and the
+    distance from v to t is bounded below by:
+        d(L, t) - d(L, v) and d(v, L) - d(t, L), for each landmark L.
+    It is always admissible and consistent.
+
+    Args:
+        G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                    is also accepted.
+        l (dictionary): The edges lengths of the graph G = (V,E).
+        landmarks (list or int): The landmark nodes, or the number of landmarks to be
+                                 selected (farthest landmarks selection).
+
+    Attributes:
+        __landmarks (list): Where the landmarks are stored.
+        __from_landmark (list): The distances from each landmark, [{node: distance}, ...]
+        __to_landmark (list): The distances to each landmark, [{node: distance}, ...]
+        
+    Methods:
+        __call__(self, v, t): Returns the estimated distance from node v to node t.
+        getLandmarks(self): Returns the landmarks.
+    '''
+    
+    def __init__(self, G, l, landmarks):
+    
+        V, E = _unpackGraph(G)
+        RE, Rl = _reverseGraph(G, l)
+        algorithms = GraphAlgorithms()
+        
+        self.__from_landmark = []
+        self.__to_landmark = []
+        
+        if isinstance(landmarks, int):
+            # Farthest selection: the next landmark is the node with the largest finite
+            # distance from the landmarks selected so far
+            count = landmarks
+            landmarks = []
+            closest = {v: float('inf') for v in V}
+            candidate = V[0] if V else None
+            while len(landmarks) < min(count, len(V)):
+                landmarks.append(candidate)
+                self.__addLandmark(algorithms, V, E, l, RE, Rl, candidate)
+                for v, d in self.__from_landmark[-1].items():
+                    closest[v] = min(closest[v], d)
+                finite = [v for v in V if v not in landmarks and closest[v] != float('inf')]
+                unreached = [v for v in V if v not in landmarks and closest[v] == float('inf')]
+                # Prefer nodes not reached by any landmark, they have no bounds yet
+                if unreached:
+                    candidate = unreached[0]
+                elif finite:
+                    candidate = max(finite, key = lambda v: closest[v])
+                else:
+                    break
+        else:
+            for landmark in landmarks:
+                self.__addLandmark(algorithms, V, E, l, RE, Rl, landmark)
+                
+        self.__landmarks = list(landmarks)
+                
+                
+    def __addLandmark(self, algorithms, V, E, l, RE, Rl, landmark):
+    
+        self.__from_landmark.append(algorithms.dijkstra((V, E), l, landmark, queue = 'lazy')[1])
+        self.__to_landmark.append(algorithms.dijkstra((V, RE), Rl, landmark, queue = 'lazy')[1])
+        
+        
+    def getLandmarks(self):
+        '''
+        Returns the landmarks of the heuristic.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            landmarks (list): The landmark nodes.
+        '''
+        
+        return self.__landmarks
+        
+        
+    def __call__(self, v, t):
+    
+        inf = float('inf')
+        bound = 0
+        
+        for from_landmark, to_landmark in zip(self.__from_landmark, self.__to_landmark):
+            # Bounds with an infinite term give no information
+            if from_landmark[t] != inf and from_landmark[v] != inf:
+                bound = max(bound, from_landmark[t] - from_landmark[v])
+            if to_landmark[v] != inf and to_landmark[t] != inf:
+                bound = max(bound, to_landmark[v] - to_landmark[t])
+                
+        return bound
+        
+        
+def _dijkstra(V, E, l, s, queue, arity, zero_lengths = False):
+    '''
+    Dijkstra's algorithm, see GraphAlgorithms.dijkstra method. Zero edge lengths are 
+    accepted when zero_lengths is True (i.e. for the reweighted lengths of the
+    Johnson's algorithm).
+    '''
+    
+    # Initialize distances as defined in the algorithm
+    distance = {key: float('inf') for key in V}
+    distance[s] = 0
+    
+    # Initialize the previous structure as defined in the algorithm
+    previous = {key: None for key in V}
+    
+    if queue == 'lazy':
+        # Heap of (priority, node) items. A node may have several items, only the
+        # one matching its current distance is valid.
+        heap = [(0, s)]
+        
+        while heap:
+            d_u, u = heapq.heappop(heap)
+            
+            # Skip outdated items
+            if d_u > distance[u]:
+                continue
+                
+            l_u = l[u]
+            for v in E[u]:
+            
+                # Algorithm supports only positive lengths
+                if l_u[v] <= 0 and (l_u[v] < 0 or not zero_lengths):
+                    raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                    
+                if distance[v] > d_u + l_u[v]:
+                    distance[v] = d_u + l_u[v]
+                    previous[v] = u
+                    heapq.heappush(heap, (distance[v], v))
+                    
+        return previous, distance
+        
+    # Indexed priority queue contains items of the type (priority, node). Nodes
+    # at infinite distance are inserted when they are first reached.
+    priority_queue = IndexedPriorityQueue(arity)
+    priority_queue.push(s, 0)
+    
+    # Loop until all the reachable nodes are explored
+    while not priority_queue.empty():
+        d_u, u = priority_queue.popMin()
+        l_u = l[u]
+        
+        # For all connected nodes v to the node u with length l
+        for v in E[u]:
+
+            # Algorithm supports only positive lengths
+            if l_u[v] <= 0 and (l_u[v] < 0 or not zero_lengths):
+                raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                
+            if distance[v] > d_u + l_u[v]:
+                distance[v] = d_u + l_u[v]
+                previous[v] = u
+
+                # Update priority
+                if v in priority_queue:
+                    priority_queue.decreaseKey(v, distance[v])
+                else:
+                    priority_queue.push(v, distance[v])
+
+    return previous, distance
+
+
+def _sortedPositions(vertices):
+    '''
+    Returns the (rank, position) lists of the vertices in sorted order: rank[i] is the
+    place of vertices[i] in the sorted order and position[r] is the index of the r-th 
+    vertex, or (None, None) when the vertices are already sorted (or not comparable).
+    '''
+    
+    try:
+        if all(u <= v for u, v in zip(vertices, itertools.islice(vertices, 1, None))):
+            return None, None
+        position = sorted(range(len(vertices)), key = vertices.__getitem__)
+    except TypeError:
+        return None, None
+        
+    rank = [0] * len(vertices)
+    for r, i in enumerate(position):
+        rank[i] = r
+        
+    return rank, position
+    
+    
+def _csrDijkstra(G, s, queue, arity):
+    '''
+    Dijkstra's algorithm on the arrays of a CSRGraph with its own lengths, see 
+    _dijkstra. The labels are translated only for the source and the result, the 
+    loops run on the integer indices. Unless the vertices are sorted, the nodes of 
+    the queue are their ranks in the sorted order (see _sortedPositions), so the 
+    ties are broken as by the labels.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    weights = G.getWeights()
+    n = len(vertices)
+    
+    rank, position = _sortedPositions(vertices)
+    if rank is None:
+        rank = position = range(n)
+        
+    distance = [float('inf')] * n
+    previous = [None] * n
+    source = rank[G.getIndex()[s]]
+    distance[source] = 0
+    
+    if queue == 'lazy':
+        heap = [(0, source)]
+        
+        while heap:
+            d_u, u = heapq.heappop(heap)
+            
+            # Skip outdated items
+            if d_u > distance[u]:
+                continue
+                
+            i = position[u]
+            start = offsets[i]
+            end = offsets[i + 1]
+            for t, length in zip(targets[start:end], weights[start:end]):
+                if length <= 0:
+                    raise ValueError('Non positive edge length (' + str(length) + ') found.')
+                    
+                v = rank[t]
+                if distance[v] > d_u + length:
+                    distance[v] = d_u + length
+                    previous[v] = u
+                    heapq.heappush(heap, (distance[v], v))
+    else:
+        priority_queue = IndexedPriorityQueue(arity)
+        priority_queue.push(source, 0)
+        
+        while not priority_queue.empty():
+            d_u, u = priority_queue.popMin()
+            
+            i = position[u]
+            start = offsets[i]
+            end = offsets[i + 1]
+            for t, length in zip(targets[start:end], weights[start:end]):
+                if length <= 0:
+                    raise ValueError('Non positive edge length (' + str(length) + ') found.')
+                    
+                v = rank[t]
+                if distance[v] > d_u + length:
+                    distance[v] = d_u + length
+                    previous[v] = u
+                    if v in priority_queue:
+                        priority_queue.decreaseKey(v, distance[v])
+                    else:
+                        priority_queue.push(v, distance[v])
+                        
+    # Back to the labels, in the order of the vertices
+    labels = [vertices[i] for i in position]
+    
+    return ({v: None if previous[r] is None else labels[previous[r]] for v, r in zip(vertices, rank)},
+        {v: distance[r] for v, r in zip(vertices, rank)})
+        
+        
+def _csrDfs(G, order):
+    '''
+    DFS algorithm on the arrays of a CSRGraph, see GraphAlgorithms.dfs. The loops run
+    on the integer indices, the labels are translated only for the order and the 
+    result. The stack keeps the position of the next edge of each node in the targets
+    array.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    index = G.getIndex()
+    n = len(vertices)
+    
+    # The pre and post times of each node, 0 if not visited (not finished)
+    pre = [0] * n
+    post = [0] * n
+    ccnum = [0] * n
+    clock = 1
+    cc = 0
+    
+    # The nodes in the order they are visited and finished
+    visited = []
+    finished = []
+    
+    for v in (range(n) if order is None else [index[x] for x in order]):
+        if pre[v]:
+            continue
+            
+        cc += 1
+        pre[v] = clock
+        clock += 1
+        ccnum[v] = cc
+        visited.append(v)
+        stack = [v]
+        positions = [offsets[v]]
+        
+        while stack:
+            u = stack[-1]
+            p = positions[-1]
+            end = offsets[u + 1]
+            
+            while p < end:
+                w = targets[p]
+                p += 1
+                if not pre[w]:
+                    positions[-1] = p
+                    pre[w] = clock
+                    clock += 1
+                    ccnum[w] = cc
+                    visited.append(w)
+                    stack.append(w)
+                    positions.append(offsets[w])
+                    break
+            else:
+                stack.pop()
+                positions.pop()
+                post[u] = clock
+                clock += 1
+                finished.append(u)
+                
+    return ({vertices[v]: pre[v] for v in visited}, {vertices[v]: post[v] for v in finished},
+        {vertices[v]: ccnum[v] for v in visited})
+        
+        
+def _csrIterDfs(G, s, max_depth, limit):
+    '''
+    Generator version of the DFS algorithm on the arrays of a CSRGraph, see 
+    GraphAlgorithms.iterDfs and _csrDfs. The edges of the nodes at max_depth are 
+    skipped, their position is the end of their edges.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    n = len(vertices)
+    
+    visited = bytearray(n)
+    count = 0
+    
+    for v in (range(n) if s is None else [G.getIndex()[s]]):
+        if visited[v]:
+            continue
+        if limit is not None and count >= limit:
+            return
+            
+        visited[v] = 1
+        count += 1
+        yield 'pre', vertices[v], 0
+        stack = [v]
+        positions = [offsets[v] if max_depth != 0 else offsets[v + 1]]
+        
+        while stack:
+            u = stack[-1]
+            p = positions[-1]
+            end = offsets[u + 1]
+            
+            while p < end:
+                w = targets[p]
+                p += 1
+                if not visited[w]:
+                    if limit is not None and count >= limit:
+                        continue
+                    positions[-1] = p
+                    visited[w] = 1
+                    count += 1
+                    depth = len(stack)
+                    yield 'pre', vertices[w], depth
+                    stack.append(w)
+                    positions.append(offsets[w] if max_depth is None or depth < max_depth 
+                        else offsets[w + 1])
+                    break
+            else:
+                stack.pop()
+                positions.pop()
+                yield 'post', vertices[u], len(stack)
+                
+                
+def _csrDagShortestPaths(G, s, order, longest):
+    '''
+    DAG shortest paths algorithm on the arrays of a CSRGraph with its own lengths, see
+    GraphAlgorithms.dagShortestPaths. The order is the topological order of the nodes
+    reachable from s.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    weights = G.getWeights()
+    index = G.getIndex()
+    
+    infinity = float('-inf') if longest else float('inf')
+    distance = [infinity] * len(vertices)
+    distance[index[s]] = 0
+    previous = [-1] * len(vertices)
+    
+    for i in [index[u] for u in order]:
+        d_u = distance[i]
+        start = offsets[i]
+        end = offsets[i + 1]
+        for j, length in zip(targets[start:end], weights[start:end]):
+            d_v = d_u + length
+            if (d_v > distance[j]) if longest else (d_v < distance[j]):
+                distance[j] = d_v
+                previous[j] = i
+                
+    return _csrPrevious(vertices, previous), dict(zip(vertices, distance))
+    
+    
+def _csrPrevious(vertices, previous):
+    '''
+    Returns the previous dictionary of the vertices, from the list of the index of 
+    the previous of each vertex (-1 if None).
+    '''
+    
+    return {v: (vertices[p] if p >= 0 else None) for v, p in zip(vertices, previous)}
+    
+    
+def _csrBellmanFord(G, s, mode):
+    '''
+    Bellman-Ford algorithm on the arrays of a CSRGraph with its own lengths, see 
+    GraphAlgorithms.bellmanFord. The loops run on the integer indices, the labels are
+    translated only for the source and the result.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    weights = G.getWeights()
+    n = len(vertices)
+    
+    distance = [float('inf')] * n
+    previous = [-1] * n
+    source = G.getIndex()[s]
+    distance[source] = 0
+    
+    if mode == 'queue':
+        # FIFO queue of the nodes whose distance changed, and the number of edges
+        # of their current path. A path of |V| edges contains a cycle.
+        Q = deque([source])
+        in_queue = bytearray(n)
+        in_queue[source] = 1
+        edges_count = [0] * n
+        
+        while Q:
+            u = Q.popleft()
+            in_queue[u] = 0
+            d_u = distance[u]
+            start = offsets[u]
+            end = offsets[u + 1]
+            
+            for v, length in zip(targets[start:end], weights[start:end]):
+                if distance[v] > d_u + length:
+                    distance[v] = d_u + length
+                    previous[v] = u
+                    edges_count[v] = edges_count[u] + 1
+                    
+                    if edges_count[v] >= n:
+                        cycle = _predecessorCycle(_csrPrevious(vertices, previous), 
+                            [vertices[v]] + list(vertices))
+                        if cycle is not None:
+                            raise NegativeCycleError(cycle)
+                            
+                    if not in_queue[v]:
+                        in_queue[v] = 1
+                        Q.append(v)
+                        
+        return _csrPrevious(vertices, previous), dict(zip(vertices, distance))
+        
+    # Repeat |V| - 1 times, or until no distance changes. A change in the |V|-th
+    # pass means that there is a negative cycle.
+    for i in range(n):
+        changed = -1
+        for u in range(n):
+            d_u = distance[u]
+            start = offsets[u]
+            end = offsets[u + 1]
+            for v, length in zip(targets[start:end], weights[start:end]):
+                if distance[v] > d_u + length:
+                    distance[v] = d_u + length
+                    previous[v] = u
+                    changed = v
+                    
+        if changed < 0:
+            break
+            
+        if i == n - 1:
+            raise NegativeCycleError(_predecessorCycle(_csrPrevious(vertices, previous), 
+                [vertices[changed]] + list(vertices)))
+                
+    return _csrPrevious(vertices, previous), dict(zip(vertices, distance))
+    
+    
+def _csrAstar(G, s, t, h):
+    '''
+    A* search algorithm on the arrays of a CSRGraph with its own lengths, see 
+    GraphAlgorithms.astar. The heap items keep the labels after the distances, so the
+    ties are broken as by the labels.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    weights = G.getWeights()
+    index = G.getIndex()
+    
+    source = index[s]
+    target = index.get(t, -1)
+    distance = {source: 0}
+    previous = {source: -1}
+    estimate = {source: h(s, t)}
+    
+    # Heap of (distance + estimate, distance, label, node) items
+    heap = [(estimate[source], 0, s, source)]
+    
+    while heap:
+        _, d_u, _, u = heapq.heappop(heap)
+        
+        # Skip outdated items
+        if d_u > distance[u]:
+            continue
+            
+        if u == target:
+            break
+            
+        start = offsets[u]
+        end = offsets[u + 1]
+        for v, length in zip(targets[start:end], weights[start:end]):
+            if length <= 0:
+                raise ValueError('Non positive edge length (' + str(length) + ') found.')
+                
+            if v not in distance or distance[v] > d_u + length:
+                distance[v] = d_u + length
+                previous[v] = u
+                if v not in estimate:
+                    estimate[v] = h(vertices[v], t)
+                heapq.heappush(heap, (distance[v] + estimate[v], distance[v], vertices[v], v))
+                
+    previous = {vertices[v]: (vertices[u] if u >= 0 else None) for v, u in previous.items()}
+    distance = {vertices[v]: d for v, d in distance.items()}
+    
+    if t not in distance:
+        distance[t] = float('inf')
+        previous[t] = None
+        
+    return previous, distance
+    
+    
+def _csrPrim(G, queue, arity):
+    '''
+    Prim's algorithm on the arrays of a CSRGraph with its own lengths, see MST.prim.
+    As in _csrDijkstra, the nodes of the queue are their ranks in the sorted order of
+    the labels, so the ties are broken as by the labels.
+    '''
+    
+    vertices = G.getVertices()
+    offsets = G.getOffsets()
+    targets = G.getTargets()
+    weights = G.getWeights()
+    n = len(vertices)
+    
+    rank, position = _sortedPositions(vertices)
+    if rank is None:
+        rank = position = range(n)
+        
+    # The weight of the lightest edge connecting each reached node to the tree, and 
+    # the previous of the reached nodes, in the order they are reached
+    cost = [0] * n
+    reached = bytearray(n)
+    previous = {}
+    in_tree = bytearray(n)
+    
+    # Each node not in the tree after a run is the root of the next component
+    for root in rank:
+        if in_tree[root]:
+            continue
+            
+        reached[root] = 1
+        previous[root] = -1
+        
+        if queue == 'lazy':
+            heap = [(0, root)]
+            
+            while heap:
+                _, u = heapq.heappop(heap)
+                if in_tree[u]:
+                    continue
+                in_tree[u] = 1
+                
+                i = position[u]
+                start = offsets[i]
+                end = offsets[i + 1]
+                for t, length in zip(targets[start:end], weights[start:end]):
+                    v = rank[t]
+                    if not in_tree[v] and (not reached[v] or cost[v] > length):
+                        cost[v] = length
+                        reached[v] = 1
+                        previous[v] = u
+                        heapq.heappush(heap, (length, v))
+        else:
+            priority_queue = IndexedPriorityQueue(arity)
+            priority_queue.push(root, 0)
+            
+            while not priority_queue.empty():
+                u = priority_queue.popMin()[1]
+                in_tree[u] = 1
+                
+                i = position[u]
+                start = offsets[i]
+                end = offsets[i + 1]
+                for t, length in zip(targets[start:end], weights[start:end]):
+                    v = rank[t]
+                    if in_tree[v]:
+                        continue
+                        
+                    if not reached[v]:
+                        cost[v] = length
+                        reached[v] = 1
+                        previous[v] = u
+                        priority_queue.push(v, length)
+                    elif cost[v] > length:
+                        cost[v] = length
+                        previous[v] = u
+                        priority_queue.decreaseKey(v, length)
+                        
+    # Back to the labels
+    mst = {}
+    total_weight = 0
+    
+    for v, u in previous.items():
+        if u >= 0:
+            mst[_edgeKey(vertices[position[u]], vertices[position[v]])] = cost[v]
+            total_weight += cost[v]
+            
+    return mst, total_weight
+    
+    
+def _integerDijkstra(V, E, l, s, engine):
+    '''
+    Dijkstra's algorithm for integer edge lengths, with a radix heap ('radix') or a 
+    bucket queue ('buckets') engine, see GraphAlgorithms.dijkstra method. On paths 
+    with equal cost, the previous node is the one with the smallest (distance, node),
+    which is the first one popped by the heap engine.
+    '''
+    
+    # Initialize distances as defined in the algorithm
+    distance = {key: float('inf') for key in V}
+    distance[s] = 0
+    
+    # Initialize the previous structure as defined in the algorithm
+    previous = {key: None for key in V}
+    
+    if engine == 'buckets':
+        # A distance d is in the bucket d mod (C + 1), where C the max edge length. The
+        # keys in the queue are within [d, d + C], so they never share a bucket.
+        size = 1
+        for u in V:
+            for length in l[u].values():
+                if type(length) is not int:
+                    raise ValueError('Not integer edge length (' + str(length) + ') found.')
+                size = max(size, length + 1)
+        buckets = [[] for _ in range(size)]
+        buckets[0].append(s)
+        pending = 1
+        d = 0
+        
+        def pop():
+            nonlocal d, pending
+            while not buckets[d % size]:
+                d += 1
+            pending -= 1
+            return d, buckets[d % size].pop()
+            
+        def push(key, v):
+            nonlocal pending
+            pending += 1
+            buckets[key % size].append(v)
+            
+        def empty():
+            return pending == 0
+    else:
+        # A key is in the bucket of the highest bit it differs from the last popped key
+        # (bucket 0 for equal keys). The popped keys are monotone, so when bucket 0 is
+        # empty the minimum of the first not empty bucket is the next last key, and 
+        # the items of that bucket move to lower buckets.
+        buckets = [[] for _ in range(65)]
+        buckets[0].append((0, s))
+        last = 0
+        pending = 1
+        
+        def pop():
+            nonlocal last, pending
+            if not buckets[0]:
+                i = 1
+                while not buckets[i]:
+                    i += 1
+                items = buckets[i]
+                buckets[i] = []
+                last = min(items)[0]
+                for key, v in items:
+                    buckets[(key ^ last).bit_length()].append((key, v))
+            pending -= 1
+            return buckets[0].pop()
+            
+        def push(key, v):
+            nonlocal pending
+            pending += 1
+            buckets[(key ^ last).bit_length()].append((key, v))
+            
+        def empty():
+            return pending == 0
+            
+    while not empty():
+        d_u, u = pop()
+        
+        # Skip outdated items
+        if d_u > distance[u]:
+            continue
+            
+        l_u = l[u]
+        for v in E[u]:
+            length = l_u[v]
+            
+            # The engines support only positive integer lengths
+            if type(length) is not int:
+                raise ValueError('Not integer edge length (' + str(length) + ') found.')
+            if length <= 0:
+                raise ValueError('Non positive edge length (' + str(length) + ') found.')
+                
+            d_v = d_u + length
+            if d_v < distance[v]:
+                distance[v] = d_v
+                previous[v] = u
+                push(d_v, v)
+            elif d_v == distance[v] and (d_u, u) < (distance[previous[v]], previous[v]):
+                previous[v] = u
+                
+    return previous, distance
+    
+    
+class _ReweightedLengths(Mapping):
+    '''
+    Read-only {vertex: {destination: length, ...}} view of the edges lengths reweighted
+    with the potentials h of the Johnson's algorithm: l'(u, v) = l(u, v) + h(u) - h(v).
+    '''
+    
+    def __init__(self, lengths, potentials):
+    
+        self.__lengths = lengths
+        self.__potentials = potentials
+        
+        
+    def __getitem__(self, u):
+    
+        h = self.__potentials
+        h_u = h[u]
+        
+        return {v: w + h_u - h[v] for v, w in self.__lengths[u].items()}
+        
+        
+    def __iter__(self):
+    
+        return iter(self.__lengths)
+        
+        
+    def __len__(self):
+    
+        return len(self.__lengths)
+        
+        
+# The task of the batch shortest paths worker processes (G, V, E, l, method, potentials),
+# see GraphAlgorithms.batchShortestPaths. It is inherited by forked workers (copy on
+# write), or set once per worker by the pool initializer.
+_batch_task = None
+
+
+def _batchInitializer(G, l, method, potentials):
+    '''
+    Sets the task of a batch shortest paths worker process. The graph is sent instead
+    of its edges, so that a memory-mapped CSRGraph is mapped again by the worker (its
+    views can not be pickled). The graph's own lengths are sent as None.
+    '''
+    
+    global _batch_task
+    
+    V, E = _unpackGraph(G)
+    if l is None and isinstance(G, (Graph, CSRGraph)):
+        l = G.getLengths()
+        
+    _batch_task = (G, V, E, l, method, potentials)
+    
+    
+def _batchWorker(s):
+    '''
+    Runs the batch shortest paths task of the worker process for the source s.
+    '''
+    
+    return _batchShortestPaths(_batch_task, s)
+    
+    
+def _batchShortestPaths(task, s):
+    '''
+    Runs a batch shortest paths task for the source s. Returns (s, previous, distance).
+    '''
+    
+    G, V, E, l, method, potentials = task
+    
+    if method == 'dijkstra':
+        if isinstance(G, CSRGraph) and l is G.getLengths():
+            previous, distance = _csrDijkstra(G, s, 'indexed', 2)
+        else:
+            previous, distance = _dijkstra(V, E, l, s, 'indexed', 2)
+    elif method == 'bfs':
+        previous, distance = GraphAlgorithms().bfs((V, E), s)
+    elif method == 'bellmanFord':
+        previous, distance = GraphAlgorithms().bellmanFord((V, E), l, s)
+    else:
+        # Johnson's algorithm: Dijkstra's algorithm on the reweighted (non negative)
+        # lengths, then the distances are restored: d(s, v) = d'(s, v) - h(s) + h(v)
+        previous, distance = _dijkstra(V, E, _ReweightedLengths(l, potentials), s, 'indexed', 2, 
+            zero_lengths = True)
+        h_s = potentials[s]
+        for v, d in distance.items():
+            if d != float('inf'):
+                distance[v] = d - h_s + potentials[v]
+                
+    return s, previous, distance
+    
+    
+def _resultSize(result):
+    '''
+    Returns the estimated size in bytes of a result of the shortest paths algorithms 
+    (a dictionary or a tuple of them), see ShortestPathCache: the dictionaries and 
+    the numbers they hold. The other values (nodes) are shared with the graph, so the
+    estimate is an upper bound only for number nodes.
+    '''
+    
+    size = 0
+    for part in (result if isinstance(result, tuple) else (result,)):
+        size += sys.getsizeof(part)
+        if isinstance(part, dict):
+            size += sum(sys.getsizeof(x) for x in part.values() if type(x) in (int, float))
+            
+    return size
+    
+    
+def _copyResult(result):
+    '''
+    Returns a copy of a result of the shortest paths algorithms (a dictionary or a 
+    tuple of them), see ShortestPathCache. The values are numbers and nodes, so the
+    copies of the dictionaries are shallow.
+    '''
+    
+    if isinstance(result, tuple):
+        return tuple(_copyResult(part) for part in result)
+    if isinstance(result, dict):
+        return dict(result)
+        
+    return result
+    
+    
+class ShortestPathCache(object):
+    '''
+    Cache of the results of the single source shortest paths algorithms, used by the
+    GraphAlgorithms objects created with it. The results are kept in memory up to a 
+    size budget, evicting the least recently used ones, and optionally in a directory
+    on disk.
+    
+    The memory entries are keyed by (graph uid, graph version, algorithm, source, 
+    parameters), so the results of a modified Graph (new version) are never returned,
+    and the entries of its older versions are dropped. The disk entries are keyed by
+    the graph fingerprint instead, so they are shared by the processes loading the 
+    same graph. Only the results computed with the graph's own lengths (l is 
+    G.getLengths()) of a Graph or CSRGraph object are cached.
+    
+    Every caller gets its own copy of the cached previous and distance dictionaries,
+    so modifying a result (i.e. with GraphAlgorithms.repairShortestPaths) does not 
+    change the cached one.
+
+    Args:
+        max_bytes (int, default = 64MB): The memory budget. The size of an entry is 
+                                         estimated by the size of its dictionaries and
+                                         of the numbers (distances) they hold.
+        directory (string, default = None): The directory of the disk entries. No disk
+                                            entries are kept if None.
+
+    Attributes:
+        __entries (OrderedDict): The memory entries, from least to most recently used.
+        __sizes (dictionary): The estimated size of each memory entry.
+        __versions (dictionary): The last seen version of each graph uid.
+        __fingerprints (dictionary): The fingerprint of each (uid, version).
+        
+    Methods:
+        get(G, l, algorithm, s, params, compute): Returns a cached or computed result.
+        getStats()  : Returns the hits, misses, evictions and size counters.
+        clear()     : Removes all the memory entries.
+    '''
+    
+    def __init__(self, max_bytes = 64 * 1024 * 1024, directory = None):
+        
+        self.__max_bytes = max_bytes
+        self.__directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok = True)
+            
+        self.__entries = OrderedDict()
+        self.__sizes = {}
+        self.__versions = {}
+        self.__fingerprints = {}
+        self.__size = 0
+        
+        self.__hits = 0
+        self.__disk_hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        
+        
+    def get(self, G, l, algorithm, s, params, compute):
+        '''
+        Returns the cached result of an algorithm, or computes and caches it.
+
+        Args:
+            G (Graph or CSRGraph): The graph. Results for (V,E) tuples are not cached.
+            l (dictionary): The edges lengths, None for unweighted algorithms.
+            algorithm (string): The algorithm name.
+            s (string): Starting node.
+            params (tuple): The parameters of the algorithm, which change its result.
+            compute (callable): Computes the result, when it is not cached.
+
+        Raises:
+            -
+
+        Returns:
+            result: The result of the algorithm.
+        '''
+        
+        if not isinstance(G, (Graph, CSRGraph)) or (l is not None and l is not G.getLengths()):
+            return compute()
+            
+        uid = G.getUid()
+        version = G.getVersion()
+        if self.__versions.get(uid, version) != version:
+            self.__invalidate(uid)
+        self.__versions[uid] = version
+        
+        key = (uid, version, algorithm, s, params)
+        try:
+            result = self.__entries[key]
+        except KeyError:
+            pass
+        else:
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return _copyResult(result)
+            
+        path = None
+        if self.__directory is not None:
+            path = self.__diskPath(G, key)
+            try:
+                with open(path, 'rb') as f:
+                    result = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+            else:
+                self.__disk_hits += 1
+                self.__store(key, result)
+                return _copyResult(result)
+                
+        self.__misses += 1
+        result = compute()
+        self.__store(key, result)
+        
+        if path is not None:
+            # Written to a temporary file first, so other processes never read a partial entry
+            temporary = path + '.' + str(os.getpid()) + '.tmp'
+            with open(temporary, 'wb') as f:
+                pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+            
+        return _copyResult(result)
+        
+        
+    def getStats(self):
+        '''
+        Returns the counters of the cache.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            stats (dictionary): {'hits': memory hits, 'disk_hits': disk hits, 'misses': 
+                                 computed results, 'evictions': evicted memory entries,
+                                 'entries': memory entries, 'bytes': estimated memory size}
+        '''
+        
+        return {'hits': self.__hits, 'disk_hits': self.__disk_hits, 'misses': self.__misses,
+            'evictions': self.__evictions, 'entries': len(self.__entries), 'bytes': self.__size}
+            
+            
+    def clear(self):
+        '''
+        Removes all the memory entries. The disk entries and the counters are kept.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            -
+        '''
+        
+        self.__entries.clear()
+        self.__sizes.clear()
+        self.__versions.clear()
+        self.__fingerprints.clear()
+        self.__size = 0
+        
+        
+    def __store(self, key, result):
+    
+        size = _resultSize(result)
+        if size > self.__max_bytes:
+            return
+            
+        self.__entries[key] = result
+        self.__sizes[key] = size
+        self.__size += size
+        
+        # Evict the least recently used entries
+        while self.__size > self.__max_bytes:
+            evicted, _ = self.__entries.popitem(last = False)
+            self.__size -= self.__sizes.pop(evicted)
+            self.__evictions += 1
+            
+            
+    def __invalidate(self, uid):
+    
+        for key in [key for key in self.__entries if key[0] == uid]:
+            del self.__entries[key]
+            self.__size -= self.__sizes.pop(key)
+        for key in [key for key in self.__fingerprints if key[0] == uid]:
+            del self.__fingerprints[key]
+            
+            
+    def __diskPath(self, G, key):
+    
+        uid, version, algorithm, s, params = key
+        
+        fingerprint = self.__fingerprints.get((uid, version))
+        if fingerprint is None:
+            fingerprint = self.__fingerprints[(uid, version)] = G.getFingerprint()
+            
+        name = hashlib.sha1(repr((fingerprint, algorithm, s, params)).encode('utf-8')).hexdigest()
+        
+        return os.path.join(self.__directory, name + '.pickle')
+        
+        
+class ContractionHierarchy(object):
+    '''
+    Contraction hierarchies index, for fast point-to-point shortest paths queries on a
+    static graph with positive edges lengths (i.e. road networks).
+    
+    Preprocessing contracts the nodes one by one, in increasing importance: when a node
+    v is contracted, a shortcut edge (u, w) with length l(u, v) + l(v, w) is added for 
+    each pair of its remaining neighbours u -> v -> w, unless a witness search (a local
+    Dijkstra's search from u, avoiding v) finds a path from u to w which is not longer.
+    The importance of a node is its edge difference (shortcuts added minus edges 
+    removed) plus the number of its contracted neighbours, updated lazily.
+    
+    A query is a bidirectional Dijkstra's search, where the forward search from 's' 
+    follows only edges to more important nodes (upward graph) and the backward search
+    from 't' only reversed edges from more important nodes (downward graph). Both
+    graphs are small, so the queries settle only a few hundred nodes even on large 
+    graphs. The shortcuts of the found path are unpacked through their middle nodes.
+    
+    The upward and downward graphs are stored in CSR arrays (see CSRGraph), which can
+    be saved and memory-mapped (see save and open).
+
+    Args:
+        G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object is 
+                                    also accepted.
+        l (dictionary): The edges lengths of the graph G = (V,E).
+        witness_limit (int, default = 500): The maximum number of nodes settled by a 
+                                            witness search. A shortcut is added when the
+                                            limit is reached, so it trades the number of
+                                            shortcuts for preprocessing time.
+
+    Attributes:
+        __vertices (list): Where vertices are stored.
+        __index (dictionary): The index of each vertex.
+        __up (tuple): The (offsets, targets, weights, middle) arrays of the upward graph.
+                      The middle node of a shortcut edge, -1 for the original edges.
+        __down (tuple): The (offsets, targets, weights, middle) arrays of the downward 
+                        graph, where targets are the sources of the reversed edges.
+        
+    Methods:
+        query(s, t)   : Returns the shortest path from 's' to 't' and its cost
+        getVertices() : Returns the vertices of the graph (V)
+        getShortcutCount() : Returns the number of shortcut edges
+        save(path)    : Saves the index in the binary contraction hierarchy file format
+        open(path, mmap) : Opens an index from a binary contraction hierarchy file
+    '''
+    
+    def __init__(self, G, l, witness_limit = 500):
+    
+        V, E = _unpackGraph(G)
+        index = {v: i for i, v in enumerate(V)}
+        n = len(V)
+        
+        # The remaining graph: out-edges and in-edges of each node, {node: (length, middle)}
+        outgoing = [{} for _ in range(n)]
+        incoming = [{} for _ in range(n)]
+        for i, j, length in _edgeTriples(G, V, E, l, index):
+        
+            # Algorithm supports only positive lengths
+            if length <= 0:
+                raise ValueError('Non positive edge length (' + str(length) + ') found.')
+                
+            if i != j:
+                outgoing[i][j] = incoming[j][i] = (length, -1)
+                    
+        # The edges of each node to the more important nodes, when it is contracted
+        up = [None] * n
+        down = [None] * n
+        contracted_neighbours = [0] * n
+        
+        # Lazy updated priority queue of the nodes importance
+        heap = [(self.__importance(outgoing, incoming, contracted_neighbours, v, witness_limit)[0], v) 
+            for v in range(n)]
+        heapq.heapify(heap)
+        contracted = bytearray(n)
+        
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracted[v]:
+                continue
+                
+            # Contract the node if it is still the least important one
+            importance, shortcuts = self.__importance(outgoing, incoming, contracted_neighbours, 
+                v, witness_limit)
+            if heap and importance > heap[0][0]:
+                heapq.heappush(heap, (importance, v))
+                continue
+                
+            contracted[v] = 1
+            up[v] = list(outgoing[v].items())
+            down[v] = list(incoming[v].items())
+            
+            for u in incoming[v]:
+                del outgoing[u][v]
+                contracted_neighbours[u] += 1
+            for w in outgoing[v]:
+                del incoming[w][v]
+                contracted_neighbours[w] += 1
+            outgoing[v] = incoming[v] = None
+            
+            for u, w, length in shortcuts:
+                if w not in outgoing[u] or length < outgoing[u][w][0]:
+                    outgoing[u][w] = incoming[w][u] = (length, v)
+                    
+        integer = all(type(length) is int for edges in up + down for _, (length, _) in edges)
+        
+        self.__vertices = V
+        self.__index = index
+        self.__up = ContractionHierarchy.__csrArrays(up, integer)
+        self.__down = ContractionHierarchy.__csrArrays(down, integer)
+        
+        
+    @staticmethod
+    def __importance(outgoing, incoming, contracted_neighbours, v, witness_limit):
+        '''
+        Returns the importance of the node v in the remaining graph, and the shortcuts 
+        [(u, w, length), ...] needed when it is contracted.
+        '''
+        
+        shortcuts = []
+        out_v = outgoing[v]
+        
+        for u, (length_uv, _) in incoming[v].items():
+            targets = {w: length_uv + length_vw for w, (length_vw, _) in out_v.items() if w != u}
+            if not targets:
+                continue
+                
+            # Witness search from u, avoiding v, up to the longest path through v
+            max_distance = max(targets.values())
+            distance = {u: 0}
+            heap = [(0, u)]
+            settled = 0
+            while heap and settled < witness_limit:
+                d_x, x = heapq.heappop(heap)
+                if d_x > distance[x]:
+                    continue
+                if d_x > max_distance:
+                    break
+                settled += 1
+                for y, (length, _) in outgoing[x].items():
+                    if y != v and d_x + length < distance.get(y, max_distance + 1):
+                        distance[y] = d_x + length
+                        heapq.heappush(heap, (d_x + length, y))
+                        
+            for w, length in targets.items():
+                if distance.get(w, length + 1) > length:
+                    shortcuts.append((u, w, length))
+                    
+        importance = len(shortcuts) - len(incoming[v]) - len(out_v) + contracted_neighbours[v]
+        
+        return importance, shortcuts
+        
+        
+    @staticmethod
+    def __csrArrays(edges, integer):
+        '''
+        Returns the (offsets, targets, weights, middle) CSR arrays of the per node edges.
+        '''
+        
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('q' if integer else 'd')
+        middle = array('q')
+        for node_edges in edges:
+            for t, (length, m) in node_edges:
+                targets.append(t)
+                weights.append(length)
+                middle.append(m)
+            offsets.append(len(targets))
+            
+        return offsets, targets, weights, middle
+        
+        
+    def getVertices(self):
+        '''
+        Returns the vertices of the graph (V from the G = (V, E))
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            vertices (list): The vertices of the graph.
+        '''
+        
+        return self.__vertices
+        
+        
+    def getShortcutCount(self):
+        '''
+        Returns the number of shortcut edges added by the preprocessing.
+
+        Args:
+            -
+
+        Raises:
+            -
+
+        Returns:
+            shortcuts (int): The number of shortcut edges.
+        '''
+        
+        return sum(1 for m in self.__up[3] if m >= 0) + sum(1 for m in self.__down[3] if m >= 0)
+        
+        
+    def query(self, s, t):
+        '''
+        Returns the shortest path from node 's' to node 't' and its cost. The cost is 
+        the same as the distance found by the Dijkstra's algorithm, the path may differ
+        on paths with equal cost.
+
+        Args:
+            s (string): Starting node.
+            t (string): Terminating node.
+
+        Raises:
+            -
+
+        Returns:
+            path (list): The nodes of the shortest path [s, ..., t], an empty list if 
+                         't' is not reachable from 's'.
+            cost (float): The cost of the shortest path, infinite if 't' is not 
+                          reachable from 's'.
+        '''
+        
+        i = self.__index[s]
+        j = self.__index[t]
+        if i == j:
+            return [s], 0
+            
+        # Forward search on the upward graph, backward search on the downward graph.
+        # The previous structures keep the edge to each node. Each search is stalled
+        # at the nodes reached with a longer distance than through a more important
+        # node (stall-on-demand), checked on the edges of the other graph.
+        searches = ((self.__up, self.__down, {i: 0}, {i: -1}, [(0, i)]), 
+            (self.__down, self.__up, {j: 0}, {j: -1}, [(0, j)]))
+        infinity = float('inf')
+        best = infinity
+        meeting = None
+        
+        while True:
+            # Expand the search with the smallest key, stop when both smallest keys
+            # are not less than the best path found
+            key_forward = searches[0][4][0][0] if searches[0][4] else infinity
+            key_backward = searches[1][4][0][0] if searches[1][4] else infinity
+            k = 0 if key_forward <= key_backward else 1
+            if min(key_forward, key_backward) >= best:
+                break
+            (offsets, targets, weights, _), (stall_offsets, stall_targets, stall_weights, _), \
+                distance, previous, heap = searches[k]
+            other_distance = searches[1 - k][2]
+            
+            d_u, u = heapq.heappop(heap)
+            if d_u > distance[u]:
+                continue
+                
+            if u in other_distance and d_u + other_distance[u] < best:
+                best = d_u + other_distance[u]
+                meeting = u
+                
+            stalled = False
+            for e in range(stall_offsets[u], stall_offsets[u + 1]):
+                if distance.get(stall_targets[e], infinity) + stall_weights[e] < d_u:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+                
+            for e in range(offsets[u], offsets[u + 1]):
+                v = targets[e]
+                d_v = d_u + weights[e]
+                if d_v < distance.get(v, best):
+                    distance[v] = d_v
+                    previous[v] = e
+                    heapq.heappush(heap, (d_v, v))
+                    
+        if meeting is None:
+            return [], float('inf')
+            
+        # The edges of the path, from s to the meeting node and from there to t
+        path = [i]
+        forward = []
+        u = meeting
+        while searches[0][3][u] >= 0:
+            e = searches[0][3][u]
+            u = self.__source(self.__up, e)
+            forward.append((u, e))
+        for u, e in reversed(forward):
+            path[-1:] = self.__unpack(u, self.__up[1][e], self.__up[3][e])
+            
+        u = meeting
+        while searches[1][3][u] >= 0:
+            e = searches[1][3][u]
+            v = self.__source(self.__down, e)
+            path[-1:] = self.__unpack(u, v, self.__down[3][e])
+            u = v
+            
+        vertices = self.__vertices
+        return [vertices[v] for v in path], best
+        
+        
+    @staticmethod
+    def __source(graph, e):
+        '''
+        Returns the node of the CSR graph whose edges contain the edge e.
+        '''
+        
+        offsets = graph[0]
+        low, high = 0, len(offsets) - 1
+        while high - low > 1:
+            middle = (low + high) // 2
+            if offsets[middle] <= e:
+                low = middle
+            else:
+                high = middle
+                
+        return low
+        
+        
+    def __unpack(self, u, v, m):
+        '''
+        Returns the path [u, ..., v] of the edge (u, v) with middle node m, where the 
+        shortcuts are replaced by the original edges.
+        '''
+        
+        path = [u]
+        stack = [(u, v, m)]
+        while stack:
+            u, v, m = stack.pop()
+            if m < 0:
+                path.append(v)
+                continue
+                
+            # The middle node is less important than u and v: the edge (u, m) is in 
+            # the downward graph of m, the edge (m, v) is in the upward graph of m
+            stack.append((m, v, self.__middle(self.__up, m, v)))
+            stack.append((u, m, self.__middle(self.__down, m, u)))
+            
+        return path
+        
+        
+    @staticmethod
+    def __middle(graph, u, v):
+        '''
+        Returns the middle node of the edge from u to v of the CSR graph.
+        '''
+        
+        offsets, targets, _, middle = graph
+        for e in range(offsets[u], offsets[u + 1]):
+            if targets[e] == v:
+                return middle[e]
+                
+        
+    def save(self, path):
+        '''
+        Saves the index in the binary contraction hierarchy file format: A header, the
+        vertex labels table (JSON) and the upward and downward graphs arrays (offsets, 
+        targets, weights, middle), each one aligned to 8 bytes. The header is (magic,
+        version, byte order, weights typecode, |V|, upward edges, downward edges, 
+        labels table size), see _CH_FILE_HEADER.
+
+        Args:
+            path (string): The binary contraction hierarchy file.
+
+        Raises:
+            'Not supported vertex label.' : See CSRGraph.save.
+
+        Returns:
+            -
+        '''
+        
+        labels = _encodeLabels(self.__vertices)
+        typecode = _typecode(self.__up[2])
+        
+        with open(path, 'wb') as f:
+            f.write(struct.pack(_CH_FILE_HEADER, _CH_FILE_MAGIC, _CH_FILE_VERSION,
+                sys.byteorder[0].encode('ascii'), typecode.encode('ascii'), len(self.__vertices),
+                len(self.__up[1]), len(self.__down[1]), len(labels)))
+            f.write(labels)
+            for offsets, targets, weights, middle in (self.__up, self.__down):
+                _writeArrays(f, ((offsets, 'q'), (targets, 'q'), (weights, typecode), (middle, 'q')))
+                
+                
+    @classmethod
+    def open(cls, path, mmap = True):
+        '''
+        Opens an index from a binary contraction hierarchy file, see save. With mmap, 
+        the arrays are memory-mapped read-only views of the file, see CSRGraph.open.
+
+        Args:
+            path (string): The binary contraction hierarchy file.
+            mmap (boolean, default = True): If False, the arrays are read in memory.
+
+        Raises:
+            'Not a binary contraction hierarchy file.' : The file header is not valid.
+            'Not supported binary contraction hierarchy file version.' : The file is of
+                                                                         a newer version.
+
+        Returns:
+            contraction_hierarchy (ContractionHierarchy): The index.
+        '''
+        
+        header_size = struct.calcsize(_CH_FILE_HEADER)
+        
+        with open(path, 'rb') as f:
+            header = f.read(header_size)
+            if len(header) != header_size or not header.startswith(_CH_FILE_MAGIC):
+                raise ValueError('Not a binary contraction hierarchy file (' + str(path) + ').')
+            magic, version, byteorder, typecode, n, m_up, m_down, labels_size = \
+                struct.unpack(_CH_FILE_HEADER, header)
+            if version > _CH_FILE_VERSION:
+                raise ValueError('Not supported binary contraction hierarchy file version (' + 
+                    str(version) + ').')
+            vertices = json.loads(f.read(labels_size).decode('utf-8'))
+            typecode = typecode.decode('ascii')
+            native = byteorder.decode('ascii') == sys.byteorder[0]
+            if len(vertices) != n:
+                raise ValueError('Not a binary contraction hierarchy file (' + str(path) + ').')
+                
+            specs = []
+            for m in (m_up, m_down):
+                specs.extend(((n + 1, 'q'), (m, 'q'), (m, typecode), (m, 'q')))
+            arrays = _readArrays(f, path, header_size + labels_size, specs, native, mmap)
+            
+        index = cls.__new__(cls)
+        index.__vertices = vertices
+        index.__index = {v: i for i, v in enumerate(vertices)}
+        index.__up = tuple(arrays[:4])
+        index.__down = tuple(arrays[4:])
+        
+        return index
+        
+        
+class _SharedPath(Sequence):
+    '''
+    Read-only [s, ..., node] sequence of a path, stored as the last node and the path
+    of its previous node, so the paths of a shortest paths tree share their prefixes.
+    See GraphAlgorithms.allPaths.
+    '''
+    
+    __slots__ = ('__node', '__parent', '__length')
+    
+    def __init__(self, node, parent):
+    
+        self.__node = node
+        self.__parent = parent
+        self.__length = 1 if parent is None else len(parent) + 1
+        
+        
+    def __len__(self):
+    
+        return self.__length
+        
+        
+    def __reversed__(self):
+    
+        path = self
+        while path is not None:
+            yield path.__node
+            path = path.__parent
+            
+            
+    def __iter__(self):
+    
+        nodes = list(reversed(self))
+        nodes.reverse()
+        
+        return iter(nodes)
+        
+        
+    def __getitem__(self, i):
+    
+        if isinstance(i, slice):
+            return list(self)[i]
+            
+        if i < 0:
+            i += self.__length
+        if not 0 <= i < self.__length:
+            raise IndexError('Path index out of range (' + str(i) + ').')
+            
+        path = self
+        for _ in range(self.__length - 1 - i):
+            path = path.__parent
+            
+        return path.__node
+        
+        
+    def __eq__(self, other):
+    
+        if not isinstance(other, (list, tuple, _SharedPath)):
+            return NotImplemented
+            
+        return len(self) == len(other) and list(self) == list(other)
+        
+        
+    __hash__ = None
+    
+    
+    def __repr__(self):
+    
+        return repr(list(self))
+        
+        
+class GraphAlgorithms(object):
+    '''
+    Graph algorithms implementation. See methods for the implemented algorithms.
+
+    Args:
+        cache (ShortestPathCache, default = None): Caches the results of the dijkstra, bfs
+                                                   and bellmanFord methods. No caching if None.
+
+    Attributes:
+        __cache (ShortestPathCache): The results cache.
+        
+    Methods:
+        dijkstra(self, G, l, s) : Implementation of the Dijkstra's algorithm.
+        bfs(self, G, s): Implementation of the Breadth-first search algorithm.
+        dfs(self, G): Implementation of the Depth-first search algorithm.
+        scc(self, G): Strongly connected components (Kosaraju's algorithm).
+        topologicalSort(self, G): Topological order of a directed acyclic graph.
+        dagShortestPaths(self, G, l, s): Shortest (or longest) paths in a directed acyclic graph.
+        iterDijkstra(self, G, l, s), iterBfs(self, G, s), iterDfs(self, G): Generator
+            versions of the traversals, yielding the nodes while they are visited.
+        bellmanFord(self, G, l, s): Implementation of the Bellman-Ford algorithm.
+        shortestPath(self, G, l, s, t): Point-to-point shortest path query.
+        repairShortestPaths(self, G, l, s, previous, distance, changes): Incremental
+            update of the single source shortest paths, after edge changes.
+        reconstructPath(self, previous, s, t): The path from 's' to 't' of a result.
+        allPaths(self, previous, s): The paths from 's' to all the nodes of a result.
+        compactPrevious(self, G, previous): The previous structure as an index array.
+        astar(self, G, l, s, t, h): Implementation of the A* search algorithm.
+        batchShortestPaths(self, G, l, sources): Parallel multi-source / all pairs shortest paths.
+        floydWarshall(self, G, l): Implementation of the Floyd-Warshall algorithm.
+    '''
+
+    def __init__(self, cache = None):
+  
+        self.__cache = cache
+        
+        
+    def __cached(self, G, l, algorithm, s, params, compute):
+    
+        if self.__cache is None:
+            return compute()
+            
+        return self.__cache.get(G, l, algorithm, s, params, compute)
+        
+        
+    def dijkstra(self, G, l, s, queue = 'indexed', arity = 2, engine = 'heap', delta = None):
+        '''
+        Dijkstra's algorithm for finding the shortest paths in a graph.
+        Returns the shortest paths from node 's' to any other node together with the
+        related path cost.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E).
+            s (string): Starting node.
+            queue (string, default = 'indexed'): The priority queue strategy:
+                'indexed': IndexedPriorityQueue with decrease-key.
+                'lazy'   : heapq list, where outdated items are skipped when popped
+                           (lazy deletion). No decrease-key is needed.
+            arity (int, default = 2): The arity of the indexed heap (2, 4 or 8).
+            engine (string, default = 'heap'): The priority queue engine:
+                'heap'   : The queue strategy above, for any edge lengths.
+                'radix'  : Monotone radix heap, for integer edge lengths. The nodes are
+                           kept in buckets by the highest differing bit of their key 
+                           from the last popped key.
+                'buckets': Dial's bucket queue, for integer edge lengths. A circular 
+                           array of max length + 1 buckets, one per distance.
+                'delta'  : Delta-stepping, for integer edge lengths. Buckets of width 
+                           delta, where the light edges (length <= delta) of a bucket
+                           are relaxed in vectorized batches until it is settled, then
+                           its heavy edges once. Needs NumPy.
+            delta (int, default = None): The bucket width of the 'delta' engine. The 
+                                         mean edge length if None.
+
+            Note: All the strategies and engines return identical previous and distance
+                  structures. On paths with equal cost, the previous node is the one 
+                  with the smallest (distance, node).
+
+        Raises:
+            'Non positive edge length found.' : Edge lengths in the Dijkstra's 
+                                                algorithm should be positives numbers.
+            'Not integer edge length found.' : The 'radix', 'buckets' and 'delta' 
+                                               engines need integer edge lengths.
+            'Not supported queue strategy.' : See the queue argument.
+            'Not supported engine.' : See the engine argument.
+
+        Returns:
+            previous (dictionary): The previous data structure of the algorithm.
+            distance (dictionary): The distance data structure of the algorithm.
+            
+            Backtracking the previous structure we can get the shortest path from
+            the starting node to any other node. Path cost is the distance[terminating_node].
+        '''
+    
+        if queue not in ('indexed', 'lazy'):
+            raise ValueError('Not supported queue strategy (' + str(queue) + ').')
+            
+        if engine not in ('heap', 'radix', 'buckets', 'delta'):
+            raise ValueError('Not supported engine (' + str(engine) + ').')
+            
+        V, E = _unpackGraph(G)
+        
+        if engine == 'heap':
+            if isinstance(G, CSRGraph) and l is G.getLengths():
+                return self.__cached(G, l, 'dijkstra', s, (queue, arity), 
+                    lambda: _csrDijkstra(G, s, queue, arity))
+            return self.__cached(G, l, 'dijkstra', s, (queue, arity), 
+                lambda: _dijkstra(V, E, l, s, queue, arity))
+                
+        if engine == 'delta':
+            _checkBackend('numpy')
+            return self.__cached(G, l, 'dijkstra', s, (engine, delta), 
+                lambda: self.__deltaStepping(G, V, E, l, s, delta))
+                
+        return self.__cached(G, l, 'dijkstra', s, (engine,), 
+            lambda: _integerDijkstra(V, E, l, s, engine))
+            
+            
+    def iterDijkstra(self, G, l, s, max_distance = None, limit = None):
+        '''
+        Generator version of the Dijkstra's algorithm. Yields the nodes in increasing
+        distance from node 's', when their distance is final, so the search can be
+        stopped at any point. Only the reached nodes are stored, the memory is
+        proportional to the explored part of the graph and not to |V|.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E).
+            s (string): Starting node.
+            max_distance (number, default = None): Only the nodes up to this distance 
+                                                   are yielded. No limit if None.
+            limit (int, default = None): The maximum number of yielded nodes. No limit 
+                                         if None.
+
+        Raises:
+            'Non positive edge length found.' : Edge lengths in the Dijkstra's 
+                                                algorithm should be positives numbers.
+
+        Returns:
+            nodes (generator): Yields (node, distance, previous node) tuples. The previous
+                               node of 's' is None.
+        '''
+        
+        V, E = _unpackGraph(G)
+        
+        # Tentative (distance, previous node) of the reached not settled nodes
+        tentative = {s: (0, None)}
+        settled = set()
+        heap = [(0, s)]
+        count = 0
+        
+        while heap and (limit is None or count < limit):
+            d_u, u = heapq.heappop(heap)
+            
+            # Skip outdated items
+            if u in settled or d_u > tentative[u][0]:
+                continue
+                
+            if max_distance is not None and d_u > max_distance:
+                return
+                
+            settled.add(u)
+            yield u, d_u, tentative.pop(u)[1]
+            count += 1
+            
+            l_u = l[u]
+            for v in E[u]:
+            
+                # Algorithm supports only positive lengths
+                if l_u[v] <= 0:
+                    raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                    
+                if v not in settled:
+                    d_v = d_u + l_u[v]
+                    if v not in tentative or d_v < tentative[v][0]:
+                        tentative[v] = (d_v, u)
+                        heapq.heappush(heap, (d_v, v))
+         
+        
+    def __deltaStepping(self, G, V, E, l, s, delta):
+        '''
+        Dijkstra's algorithm, delta-stepping engine. See dijkstra method.
+        '''
+        
+        n = len(V)
+        sources, targets, weights = _edgeArrays(G, V, E, l)
+        
+        if len(weights):
+            if weights.dtype.kind != 'i':
+                fractional = weights[weights != np.floor(weights)]
+                raise ValueError('Not integer edge length (' + 
+                    str(fractional[0] if len(fractional) else weights[0]) + ') found.')
+            if weights.min() <= 0:
+                raise ValueError('Non positive edge length (' + str(weights.min()) + ') found.')
+        if delta is None:
+            delta = max(1, int(weights.mean())) if len(weights) else 1
+            
+        # The edges are grouped by source (CSR), the light and heavy ones separately
+        offsets = np.zeros(n + 1, dtype = np.int64)
+        np.cumsum(np.bincount(sources, minlength = n), out = offsets[1:])
+        light = weights <= delta
+        
+        def edgesOf(nodes, kind):
+            # The edges of the nodes (gathered from their CSR ranges) of the given kind
+            counts = offsets[nodes + 1] - offsets[nodes]
+            total = counts.sum()
+            edges = np.repeat(offsets[nodes] - np.cumsum(counts) + counts, counts) + np.arange(total)
+            return edges[light[edges] == kind]
+            
+        def relax(edges):
+            # Vectorized relaxation of a batch of edges, returns the improved nodes
+            heads = targets[edges]
+            candidates = distance[sources[edges]] + weights[edges]
+            before = distance[heads]
+            np.minimum.at(distance, heads, candidates)
+            return np.unique(heads[distance[heads] < before])
+            
+        def insert(nodes):
+            # Adds the nodes to the buckets of their distances
+            keys = distance[nodes] // delta
+            order = np.argsort(keys, kind = 'stable')
+            nodes = nodes[order]
+            keys = keys[order]
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else []
+            for start, end in zip(starts, list(starts[1:]) + [len(keys)]):
+                key = int(keys[start])
+                if key not in buckets:
+                    buckets[key] = []
+                    heapq.heappush(bucket_keys, key)
+                buckets[key].append(nodes[start:end])
+                
+        index = {v: i for i, v in enumerate(V)}
+        unreached = np.iinfo(np.int64).max
+        distance = np.full(n, unreached, dtype = np.int64)
+        distance[index[s]] = 0
+        settled = np.zeros(n, dtype = bool)
+        
+        # The nodes added to each bucket {bucket: [nodes array, ...]}, and the heap of
+        # the not empty buckets. A node whose distance decreased to a lower bucket, or 
+        # which is settled, is skipped when its older bucket is reached.
+        buckets = {0: [np.array([index[s]])]}
+        bucket_keys = [0]
+        
+        while bucket_keys:
+            bucket = heapq.heappop(bucket_keys)
+            members = np.unique(np.concatenate(buckets.pop(bucket)))
+            frontier = members[~settled[members] & (distance[members] // delta == bucket)]
+            
+            # Relax the light edges until the bucket does not change
+            removed = []
+            while len(frontier):
+                removed.append(frontier)
+                settled[frontier] = True
+                improved = relax(edgesOf(frontier, True))
+                current = distance[improved] // delta == bucket
+                frontier = improved[current]
+                insert(improved[~current])
+                
+            if removed:
+                removed = np.unique(np.concatenate(removed))
+                insert(relax(edgesOf(removed, False)))
+            
+        # The previous node of each node is the one with the smallest (distance, node)
+        # among the sources of its tight edges, as in the heap engine
+        previous = {key: None for key in V}
+        reached = distance < unreached
+        tight = reached[sources] & (distance[sources] + weights == distance[targets])
+        tight_sources = sources[tight]
+        tight_targets = targets[tight]
+        try:
+            rank = np.empty(n, dtype = np.int64)
+            rank[sorted(range(n), key = V.__getitem__)] = np.arange(n)
+        except TypeError:
+            rank = np.arange(n)
+        order = np.lexsort((rank[tight_sources], distance[tight_sources], tight_targets))
+        tight_sources = tight_sources[order]
+        tight_targets = tight_targets[order]
+        first = np.r_[True, tight_targets[1:] != tight_targets[:-1]] if len(order) else \
+            np.zeros(0, dtype = bool)
+        for v, u in zip(tight_targets[first].tolist(), tight_sources[first].tolist()):
+            previous[V[v]] = V[u]
+            
+        distance = {v: (d if d != unreached else float('inf')) for v, d in zip(V, distance.tolist())}
+        
+        return previous, distance
+        
+        
+    def bfs(self, G, s, mode = 'queue'):
+        '''
+        BFS algorithm for finding the shortest paths in a graph.
+        Returns the shortest paths from node 's' to any other node together with the
+        related path cost.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            s (string): Starting node.
+            mode (string, default = 'queue'): The traversal strategy:
+                'queue' : FIFO queue of nodes.
+                'level' : Level-synchronous, the nodes are expanded frontier by frontier.
+                'hybrid': Level-synchronous and direction-optimizing. When the frontier
+                          is large, the next frontier is found bottom-up, by checking 
+                          the in-edges of the not visited nodes, instead of the out-edges
+                          of the frontier. Suits large graphs with low diameter.
+            
+            Note: The edges of the graph considered as having unit length.
+                  All the modes return identical previous and distance structures.
+
+        Raises:
+            'Not supported mode.' : See the mode argument.
+
+        Returns:
+            previous (dictionary): The previous data structure of the algorithm.
+            distance (dictionary): The distance data structure of the algorithm.
+            
+            Backtracking the previous structure we can get the shortest path from
+            the starting node to any other node. Path cost is the distance[terminating_node].
+        '''
+        
+        if mode not in ('queue', 'level', 'hybrid'):
+            raise ValueError('Not supported mode (' + str(mode) + ').')
+            
+        return self.__cached(G, None, 'bfs', s, (mode,), lambda: self.__bfs(G, s, mode))
+        
+        
+    def __bfs(self, G, s, mode):
+        '''
+        BFS algorithm, see bfs method. The loops run on the indices of the nodes in V,
+        the labels are translated only for the result.
+        '''
+            
+        # Initializations
+        V, E = _unpackGraph(G)
+        index = G.getIndex() if isinstance(G, CSRGraph) else {v: i for i, v in enumerate(V)}
+        neighbors = _neighbors(G, V, E, index)
+        source = index[s]
+        
+        # Visited bitmap and distances, indexed by the position of the nodes in V. The
+        # not visited nodes keep infinite distance.
+        visited = bytearray(len(V))
+        depth = [float('inf')] * len(V)
+        visited[source] = 1
+        depth[source] = 0
+        
+        # Initialize the previous structure. This is for bactracking the shortest path.
+        # Is not included in the original algorithm. The nodes are in the order they
+        # are visited.
+        previous = {}
+        
+        if mode == 'queue':
+            # FIFO queue contains nodes
+            Q = deque([source])
+            
+            while Q:
+                u = Q.popleft()
+                d_v = depth[u] + 1
+
+                # For all connected nodes v to the node u
+                for v in neighbors(u):
+                    
+                    if not visited[v]:
+                        Q.append(v)
+                        visited[v] = 1
+                        depth[v] = d_v
+                        previous[v] = u
+                        
+        else:
+            self.__levelBfs(G, V, E, index, neighbors, source, visited, depth, previous, 
+                mode == 'hybrid')
+        
+        distance = dict(zip(V, depth))
+         
+        return {V[v]: V[u] for v, u in previous.items()}, distance
+        
+        
+    def iterBfs(self, G, s, max_depth = None, limit = None):
+        '''
+        Generator version of the BFS algorithm. Yields the nodes in increasing depth
+        from node 's', in the same order as the 'queue' mode of the bfs method visits
+        them. Only the visited nodes and the queue are stored, the memory is 
+        proportional to the explored part of the graph and not to |V|.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            s (string): Starting node.
+            max_depth (int, default = None): Only the nodes up to this depth are yielded.
+                                             No limit if None.
+            limit (int, default = None): The maximum number of yielded nodes. No limit 
+                                         if None.
+
+        Raises:
+            -
+
+        Returns:
+            nodes (generator): Yields (node, depth, previous node) tuples. The previous
+                               node of 's' is None.
+        '''
+        
+        V, E = _unpackGraph(G)
+        
+        if limit is not None and limit <= 0:
+            return
+            
+        yield s, 0, None
+        count = 1
+        
+        visited = {s}
+        Q = deque([(s, 0)])
+        
+        while Q:
+            u, d_u = Q.popleft()
+            if max_depth is not None and d_u >= max_depth:
+                continue
+            d_v = d_u + 1
+            
+            for v in E[u]:
+                if v not in visited:
+                    if limit is not None and count >= limit:
+                        return
+                    visited.add(v)
+                    Q.append((v, d_v))
+                    yield v, d_v, u
+                    count += 1
+                    
+                    
+    def __levelBfs(self, G, V, E, index, neighbors, source, visited, depth, previous, 
+        direction_optimizing):
+        '''
+        Level-synchronous BFS on the indices of the nodes, see bfs method. Updates the 
+        visited, depth and previous structures.
+        
+        A bottom-up step finds the not visited nodes with an in-neighbor in the frontier,
+        and then expands the frontier top-down, in order, while this is cheaper than
+        checking all the in-edges of the rest of these nodes. The rest get as previous
+        their in-neighbor with the lowest position in the frontier, and are ordered by
+        the position of the previous and then by the order of its out-edges. So the 
+        previous structure and the frontiers are identical to the top-down steps.
+        '''
+        
+        # Direction switching thresholds, see Beamer et al. Direction-Optimizing 
+        # Breadth-First Search
+        alpha = 14
+        beta = 24
+        
+        if direction_optimizing:
+            # In-edges of each node (the reversed graph is cached for Graph and CSRGraph
+            # objects)
+            in_neighbors = _inNeighbors(G, V, index)
+            degree = _degrees(G, V, E)
+            unexplored_edges = sum(degree) - degree[source]
+            unvisited = range(len(V))
+            average_degree = sum(degree) / max(len(V), 1)
+            # Position of each node in the frontier of its level
+            rank = [0] * len(V)
+            
+        frontier = [source]
+        bottom_up = False
+        level = 0
+        
+        while frontier:
+            level += 1
+            
+            if direction_optimizing:
+                frontier_edges = sum(degree[u] for u in frontier)
+                if not bottom_up and frontier_edges > unexplored_edges / alpha:
+                    bottom_up = True
+                elif bottom_up and len(frontier) < len(V) / beta:
+                    bottom_up = False
+                    
+            next_frontier = []
+            
+            if bottom_up:
+                # The not visited nodes with an in-neighbor in the frontier, the search
+                # of the in-edges stops at the first one
+                unvisited = [v for v in unvisited if not visited[v]]
+                found = []
+                for v in unvisited:
+                    for u in in_neighbors(v):
+                        if depth[u] == level - 1:
+                            found.append(v)
+                            break
+                            
+                # The frontier is expanded top-down, in order, while its remaining 
+                # out-edges are more than the in-edges of the remaining found nodes 
+                # (checked at about twice the cost of an out-edge). So these nodes get
+                # the same previous as in the top-down steps.
+                remaining = len(found)
+                for position, u in enumerate(frontier):
+                    if 2 * remaining * average_degree < frontier_edges:
+                        break
+                    frontier_edges -= degree[u]
+                    for v in neighbors(u):
+                        if not visited[v]:
+                            visited[v] = 1
+                            depth[v] = level
+                            previous[v] = u
+                            next_frontier.append(v)
+                            remaining -= 1
+                else:
+                    position = len(frontier)
+                    
+                # The previous of the rest is their in-neighbor with the lowest position
+                # in the rest of the frontier, they are ordered by the position of the
+                # previous and then by the order of its out-edges
+                if remaining:
+                    for k in range(position, len(frontier)):
+                        rank[frontier[k]] = k
+                    rest = []
+                    for v in found:
+                        if visited[v]:
+                            continue
+                        first = len(frontier)
+                        for u in in_neighbors(v):
+                            if depth[u] == level - 1 and position <= rank[u] < first:
+                                first = rank[u]
+                        rest.append((first, list(neighbors(frontier[first])).index(v), v))
+                    rest.sort()
+                    for first, _, v in rest:
+                        visited[v] = 1
+                        depth[v] = level
+                        previous[v] = frontier[first]
+                        next_frontier.append(v)
+            else:
+                for u in frontier:
+                    for v in neighbors(u):
+                        if not visited[v]:
+                            visited[v] = 1
+                            depth[v] = level
+                            previous[v] = u
+                            next_frontier.append(v)
+                            
+            frontier = next_frontier
+                
+            if direction_optimizing:
+                unexplored_edges -= sum(degree[v] for v in frontier)
+        
+        
+    def dfs(self, G, order = None):
+        '''
+        DFS algorithm for revealing a wealth of information about a graph. 
+        Returns information about the feasible paths among all the nodes in 
+        the graph.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            order (list, default = None): The order in which the nodes are explored by 
+                                          the outer loop of the algorithm. V if None.
+
+        Returns:
+            pre (dictionary): The time of the first discovery to each node.
+            post (dictionary): The time of the last departure from each node.
+            ccnum (dictionary): The connected component id of each node.
+        '''
+
+        if isinstance(G, CSRGraph):
+            return _csrDfs(G, order)
+            
+        # Initializations
+        V, E = _unpackGraph(G)
+        
+        # Time of first visit to a node
+        pre = {}
+        # Time of final departure from a node
+        post = {}
+        # Time
+        clock = 1
+        
+        # Connected components identification
+        ccnum = {}
+        cc = 0
+
+        # A node is visited when it has a pre time. The explore procedure (see DPV, 
+        # Algorithms, Chapter 3.2) runs on an explicit stack of (node, iterator over
+        # its remaining edges) items, so the depth is not bounded by the recursion limit.
+        for v in (V if order is None else order):
+            if v in pre:
+                continue
+                
+            cc += 1
+            
+            # previsit(v)
+            pre[v] = clock
+            clock += 1
+            ccnum[v] = cc
+            stack = [(v, iter(E[v]))]
+            
+            while stack:
+                u, edges = stack[-1]
+                
+                for w in edges:
+                    if w not in pre:
+                        # previsit(w), continue with the edges of w
+                        pre[w] = clock
+                        clock += 1
+                        ccnum[w] = cc
+                        stack.append((w, iter(E[w])))
+                        break
+                else:
+                    # postvisit(u), all the edges of u are explored
+                    stack.pop()
+                    post[u] = clock
+                    clock += 1
+                
+        return pre, post, ccnum
+        
+        
+    def iterDfs(self, G, s = None, max_depth = None, limit = None):
+        '''
+        Generator version of the DFS algorithm. Yields the previsit and postvisit 
+        events of the nodes, in the same order as the dfs method visits them, so the
+        pre and post times are the positions of the events. Only the visited nodes and
+        the stack are stored.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            s (string, default = None): Starting node. All the nodes are explored (in 
+                                        the order of V) if None.
+            max_depth (int, default = None): The edges of the nodes at this depth are 
+                                             not explored. No limit if None.
+            limit (int, default = None): The maximum number of visited nodes. When it is
+                                         reached no more nodes are visited, and the 
+                                         postvisit events of the visited ones are yielded.
+
+        Raises:
+            -
+
+        Returns:
+            events (generator): Yields ('pre' or 'post', node, depth) tuples. The depth
+                                of the starting nodes is 0.
+        '''
+        
+        if isinstance(G, CSRGraph):
+            yield from _csrIterDfs(G, s, max_depth, limit)
+            return
+            
+        V, E = _unpackGraph(G)
+        
+        visited = set()
+        
+        for v in (V if s is None else [s]):
+            if v in visited:
+                continue
+            if limit is not None and len(visited) >= limit:
+                return
+                
+            visited.add(v)
+            yield 'pre', v, 0
+            stack = [(v, iter(E[v]) if max_depth != 0 else iter(()))]
+            
+            while stack:
+                u, edges = stack[-1]
+                
+                for w in edges:
+                    if w not in visited:
+                        if limit is not None and len(visited) >= limit:
+                            continue
+                        visited.add(w)
+                        depth = len(stack)
+                        yield 'pre', w, depth
+                        stack.append((w, iter(E[w]) if max_depth is None or depth < max_depth 
+                            else iter(())))
+                        break
+                else:
+                    stack.pop()
+                    yield 'post', u, len(stack)
+        
+        
+    def scc(self, G):
+        '''
+        Kosaraju's algorithm for finding the strongly connected components of a 
+        directed graph. A DFS on the reversed graph, exploring the nodes in decreasing
+        post time of a DFS on the graph, finds one strongly connected component per 
+        outer loop iteration (see DPV, Algorithms, Chapter 3.4). The time complexity of
+        the algorithm is O(|V|+|E|).
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+
+        Raises:
+            -
+
+        Returns:
+            scc (dictionary): The strongly connected component id (1, 2, ...) of each 
+                              node. The ids are in topological order of the components
+                              graph: an edge between components goes from a smaller to
+                              a larger id.
+        '''
+        
+        if isinstance(G, (Graph, CSRGraph)):
+            R = G.reverse()
+        else:
+            R = (G[0], _reverseGraph(G, None)[0])
+        
+        _, post, _ = self.dfs(G)
+        
+        # The components are found in topological order, from a source component
+        _, _, scc = self.dfs(R, self.__decreasingPost(post))
+        
+        return scc
+        
+        
+    def topologicalSort(self, G):
+        '''
+        Topological sort of a directed acyclic graph (DAG), the nodes in decreasing post
+        time of a DFS. The graph is acyclic if there is no back edge (u, v), an edge 
+        where post[u] < post[v]. The time complexity of the algorithm is O(|V|+|E|).
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+
+        Raises:
+            'Cycle found.' : The graph is not acyclic, the back edge is given.
+
+        Returns:
+            order (list): The nodes in topological order, every edge (u, v) goes from
+                          an earlier to a later node.
+        '''
+        
+        order, back_edge = self.__topologicalOrder(G)
+        if back_edge is not None:
+            raise ValueError('Cycle found (' + str(back_edge) + ').')
+            
+        return order
+        
+        
+    def __topologicalOrder(self, G, sources = None):
+        '''
+        Returns the nodes reachable from the sources (all the nodes if None) in decreasing
+        post time, and a back edge (u, v) if there is a cycle, otherwise None.
+        '''
+        
+        V, E = _unpackGraph(G)
+        
+        _, post, _ = self.dfs(G, sources)
+        
+        if isinstance(G, CSRGraph):
+            # The back edges are checked on the arrays, with the post times by index
+            offsets = G.getOffsets()
+            targets = G.getTargets()
+            index = G.getIndex()
+            times = [0] * len(V)
+            for v, t in post.items():
+                times[index[v]] = t
+            for u in post:
+                i = index[u]
+                post_u = times[i]
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    if post_u <= times[j]:
+                        return None, (u, V[j])
+                        
+            return self.__decreasingPost(post), None
+            
+        for u in post:
+            post_u = post[u]
+            for v in E[u]:
+                if post_u <= post[v]:
+                    return None, (u, v)
+                    
+        return self.__decreasingPost(post), None
+        
+        
+    def __decreasingPost(self, post):
+        '''
+        Returns the nodes in decreasing post time, in O(|V|) (the post times are 
+        distinct integers up to 2|V|).
+        '''
+        
+        empty = object()
+        nodes = [empty] * (2 * len(post) + 1)
+        for v, t in post.items():
+            nodes[t] = v
+            
+        return [v for v in reversed(nodes) if v is not empty]
+        
+        
+    def dagShortestPaths(self, G, l, s, longest = False):
+        '''
+        Shortest paths algorithm for directed acyclic graphs (DAG). The edges are 
+        relaxed once, in topological order, so the edges lengths can be also negative
+        numbers. With longest, the longest paths are found instead (i.e. the critical
+        path of a schedule). The time complexity of the algorithm is O(|V|+|E|).
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E).
+            s (string): Starting node.
+            longest (boolean, default = False): If True, the longest paths are found.
+
+            Note: Only the part of the graph reachable from 's' has to be acyclic.
+
+        Raises:
+            'Cycle found.' : A cycle is reachable from the starting node, the back edge 
+                             is given.
+
+        Returns:
+            previous (dictionary): The previous data structure of the algorithm.
+            distance (dictionary): The distance data structure of the algorithm. The
+                                   distance of the not reachable nodes is infinite 
+                                   (minus infinite for the longest paths).
+            
+            Backtracking the previous structure we can get the shortest path from
+            the starting node to any other node. Path cost is the distance[terminating_node].
+        '''
+        
+        order, back_edge = self.__topologicalOrder(G, [s])
+        if back_edge is not None:
+            raise ValueError('Cycle found (' + str(back_edge) + ').')
+            
+        return self.__dagShortestPaths(G, l, s, order, longest)
+        
+        
+    def __dagShortestPaths(self, G, l, s, order, longest):
+        '''
+        DAG shortest paths algorithm, see dagShortestPaths method. The order is the 
+        topological order of the nodes reachable from s.
+        '''
+        
+        if isinstance(G, CSRGraph) and l is G.getLengths():
+            return _csrDagShortestPaths(G, s, order, longest)
+            
+        V, E = _unpackGraph(G)
+        
+        # Initialize distances as defined in the algorithm
+        infinity = float('-inf') if longest else float('inf')
+        distance = {key: infinity for key in V}
+        distance[s] = 0
+        
+        # Initialize the previous structure as defined in the algorithm
+        previous = {key: None for key in V}
+        
+        for u in order:
+            d_u = distance[u]
+            l_u = l[u]
+            for v in E[u]:
+                d_v = d_u + l_u[v]
+                if (d_v > distance[v]) if longest else (d_v < distance[v]):
+                    distance[v] = d_v
+                    previous[v] = u
+                    
+        return previous, distance
+        
+        
+    def bellmanFord(self, G, l, s, mode = 'passes', backend = 'python', dag = False):
+        '''
+        Bellman-Ford algorithm for finding the shortest paths in a graph.
         Returns the shortest paths from node 's' to any other node together
         with the related path cost.
 
         Args:
-            G (tuple(list,dictionary)): The graph G = (V,E).
-            l (dictionary): The edges lengths of the graph G = (V,E).
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E).
+            s (string): Starting node.
+            mode (string, default = 'passes'): The relaxation strategy:
+                'passes': Up to |V| - 1 passes over all the edges. Stops at the first 
+                          pass where no distance changes.
+                'queue' : Queue based (SPFA). Relaxes only the out-edges of the nodes
+                          whose distance changed. The distances are the same as in the
+                          'passes' mode, the previous structure may differ on paths
+                          with equal cost.
+            backend (string, default = 'python'): The implementation of the passes:
+                'python': Pure python loops over the edges.
+                'numpy' : Each pass is a vectorized scatter-min over the (sources, targets,
+                          lengths) arrays of the edges (mode is ignored). The distances
+                          are the same as in the 'python' backend, the previous structure
+                          may differ on paths with equal cost. Needs NumPy.
+            dag (boolean or None, default = False): Whether the part of the graph 
+                reachable from 's' is acyclic, then the dagShortestPaths algorithm is 
+                used instead (O(|V|+|E|), mode and backend are ignored), the previous
+                structure may differ on paths with equal cost:
+                False: Not checked, the Bellman-Ford algorithm runs.
+                True : Known acyclic, the dagShortestPaths algorithm runs.
+                None : Checked with a DFS (O(|V|+|E|)) before choosing the algorithm.
+
+        Raises:
+            NegativeCycleError: A negative cycle is reachable from the starting node.
+                                The cycle is in the 'cycle' attribute of the exception.
+            'Not supported mode.' : See the mode argument.
+            'Not supported backend.' : See the backend argument.
+            'Cycle found.' : A cycle is reachable from the starting node and dag is True.
+
+        Returns:
+            previous (dictionary): The previous data structure of the algorithm.
+            distance (dictionary): The distance data structure of the algorithm.
+            
+            Backtracking the previous structure we can get the shortest path from
+            the starting node to any other node. Path cost is the distance[terminating_node].
+        '''
+
+        if mode not in ('passes', 'queue'):
+            raise ValueError('Not supported mode (' + str(mode) + ').')
+            
+        _checkBackend(backend)
+        
+        return self.__cached(G, l, 'bellmanFord', s, (mode, backend, dag), 
+            lambda: self.__bellmanFord(G, l, s, mode, backend, dag))
+            
+            
+    def __bellmanFord(self, G, l, s, mode, backend, dag):
+        '''
+        Bellman-Ford algorithm, see bellmanFord method.
+        '''
+        
+        # When the part of the graph reachable from s is acyclic, a single pass in
+        # topological order is enough
+        if dag:
+            return self.dagShortestPaths(G, l, s)
+        if dag is None:
+            order, back_edge = self.__topologicalOrder(G, [s])
+            if back_edge is None:
+                return self.__dagShortestPaths(G, l, s, order, False)
+            
+        # Initializations
+        V, E = _unpackGraph(G)
+        
+        if backend == 'numpy':
+            return self.__bellmanFordNumpy(G, V, E, l, s)
+            
+        if isinstance(G, CSRGraph) and l is G.getLengths():
+            return _csrBellmanFord(G, s, mode)
+            
+        # Initialize distances as defined in the algorithm
+        distance = {key: float('inf') for key in V}
+        distance[s] = 0
+        
+        # Initialize the previous structure as defined in the algorithm
+        previous = {key: None for key in V}
+        
+        if mode == 'queue':
+            # FIFO queue of the nodes whose distance changed, and the number of edges
+            # of their current path. A path of |V| edges contains a cycle.
+            Q = deque([s])
+            in_queue = {s}
+            edges_count = {s: 0}
+            
+            while Q:
+                u = Q.popleft()
+                in_queue.discard(u)
+                d_u = distance[u]
+                l_u = l[u]
+                
+                for v in E[u]:
+                    if distance[v] > d_u + l_u[v]:
+                        distance[v] = d_u + l_u[v]
+                        previous[v] = u
+                        edges_count[v] = edges_count[u] + 1
+                        
+                        if edges_count[v] >= len(V):
+                            cycle = _predecessorCycle(previous, [v] + list(V))
+                            if cycle is not None:
+                                raise NegativeCycleError(cycle)
+                                
+                        if v not in in_queue:
+                            in_queue.add(v)
+                            Q.append(v)
+                            
+            return previous, distance
+        
+        # Repeat |V| - 1 times, or until no distance changes. A change in the |V|-th
+        # pass means that there is a negative cycle.
+        for i in range(len(V)):
+            changed = None
+            for u in V:
+                d_u = distance[u]
+                l_u = l[u]
+                for v in E[u]:
+                    if distance[v] > d_u + l_u[v]:
+                        distance[v] = d_u + l_u[v]
+                        previous[v] = u
+                        changed = v
+                        
+            if changed is None:
+                break
+                
+            if i == len(V) - 1:
+                raise NegativeCycleError(_predecessorCycle(previous, [changed] + list(V)))
+                    
+        return previous, distance
+
+
+    def __bellmanFordNumpy(self, G, V, E, l, s):
+        '''
+        Bellman-Ford algorithm, NumPy backend. See bellmanFord method.
+        '''
+        
+        n = len(V)
+        sources, targets, weights = _edgeArrays(G, V, E, l)
+        integer = weights.dtype.kind == 'i'
+        
+        # Edges sorted on their targets, so that the minimum candidate distance of 
+        # each target is a segmented reduction (reduceat) over contiguous edges
+        order = np.argsort(targets, kind = 'stable')
+        sources = sources[order]
+        targets = targets[order]
+        weights = weights[order].astype(np.float64)
+        starts = np.flatnonzero(np.r_[True, targets[1:] != targets[:-1]]) if len(targets) else \
+            np.zeros(0, dtype = np.int64)
+        heads = targets[starts]
+        
+        index = {v: i for i, v in enumerate(V)}
+        distance = np.full(n, np.inf)
+        distance[index[s]] = 0
+        previous = np.full(n, -1, dtype = np.int64)
+        
+        # Repeat |V| - 1 times, or until no distance changes. A change in the |V|-th
+        # pass means that there is a negative cycle.
+        for i in range(n):
+            if not len(targets):
+                break
+                
+            candidates = distance[sources] + weights
+            best = np.minimum.reduceat(candidates, starts)
+            improved = best < distance[heads]
+            if not improved.any():
+                break
+                
+            updated = heads[improved]
+            distance[updated] = best[improved]
+            
+            # The previous of an updated node is a source of an edge with the minimum
+            # candidate distance
+            is_updated = np.zeros(n, dtype = bool)
+            is_updated[updated] = True
+            relaxing = (candidates == distance[targets]) & is_updated[targets]
+            previous[targets[relaxing]] = sources[relaxing]
+            
+            if i == n - 1:
+                previous = {v: (V[p] if p >= 0 else None) for v, p in zip(V, previous.tolist())}
+                raise NegativeCycleError(_predecessorCycle(previous, [V[updated[0]]] + list(V)))
+        
+        previous = {v: (V[p] if p >= 0 else None) for v, p in zip(V, previous.tolist())}
+        distance = {v: (int(d) if integer and d != float('inf') else d) 
+            for v, d in zip(V, distance.tolist())}
+        distance[s] = 0
+        
+        return previous, distance
+        
+        
+    def floydWarshall(self, G, l, backend = 'python', block = 256):
+        '''
+        Floyd-Warshall algorithm for finding the shortest paths between all the pairs
+        of nodes in a dense graph. The time complexity of the algorithm is O(|V|^3).
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E).
+            backend (string, default = 'python'): The implementation:
+                'python': Pure python loops.
+                'numpy' : Blocked (tiled) Floyd-Warshall on a NumPy distance matrix, each
+                          tile is updated with vectorized operations. The distances are
+                          the same as in the 'python' backend, the previous structure may
+                          differ on paths with equal cost. Needs NumPy.
+            block (int, default = 256): The tile size of the 'numpy' backend.
+
+        Raises:
+            NegativeCycleError: A negative cycle is found.
+            'Not supported backend.' : See the backend argument.
+
+        Returns:
+            previous (dictionary): previous[u] is the previous structure of the shortest
+                                   paths from node u, i.e. previous[u][v] is the node
+                                   before v in the shortest path from u to v.
+            distance (dictionary): distance[u][v] is the cost of the shortest path from
+                                   node u to node v.
+        '''
+        
+        _checkBackend(backend)
+        
+        V, E = _unpackGraph(G)
+        n = len(V)
+        index = {v: i for i, v in enumerate(V)}
+        inf = float('inf')
+        
+        if backend == 'numpy':
+            sources, targets, weights = _edgeArrays(G, V, E, l)
+            integer = weights.dtype.kind == 'i'
+            D, P = self.__floydWarshallNumpy(n, sources, targets, weights, block)
+            D = D.tolist()
+            P = P.tolist()
+        else:
+            integer = False
+            
+            # Distance matrix and previous matrix (index of the previous node, -1 if None)
+            D = [[inf] * n for _ in range(n)]
+            P = [[-1] * n for _ in range(n)]
+            for i in range(n):
+                D[i][i] = 0
+            for i, j, length in _edgeTriples(G, V, E, l, index):
+                if length < D[i][j]:
+                    D[i][j] = length
+                    P[i][j] = i
+                        
+            for k in range(n):
+                D_k = D[k]
+                P_k = P[k]
+                for i in range(n):
+                    D_ik = D[i][k]
+                    if D_ik == inf:
+                        continue
+                    D_i = D[i]
+                    P_i = P[i]
+                    for j in range(n):
+                        if D_ik + D_k[j] < D_i[j]:
+                            D_i[j] = D_ik + D_k[j]
+                            P_i[j] = P_k[j]
+                            
+        # A negative distance from a node to itself means a negative cycle through the
+        # node. The previous matrix is not reliable in this case, the cycle is found by
+        # the Bellman-Ford algorithm from the node.
+        for i in range(n):
+            if D[i][i] < 0:
+                self.bellmanFord(G, l, V[i])
+                
+        previous = {}
+        distance = {}
+        for i, u in enumerate(V):
+            previous[u] = {v: (V[p] if p >= 0 and j != i else None) for j, (v, p) in enumerate(zip(V, P[i]))}
+            distance[u] = {v: (int(d) if integer and d != inf else d) for v, d in zip(V, D[i])}
+            
+        return previous, distance
+        
+        
+    def __floydWarshallNumpy(self, n, sources, targets, weights, block):
+        '''
+        Blocked Floyd-Warshall algorithm, NumPy backend. See floydWarshall method.
+        Returns the distance and previous matrices.
+        '''
+        
+        D = np.full((n, n), np.inf)
+        np.fill_diagonal(D, 0)
+        P = np.full((n, n), -1, dtype = np.int64)
+        
+        # Keep the shortest of parallel edges
+        order = np.lexsort((weights, targets, sources))
+        first = np.r_[True, (sources[order][1:] != sources[order][:-1]) | 
+            (targets[order][1:] != targets[order][:-1])] if len(order) else np.zeros(0, dtype = bool)
+        edges = order[first]
+        shorter = weights[edges] < D[sources[edges], targets[edges]]
+        edges = edges[shorter]
+        D[sources[edges], targets[edges]] = weights[edges]
+        P[sources[edges], targets[edges]] = sources[edges]
+        
+        def update(I, J, K):
+            # Floyd-Warshall iterations k in K, on the tile D[I, J]
+            D_IJ = D[I, J]
+            P_IJ = P[I, J]
+            for k in range(K.start, K.stop):
+                candidates = D[I, k][:, None] + D[k, J][None, :]
+                shorter = candidates < D_IJ
+                D_IJ[shorter] = candidates[shorter]
+                P_IJ[shorter] = np.broadcast_to(P[k, J][None, :], shorter.shape)[shorter]
+                
+        blocks = [slice(b, min(b + block, n)) for b in range(0, n, block)]
+        for K in blocks:
+            # Phase 1: the diagonal tile
+            update(K, K, K)
+            
+            # Phase 2: the tiles in the row and the column of the diagonal tile
+            for J in blocks:
+                if J != K:
+                    update(K, J, K)
+                    update(J, K, K)
+                    
+            # Phase 3: all the other tiles
+            for I in blocks:
+                if I == K:
+                    continue
+                for J in blocks:
+                    if J != K:
+                        update(I, J, K)
+                        
+        return D, P
+        
+        
+    def astar(self, G, l, s, t, h):
+        '''
+        A* search algorithm for finding the shortest path from node 's' to node 't'.
+        It is the Dijkstra's algorithm, where the nodes are expanded in increasing
+        distance from 's' plus estimated distance to 't', so the search is directed
+        towards 't' and fewer nodes are settled. The search stops when 't' is settled.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E).
+            s (string): Starting node.
+            t (string): Terminating node.
+            h (callable): The heuristic, h(v, t) returns a lower bound of the distance
+                          from node v to node t (admissible heuristic), i.e. 
+                          EuclideanHeuristic, HaversineHeuristic or LandmarkHeuristic.
+
+        Raises:
+            'Non positive edge length found.' : Edge lengths in the A* algorithm
+                                                should be positives numbers.
+
+        Returns:
+            previous (dictionary): The previous data structure of the algorithm.
+            distance (dictionary): The distance data structure of the algorithm.
+            
+            Only the nodes reached by the search are included. Backtracking the previous
+            structure we can get the shortest path from the starting node to the 
+            terminating node. Path cost is the distance[t] (infinite if 't' is not
+            reachable).
+        '''
+        
+        if isinstance(G, CSRGraph) and l is G.getLengths():
+            return _csrAstar(G, s, t, h)
+            
+        # Initializations
+        V, E = _unpackGraph(G)
+        distance = {s: 0}
+        previous = {s: None}
+        
+        # Estimated distance to t of each reached node, the heuristic is called once
+        # per node
+        estimate = {s: h(s, t)}
+        
+        # Heap of (distance + estimate, distance, node) items
+        heap = [(estimate[s], 0, s)]
+        
+        while heap:
+            _, d_u, u = heapq.heappop(heap)
+            
+            # Skip outdated items
+            if d_u > distance[u]:
+                continue
+                
+            if u == t:
+                break
+                
+            l_u = l[u]
+            for v in E[u]:
+                if l_u[v] <= 0:
+                    raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                    
+                if v not in distance or distance[v] > d_u + l_u[v]:
+                    distance[v] = d_u + l_u[v]
+                    previous[v] = u
+                    if v not in estimate:
+                        estimate[v] = h(v, t)
+                    heapq.heappush(heap, (distance[v] + estimate[v], distance[v], v))
+                    
+        if t not in distance:
+            distance[t] = float('inf')
+            previous[t] = None
+            
+        return previous, distance
+        
+        
+    def batchShortestPaths(self, G, l, sources = None, method = 'dijkstra', workers = None, 
+        context = None):
+        '''
+        Single source shortest paths from many sources, computed in parallel on a pool
+        of worker processes. The results are yielded per source, as soon as they are
+        computed (not in the order of the sources).
+        
+        The graph is not pickled per task: with the 'fork' start method the workers 
+        inherit it (copy on write), otherwise it is sent once to each worker. A 
+        CSRGraph is preferred, its few flat arrays stay shared between the processes
+        (a memory-mapped one, or its edges and lengths views, is sent as its file path
+        and mapped again by the workers).
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E). Not used by the
+                            'bfs' method (can be None).
+            sources (list, default = None): The starting nodes. All the nodes if None
+                                            (all pairs shortest paths).
+            method (string, default = 'dijkstra'): The single source algorithm:
+                'dijkstra'   : Dijkstra's algorithm (positive lengths).
+                'bfs'        : BFS (unit lengths).
+                'bellmanFord': Bellman-Ford algorithm (negative lengths).
+                'johnson'    : Johnson's algorithm (negative lengths). The lengths are
+                               reweighted to non negative ones once, with the distances
+                               from a virtual node connected to all the nodes (Bellman-Ford
+                               algorithm), then Dijkstra's algorithm runs for each source.
+            workers (int, default = None): The number of worker processes. The number of
+                                           CPUs if None. If 1, no processes are started.
+            context (string or context, default = None): The multiprocessing start 
+                method ('fork', 'spawn', 'forkserver') or context of the pool. The default
+                context (see multiprocessing.set_start_method) if None.
+
+        Raises:
+            NegativeCycleError: A negative cycle is found ('bellmanFord', 'johnson').
+            'Not supported method.' : See the method argument.
+
+        Returns:
+            results (generator): Yields (source, previous, distance) for each source, 
+                                 see the single source algorithms.
+        '''
+        
+        if method not in ('dijkstra', 'bfs', 'bellmanFord', 'johnson'):
+            raise ValueError('Not supported method (' + str(method) + ').')
+            
+        V, E = _unpackGraph(G)
+        
+        if sources is None:
+            sources = V
+            
+        # Johnson's algorithm potentials, the distances from a virtual node q, connected
+        # to all the nodes with zero lengths
+        potentials = None
+        if method == 'johnson':
+            q = object()
+            _, potentials = self.bellmanFord((list(V) + [q], ChainMap({q: list(V)}, E)), 
+                ChainMap({q: {v: 0 for v in V}}, l), q)
+            del potentials[q]
+            
+        return self.__batch((G, V, E, l, method, potentials), sources, workers or os.cpu_count() or 1,
+            context)
+        
+        
+    def __batch(self, task, sources, workers, context):
+        '''
+        Generator of the batch shortest paths results. See batchShortestPaths method.
+        '''
+        
+        global _batch_task
+        
+        if workers == 1:
+            for s in sources:
+                yield _batchShortestPaths(task, s)
+            return
+            
+        context = _poolContext(context)
+        if context.get_start_method() == 'fork':
+            # Forked workers inherit the task
+            _batch_task, saved_task = task, _batch_task
+            try:
+                pool = context.Pool(workers)
+            finally:
+                _batch_task = saved_task
+        else:
+            # The workers rebuild the task from the graph, see _batchInitializer
+            G, _, _, l, method, potentials = task
+            if isinstance(G, (Graph, CSRGraph)) and l is G.getLengths():
+                l = None
+            pool = context.Pool(workers, _batchInitializer, (G, l, method, potentials))
+            
+        with pool:
+            for result in pool.imap_unordered(_batchWorker, sources):
+                yield result
+        
+        
+    def repairShortestPaths(self, G, l, s, previous, distance, changes):
+        '''
+        Updates the single source shortest paths from node 's' (i.e. the result of the
+        dijkstra method), after some edges of the graph were added, removed or their
+        lengths changed, without running the algorithm from scratch (dynamic SSSP, in 
+        the style of the Ramalingam-Reps algorithm):
+        
+        1. The nodes whose shortest path used a removed or lengthened edge (the subtree
+           of the edge in the shortest paths tree) are the affected nodes. Their 
+           distance is reset, and they get a tentative distance from their in-edges 
+           from not affected nodes.
+        2. Added or shortened edges which improve the distance of their destination
+           update it.
+        3. A Dijkstra's search from the updated nodes propagates the new distances.
+        
+        Only the nodes whose distance changes (and their neighbours) are visited, so the
+        cost depends on the size of the change and not on the size of the graph. The
+        in-edges of the affected nodes are read from the reversed graph, which a Graph
+        object creates once and keeps up to date on addEdge, removeEdge and 
+        updateWeight. For (V, E) tuples, or other lengths than the graph's own, it is
+        created on every call, in O(|V|+|E|), so a Graph object with its own lengths 
+        should be used to get the above cost.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E), after the changes. A Graph 
+                                        or CSRGraph object is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E), after the changes.
             s (string): Starting node.
+            previous (dictionary): The previous data structure, before the changes.
+            distance (dictionary): The distance data structure, before the changes.
+            changes (list): The changed edges [(u, v), ...].
+
+            Note: The previous and distance structures are updated in place, so results
+                  shared by a ShortestPathCache should be copied first. The distances 
+                  are the same as those of the dijkstra method, the previous structure
+                  may differ on paths with equal cost.
+
+        Raises:
+            'Non positive edge length found.' : Edge lengths should be positives numbers,
+                                                as in the Dijkstra's algorithm.
 
         Returns:
-            previous (dictionary): The previous data structure of the algorithm.
-            distance (dictionary): The distance data structure of the algorithm.
+            previous (dictionary): The updated previous data structure.
+            distance (dictionary): The updated distance data structure.
+        '''
+        
+        V, E = _unpackGraph(G)
+        infinity = float('inf')
+        
+        # Nodes added to the graph after the shortest paths were computed, a Graph 
+        # appends them to its vertices
+        if len(distance) != len(V):
+            for v in (V[len(distance):] if isinstance(G, Graph) else V):
+                if v not in distance:
+                    distance[v] = infinity
+                    previous[v] = None
+                    
+        heap = []
+        
+        # Tree edges removed or lengthened: their subtrees are affected
+        affected = set()
+        for u, v in changes:
+            if previous.get(v) == u and u != v and (v not in l[u] or distance[u] + l[u][v] > distance[v]):
+                stack = [v]
+                affected.add(v)
+                while stack:
+                    x = stack.pop()
+                    for y in E[x]:
+                        if previous[y] == x and y not in affected:
+                            affected.add(y)
+                            stack.append(y)
+                            
+        if affected:
+            for x in affected:
+                distance[x] = infinity
+                previous[x] = None
+                
+            # The tentative distances of the affected nodes, from not affected nodes
+            RE, Rl = _reverseGraph(G, l)
+            for x in affected:
+                Rl_x = Rl[x]
+                for p in RE[x]:
+                    if p not in affected and distance[p] + Rl_x[p] < distance[x]:
+                        distance[x] = distance[p] + Rl_x[p]
+                        previous[x] = p
+                if distance[x] < infinity:
+                    heapq.heappush(heap, (distance[x], x))
+                    
+        # Edges added or shortened
+        for u, v in changes:
+            if v in l[u] and distance[u] + l[u][v] < distance[v]:
+                if l[u][v] <= 0:
+                    raise ValueError('Non positive edge length (' + str(l[u][v]) + ') found.')
+                distance[v] = distance[u] + l[u][v]
+                previous[v] = u
+                heapq.heappush(heap, (distance[v], v))
+                
+        # Propagate the new distances
+        while heap:
+            d_u, u = heapq.heappop(heap)
             
-            Backtracking the previous structure we can get the shortest path from
-            the starting node to any other node. Path cost is the distance[terminating_node].
+            # Skip outdated items
+            if d_u > distance[u]:
+                continue
+                
+            l_u = l[u]
+            for v in E[u]:
+                if l_u[v] <= 0:
+                    raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                    
+                if distance[v] > d_u + l_u[v]:
+                    distance[v] = d_u + l_u[v]
+                    previous[v] = u
+                    heapq.heappush(heap, (distance[v], v))
+                    
+        return previous, distance
+        
+        
+    def reconstructPath(self, previous, s, t):
         '''
+        Returns the path from node 's' to node 't', by backtracking the previous data 
+        structure of a shortest paths algorithm, in O(path length).
 
-        # Initializations
-        V = G[0]
-        E = G[1]
-        # Initialize distances as defined in the algorithm
-        distance = {key: float('inf') for key in V}
-        distance[s] = 0
+        Args:
+            previous (dictionary or array): The previous data structure. A compact index
+                                            array (see compactPrevious) is also accepted,
+                                            then the nodes are given by their index.
+            s (string): Starting node.
+            t (string): Terminating node.
+
+        Raises:
+            'Invalid previous structure.' : The previous structure has a cycle.
+
+        Returns:
+            path (list): The nodes of the path [s, ..., t], or an empty list if 't' is 
+                         not reachable from 's'.
+        '''
         
-        # Initialize the previous structure as defined in the algorithm
-        previous = {key: None for key in V}
+        # None for the dictionaries, -1 for the compact arrays
+        none = None if isinstance(previous, Mapping) else -1
         
-        # Repeat |V| - 1 times
-        for _ in range(len(V)-1):
-            for u in V:
-                for v in E[u]:
-                    if distance[v] > distance[u] + l[u][v]:
-                        distance[v] = distance[u] + l[u][v]
-                        previous[v] = u
+        path = [t]
+        while t != s:
+            t = previous.get(t, none) if none is None else previous[t]
+            if t == none:
+                return []
+            path.append(t)
+            if len(path) > len(previous) + 1:
+                raise ValueError('Invalid previous structure (' + str(t) + ').')
+        path.reverse()
+        
+        return path
+        
+        
+    def allPaths(self, previous, s):
+        '''
+        Returns the paths from node 's' to all the reachable nodes, by backtracking the
+        previous data structure of a shortest paths algorithm. Each node is backtracked
+        once: the path of a node is linked to the already built path of its previous 
+        node (shared prefix tree), so the cost and the memory are O(|V|), not the total
+        length of the paths.
+
+        Args:
+            previous (dictionary or array): The previous data structure, or a compact 
+                                            index array (see reconstructPath).
+            s (string): Starting node.
+
+        Raises:
+            'Invalid previous structure.' : The previous structure has a cycle.
+
+        Returns:
+            paths (dictionary): The paths {t: path, ...} of the reachable nodes. A path 
+                                is a read-only sequence of the nodes [s, ..., t] (equal to
+                                the list of reconstructPath), stored as the (node, path of 
+                                the previous node) pair. list(path) copies it.
+        '''
+        
+        none = None if isinstance(previous, Mapping) else -1
+        nodes = previous.keys() if none is None else range(len(previous))
+        
+        paths = {s: _SharedPath(s, None)}
+        unreachable = set()
+        
+        for t in nodes:
+            if t in paths or t in unreachable:
+                continue
+                
+            # Backtrack to a node with a known path (or no path)
+            branch = []
+            u = t
+            while u not in paths and u not in unreachable:
+                branch.append(u)
+                u = previous.get(u, none) if none is None else previous[u]
+                if u == none:
+                    break
+                if len(branch) > len(previous):
+                    raise ValueError('Invalid previous structure (' + str(u) + ').')
                     
-        return previous, distance
+            if u == none or u in unreachable:
+                unreachable.update(branch)
+                continue
+                
+            path = paths[u]
+            for v in reversed(branch):
+                path = _SharedPath(v, path)
+                paths[v] = path
+                
+        return paths
+        
+        
+    def compactPrevious(self, G, previous):
+        '''
+        Returns the previous data structure of a shortest paths algorithm as a compact
+        array, where the nodes are given by their index in V (the CSR index for a 
+        CSRGraph). It takes 8 bytes per node, instead of a dictionary item.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            previous (dictionary): The previous data structure.
+
+        Raises:
+            -
+
+        Returns:
+            previous (array): The index of the previous node of each node, -1 if none.
+        '''
+        
+        V, E = _unpackGraph(G)
+        index = G.getIndex() if isinstance(G, CSRGraph) else {v: i for i, v in enumerate(V)}
+        
+        compact = array('q', [-1]) * len(V)
+        for v, u in previous.items():
+            if u is not None:
+                compact[index[v]] = index[u]
+                
+        return compact
+        
+        
+    def shortestPath(self, G, l, s, t, method = 'dijkstra'):
+        '''
+        Point-to-point shortest path query. Returns the shortest path from node 's'
+        to node 't' and its cost. Unlike the single source algorithms, the search
+        stops as soon as the shortest path to 't' is known.
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            l (dictionary): The edges lengths of the graph G = (V,E). Not used by the
+                            'bfs' and 'bibfs' methods (can be None).
+            s (string): Starting node.
+            t (string): Terminating node.
+            method (string, default = 'dijkstra'): The search algorithm:
+                'dijkstra'  : Dijkstra's algorithm, stops when 't' is settled.
+                'bidijkstra': Bidirectional Dijkstra's algorithm, searching forward from
+                              's' and backward from 't' until the two searches meet.
+                'bfs'       : BFS (unit lengths), stops when 't' is discovered.
+                'bibfs'     : Bidirectional BFS (unit lengths).
+                              
+            Note: The bidirectional methods need the in-edges of the nodes. For Graph and
+                  CSRGraph objects with their own lengths the reversed graph is created
+                  once and cached, otherwise it is created in each call.
+
+        Raises:
+            'Non positive edge length found.' : Edge lengths in the Dijkstra's 
+                                                algorithm should be positives numbers.
+            'Not supported method.' : See the method argument.
+
+        Returns:
+            path (list): The nodes of the shortest path, from 's' to 't'. Empty if 't'
+                         is not reachable from 's'.
+            cost (number): The cost of the shortest path. Infinite if 't' is not
+                           reachable from 's'.
+        '''
+        
+        if method not in ('dijkstra', 'bidijkstra', 'bfs', 'bibfs'):
+            raise ValueError('Not supported method (' + str(method) + ').')
+            
+        V, E = _unpackGraph(G)
+        
+        if s == t:
+            return [s], 0
+            
+        if method == 'dijkstra':
+            return self.__dijkstraTo(E, l, s, t)
+            
+        if method == 'bfs':
+            return self.__bfsTo(E, s, t)
+            
+        RE, Rl = _reverseGraph(G, l)
+        
+        if method == 'bidijkstra':
+            return self.__bidirectionalDijkstra(E, l, RE, Rl, s, t)
+            
+        return self.__bidirectionalBfs(E, RE, s, t)
+        
+        
+    def __dijkstraTo(self, E, l, s, t):
+        '''
+        Dijkstra's algorithm from 's', stopped when 't' is settled. See shortestPath method.
+        '''
+        
+        distance = {s: 0}
+        previous = {s: None}
+        heap = [(0, s)]
+        
+        while heap:
+            d_u, u = heapq.heappop(heap)
+            
+            # Skip outdated items
+            if d_u > distance[u]:
+                continue
+                
+            if u == t:
+                return _pathTo(previous, t), d_u
+                
+            l_u = l[u]
+            for v in E[u]:
+                if l_u[v] <= 0:
+                    raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                    
+                if v not in distance or distance[v] > d_u + l_u[v]:
+                    distance[v] = d_u + l_u[v]
+                    previous[v] = u
+                    heapq.heappush(heap, (distance[v], v))
+                    
+        return [], float('inf')
+        
+        
+    def __bidirectionalDijkstra(self, E, l, RE, Rl, s, t):
+        '''
+        Bidirectional Dijkstra's algorithm. See shortestPath method.
+        '''
+        
+        # Forward search from s on G and backward search from t on G^R. The previous
+        # of the backward search is the next node towards t.
+        distance = ({s: 0}, {t: 0})
+        previous = ({s: None}, {t: None})
+        heaps = ([(0, s)], [(0, t)])
+        edges = ((E, l), (RE, Rl))
+        
+        # Cost of the best path found so far, and the node where the searches met
+        best = float('inf')
+        meeting = None
+        
+        while heaps[0] and heaps[1]:
+            
+            # The searches can not find a better path
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            
+            # Expand the search with the closest node
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d_u, u = heapq.heappop(heaps[side])
+            distance_side = distance[side]
+            distance_other = distance[1 - side]
+            
+            # Skip outdated items
+            if d_u > distance_side[u]:
+                continue
+                
+            E_side, l_side = edges[side]
+            l_u = l_side[u]
+            for v in E_side[u]:
+                if l_u[v] <= 0:
+                    raise ValueError('Non positive edge length (' + str(l_u[v]) + ') found.')
+                    
+                d_v = d_u + l_u[v]
+                if v not in distance_side or distance_side[v] > d_v:
+                    distance_side[v] = d_v
+                    previous[side][v] = u
+                    heapq.heappush(heaps[side], (d_v, v))
+                    
+                if v in distance_other and d_v + distance_other[v] < best:
+                    best = d_v + distance_other[v]
+                    meeting = v
+                    
+        if meeting is None:
+            return [], float('inf')
+            
+        return _pathTo(previous[0], meeting) + _pathTo(previous[1], meeting)[-2::-1], best
+        
+        
+    def __bfsTo(self, E, s, t):
+        '''
+        BFS from 's', stopped when 't' is discovered. See shortestPath method.
+        '''
+        
+        distance = {s: 0}
+        previous = {s: None}
+        Q = deque([s])
+        
+        while Q:
+            u = Q.popleft()
+            for v in E[u]:
+                if v not in distance:
+                    distance[v] = distance[u] + 1
+                    previous[v] = u
+                    if v == t:
+                        return _pathTo(previous, t), distance[t]
+                    Q.append(v)
+                    
+        return [], float('inf')
+        
+        
+    def __bidirectionalBfs(self, E, RE, s, t):
+        '''
+        Bidirectional BFS. See shortestPath method.
+        '''
+        
+        # Forward search from s on G and backward search from t on G^R. The previous
+        # of the backward search is the next node towards t.
+        distance = ({s: 0}, {t: 0})
+        previous = ({s: None}, {t: None})
+        frontiers = ([s], [t])
+        edges = (E, RE)
+        
+        while frontiers[0] and frontiers[1]:
+            
+            # Expand a full level of the search with the smallest frontier
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            distance_side = distance[side]
+            distance_other = distance[1 - side]
+            E_side = edges[side]
+            
+            best = None
+            frontier = []
+            for u in frontiers[side]:
+                for v in E_side[u]:
+                    if v in distance_other:
+                        cost = distance_side[u] + 1 + distance_other[v]
+                        if best is None or cost < best[0]:
+                            best = (cost, u, v)
+                    if v not in distance_side:
+                        distance_side[v] = distance_side[u] + 1
+                        previous[side][v] = u
+                        frontier.append(v)
+                        
+            if best is not None:
+                cost, u, v = best
+                
+                # Orient the meeting edge u -> v forward
+                if side == 1:
+                    u, v = v, u
+                return _pathTo(previous[0], u) + _pathTo(previous[1], v)[::-1], cost
+                
+            frontiers = (frontier, frontiers[1]) if side == 0 else (frontiers[0], frontier)
+            
+        return [], float('inf')
+
+
+# The task of the Boruvka's algorithm worker processes (sources, targets, weights,
+# backend, components), see MST.boruvka. It is inherited by forked workers (copy on 
+# write), or set once per worker by the pool initializer. The components are a shared
+# memory array, written by the parent process before each round.
+_boruvka_task = None
 
 
+def _boruvkaInitializer(G, w, backend, shared):
+    '''
+    Sets the task of a Boruvka's algorithm worker process. The graph is sent instead
+    of its edge lists, so that a memory-mapped CSRGraph is mapped again by the worker
+    (its arrays are not pickled). The graph's own weights are sent as None.
+    '''
+    
+    global _boruvka_task
+    
+    V, E = _unpackGraph(G)
+    if w is None and isinstance(G, (Graph, CSRGraph)):
+        w = G.getLengths()
+        
+    if backend == 'numpy':
+        sources, targets, weights = _edgeArrays(G, V, E, w)
+    else:
+        sources, targets, weights = _edgeLists(G, V, E, w)
+        
+    _boruvka_task = (sources, targets, weights, backend, shared)
+    
+    
+def _boruvkaWorker(arguments):
+    '''
+    Runs the Boruvka's algorithm task of the worker process for a range of edges, 
+    with the components of the round in the shared memory array.
+    '''
+    
+    low, high = arguments
+    sources, targets, weights, backend, shared = _boruvka_task
+    
+    return _boruvkaMinimumEdges((sources, targets, weights, backend), 
+        _sharedComponents(shared, backend), low, high)
+        
+        
+def _sharedComponents(shared, backend):
+    '''
+    Returns a view of the components shared memory array (of C long long) of the
+    Boruvka's algorithm, without copying it.
+    '''
+    
+    if backend == 'numpy':
+        return np.frombuffer(shared, dtype = np.int64)
+        
+    return memoryview(shared).cast('B').cast('q')
+    
+    
+def _boruvkaMinimumEdges(task, component, low, high):
+    '''
+    Returns the lightest outgoing edge of each component, among the edges with index 
+    in [low, high). Edges are compared by (weight, index), so that the choice is
+    consistent and the selected edges form a forest. Returns a (components, edges) 
+    pair of arrays (numpy backend) or a {component: edge} dictionary (python backend).
+    '''
+    
+    sources, targets, weights, backend = task
+    
+    if backend == 'numpy':
+        edges = np.arange(low, high)
+        component_u = component[sources[low:high]]
+        component_v = component[targets[low:high]]
+        outgoing = component_u != component_v
+        edges = edges[outgoing]
+        
+        # Each outgoing edge is a candidate for the components of both its nodes
+        components = np.concatenate((component_u[outgoing], component_v[outgoing]))
+        edges = np.concatenate((edges, edges))
+        order = np.lexsort((edges, weights[edges], components))
+        components = components[order]
+        first = np.r_[True, components[1:] != components[:-1]] if len(components) else \
+            np.zeros(0, dtype = bool)
+        
+        return components[first], edges[order][first]
+        
+    lightest = {}
+    for i in range(low, high):
+        component_u = component[sources[i]]
+        component_v = component[targets[i]]
+        if component_u == component_v:
+            continue
+        key = (weights[i], i)
+        for c in (component_u, component_v):
+            j = lightest.get(c)
+            if j is None or key < (weights[j], j):
+                lightest[c] = i
+                
+    return lightest
+    
+    
 class MST(object):
     '''
     Minimum Spanning Tree algorithms implementation. See methods for the implemented 
@@ -470,6 +5733,8 @@ class MST(object):
         
     Methods:
         kruskal(self, G, w) : Implementation of the Kruskal's algorithm.
+        prim(self, G, w): Implementation of the Prim's algorithm.
+        boruvka(self, G, w): Implementation of the Boruvka's algorithm.
     '''
 
     def __init__(self):
@@ -477,17 +5742,20 @@ class MST(object):
         pass
         
     
-    def kruskal(self, G, w):
+    def kruskal(self, G, w, lazy = False):
         '''
         Kruskals algorithm for finding the Minimum Spanning Tree in a graph.
         Returns the MST and its total weight.
 
         Args:
-            G (Graph): The graph G = (V,E).
+            G (Graph): The graph G = (V,E). A CSRGraph object is also accepted.
             w (dictionary): The edges weights of the graph G = (V,E).
+            lazy (boolean, default = False): If True, the edges are popped from a heap
+                in increasing weights order, instead of sorting all of them (see
+                Graph.iterSortedEdges). The algorithm stops after |V| - 1 edges.
 
         Returns:
-            mst (dictionary): The minimum spanning tree {edge: edge_length, ...}
+            mst (dictionary): The minimum spanning tree {(u, v): edge_length, ...}
             total_weight (float): The total weight of the minimum spanning tree.
         '''
         
@@ -495,98 +5763,118 @@ class MST(object):
         mst = {}
         total_weight = 0
         
-        # Initialize parent pointer and rank
-        parent = {v: v for v in G.getVertices()}
-        rank = {v: 0 for v in G.getVertices()}
-
-        # Find the parent of a vertex v  
-        def find(v):
-            
-            nonlocal parent
-            
-            if v != parent[v]:
-                parent[v] = find(parent[v])
-        
-            return parent[v]
-            
-
-        # Find the roots of u and v, and set the parent of root_u to be the root_v
-        def union(u, v):
-
-            nonlocal parent
-            nonlocal rank
-            
-            root_u = find(u)
-            root_v = find(v)
-            
-            if root_u != root_v:  
-                if rank[root_u] > rank[root_v]:
-                    parent[root_v] = root_u
-                else:
-                    parent[root_u] = root_v
-                    if rank[root_u] == rank[root_v]:
-                        rank[root_v] += 1
+        # Each vertex is in its own set
+        components = DisjointSet(G.getVertices())
         
         # Run Kruskal algorithm
-        sorted_edges = G.sortEdges()
+        mst_size = len(G.getVertices()) - 1
         
-        for e, l in sorted_edges.items():
+        for u, v, l in G.iterSortedEdges(lazy):
             
-            # Check if vertices are already connected, if not add to the MST
-            if find(e[0]) != find(e[1]):
-                union(e[0], e[1])
+            # A spanning tree has |V| - 1 edges
+            if len(mst) == mst_size:
+                break
                 
-                mst[e] = l
+            # Check if vertices are already connected, if not add to the MST
+            if components.union(u, v):
+                mst[_edgeKey(u, v)] = l
                 total_weight += l
                 
         return mst, total_weight
                 
       
-    def prim(self, G, w):
+    def prim(self, G, w, queue = 'indexed', arity = 2):
         '''
         Prim's algorithm for finding the Minimum Spanning Tree in a graph.
-        Returns the MST and its total weight.
+        Returns the MST and its total weight. For a disconnected graph, the minimum
+        spanning forest (a MST for each connected component) is returned. The graph
+        is not modified.
 
         Args:
-            G (Graph): The graph G = (V,E).
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
             w (dictionary): The edges weights of the graph G = (V,E).
+            queue (string, default = 'indexed'): The priority queue strategy:
+                'indexed': IndexedPriorityQueue with decrease-key.
+                'lazy'   : heapq list, where outdated items are skipped when popped
+                           (lazy deletion).
+            arity (int, default = 2): The arity of the indexed heap (2, 4 or 8).
+
+            Note: Both strategies return identical results.
+
+        Raises:
+            'Not supported queue strategy.' : See the queue argument.
 
         Returns:
-            mst (dictionary): The minimum spanning tree {edge: edge_length, ...}
+            mst (dictionary): The minimum spanning tree {(u, v): edge_length, ...}
             total_weight (float): The total weight of the minimum spanning tree.
         '''    
 
+        if queue not in ('indexed', 'lazy'):
+            raise ValueError('Not supported queue strategy (' + str(queue) + ').')
+            
+        if isinstance(G, CSRGraph) and w is G.getLengths():
+            return _csrPrim(G, queue, arity)
+            
         # Initializations
-        V = G[0]
-        E = G[1]
+        V, E = _unpackGraph(G)
 
-        # Initialize distances as defined in the algorithm
-        cost = {key: float('inf') for key in V}
-        cost[V[0]] = 0
+        # The weight of the lightest edge connecting each node to the tree
+        cost = {}
         
         # Initialize the previous structure as defined in the algorithm
-        previous = {key: None for key in V}
+        previous = {}
         
-        # Updatable priority queue contains items of the type (priority, node)
-        priority_queue = UpdatablePriorityQueue()
-        # Initialize the queue as defined in the algorithm
-        for v in V:
-            priority_queue.put((cost[v], v))
+        # Nodes already in the tree (forest)
+        in_tree = set()
         
-        # Loop until all the nodes are explored
-        while not priority_queue.empty():
-            u = priority_queue.get()[1]
+        # Each node not in the tree after a run is the root of the next component
+        for root in V:
+            if root in in_tree:
+                continue
+                
+            cost[root] = 0
+            previous[root] = None
             
-            # For all connected nodes v to the node u with length l
-            for v in E[u]:
+            if queue == 'lazy':
+                # Heap of (priority, node) items, outdated items are skipped
+                heap = [(0, root)]
                 
-                if cost[v] > w[u][v]:
-                    cost[v] = w[u][v]
-                    previous[v] = u
-                    E[v].remove(u)
-
-                    # Update priority
-                    priority_queue.updatePriority(v, cost[v])
+                while heap:
+                    c_u, u = heapq.heappop(heap)
+                    if u in in_tree:
+                        continue
+                    in_tree.add(u)
+                    w_u = w[u]
+                    
+                    for v in E[u]:
+                        if v not in in_tree and (v not in cost or cost[v] > w_u[v]):
+                            cost[v] = w_u[v]
+                            previous[v] = u
+                            heapq.heappush(heap, (cost[v], v))
+            else:
+                # Indexed priority queue contains items of the type (priority, node),
+                # nodes are inserted when they are first reached
+                priority_queue = IndexedPriorityQueue(arity)
+                priority_queue.push(root, 0)
+                
+                while not priority_queue.empty():
+                    u = priority_queue.popMin()[1]
+                    in_tree.add(u)
+                    w_u = w[u]
+                    
+                    for v in E[u]:
+                        if v in in_tree:
+                            continue
+                            
+                        if v not in cost:
+                            cost[v] = w_u[v]
+                            previous[v] = u
+                            priority_queue.push(v, cost[v])
+                        elif cost[v] > w_u[v]:
+                            cost[v] = w_u[v]
+                            previous[v] = u
+                            priority_queue.decreaseKey(v, cost[v])
 
         # Create a dictionary with the MST
         mst = {}
@@ -594,9 +5882,157 @@ class MST(object):
         
         for p in previous:
             if previous[p] is not None:
-                mst[''.join(sorted(p + previous[p]))] = cost[p]
+                mst[_edgeKey(previous[p], p)] = cost[p]
                 total_weight += cost[p]
         
         return mst, total_weight
-    
-  
\ No newline at end of file
+        
+        
+    def boruvka(self, G, w, backend = 'python', workers = 1, context = None):
+        '''
+        Boruvka's algorithm for finding the Minimum Spanning Tree in a graph.
+        Returns the MST and its total weight. In each round the lightest outgoing edge
+        of every component is added to the tree, and the components are contracted, so
+        there are at most log|V| rounds. The lightest edges selection of a round is
+        independent per edge, it is vectorized (numpy backend) and/or split in ranges
+        of edges over worker processes. For a disconnected graph, the minimum spanning
+        forest is returned. The time complexity of the algorithm is O(|E|log|V|).
+
+        Args:
+            G (tuple(list,dictionary)): The graph G = (V,E). A Graph or CSRGraph object
+                                        is also accepted.
+            w (dictionary): The edges weights of the graph G = (V,E).
+            backend (string, default = 'python'): The implementation of a round:
+                'python': Pure python loops over the edges, the components are 
+                          contracted with a DisjointSet.
+                'numpy' : Vectorized lightest edges selection, the components are
+                          contracted with vectorized pointer jumping. Needs NumPy.
+            workers (int, default = 1): The number of worker processes, each one 
+                                        selecting the lightest edges of a range of edges.
+                                        The number of CPUs if None.
+            context (string or context, default = None): The multiprocessing start 
+                method or context of the pool, see GraphAlgorithms.batchShortestPaths.
+                The components of each round are written to a shared memory array, 
+                read by all the workers, so only the edge ranges are sent to them.
+
+            Note: Edges of equal weight are ordered by their position in the edge list,
+                  so the MST may differ from the Kruskal's and Prim's ones, but it has
+                  the same total weight.
+
+        Raises:
+            'Not supported backend.' : See the backend argument.
+
+        Returns:
+            mst (dictionary): The minimum spanning tree {(u, v): edge_length, ...}
+            total_weight (float): The total weight of the minimum spanning tree.
+        '''
+        
+        global _boruvka_task
+        
+        _checkBackend(backend)
+        
+        V, E = _unpackGraph(G)
+        n = len(V)
+        
+        if backend == 'numpy':
+            sources, targets, weights = _edgeArrays(G, V, E, w)
+            component = np.arange(n)
+        else:
+            sources, targets, weights = _edgeLists(G, V, E, w)
+            component = list(range(n))
+            components = DisjointSet(range(n))
+            
+        task = (sources, targets, weights, backend)
+        workers = workers or os.cpu_count() or 1
+        
+        # Ranges of edges, one per worker
+        m = len(sources)
+        step = -(-m // workers) if m else 1
+        ranges = [(low, min(low + step, m)) for low in range(0, m, step)]
+        
+        pool = None
+        if workers > 1:
+            context = _poolContext(context)
+            shared = context.RawArray('q', max(n, 1))
+            shared_component = _sharedComponents(shared, backend)
+            if context.get_start_method() == 'fork':
+                # Forked workers inherit the task
+                _boruvka_task, saved_task = task + (shared,), _boruvka_task
+                try:
+                    pool = context.Pool(workers)
+                finally:
+                    _boruvka_task = saved_task
+            else:
+                # The workers rebuild the edge lists from the graph
+                if isinstance(G, (Graph, CSRGraph)) and w is G.getLengths():
+                    w = None
+                pool = context.Pool(workers, _boruvkaInitializer, (G, w, backend, shared))
+        
+        mst_edges = []
+        try:
+            while True:
+                if pool is not None:
+                    shared_component[:n] = component if backend == 'numpy' else array('q', component)
+                    partial = pool.map(_boruvkaWorker, ranges)
+                else:
+                    partial = [_boruvkaMinimumEdges(task, component, low, high) for low, high in ranges]
+                    
+                if backend == 'numpy':
+                    # Lightest edge of each component over all the ranges
+                    selected_components = np.concatenate([p[0] for p in partial]) if partial else \
+                        np.zeros(0, dtype = np.int64)
+                    selected = np.concatenate([p[1] for p in partial]) if partial else \
+                        np.zeros(0, dtype = np.int64)
+                    if not len(selected):
+                        break
+                    order = np.lexsort((selected, weights[selected], selected_components))
+                    selected_components = selected_components[order]
+                    first = np.r_[True, selected_components[1:] != selected_components[:-1]]
+                    selected_components = selected_components[first]
+                    selected = selected[order][first]
+                    mst_edges.extend(np.unique(selected).tolist())
+                    
+                    # Hook each component to the component on the other side of its
+                    # lightest edge. Two components selecting the same edge point to
+                    # each other, the smaller one becomes the root.
+                    other = np.where(component[sources[selected]] == selected_components, 
+                        component[targets[selected]], component[sources[selected]])
+                    parent = np.arange(n)
+                    parent[selected_components] = other
+                    mutual = (parent[other] == selected_components) & (selected_components < other)
+                    parent[selected_components[mutual]] = selected_components[mutual]
+                    
+                    # Pointer jumping, until each node points to the root of its tree
+                    while True:
+                        grandparent = parent[parent]
+                        if np.array_equal(grandparent, parent):
+                            break
+                        parent = grandparent
+                    component = parent[component]
+                else:
+                    lightest = {}
+                    for p in partial:
+                        for c, i in p.items():
+                            j = lightest.get(c)
+                            if j is None or (weights[i], i) < (weights[j], j):
+                                lightest[c] = i
+                    if not lightest:
+                        break
+                    for i in sorted(set(lightest.values())):
+                        if components.union(sources[i], targets[i]):
+                            mst_edges.append(i)
+                    component = [components.find(v) for v in range(n)]
+        finally:
+            if pool is not None:
+                pool.terminate()
+                
+        # Create a dictionary with the MST
+        mst = {}
+        total_weight = 0
+        
+        for i in mst_edges:
+            weight = weights[i].item() if backend == 'numpy' else weights[i]
+            mst[_edgeKey(V[sources[i]], V[targets[i]])] = weight
+            total_weight += weight
+            
+        return mst, total_weight
@@ -0,0 +1,106 @@
+'''
+File name: test_bellman_ford.py
+           Tests of the Bellman-Ford algorithm: the 'passes' and 'queue' modes give the
+           same distances with negative edge lengths, and a reachable negative cycle
+           is reported with a NegativeCycleError holding the cycle.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+MODES = ('passes', 'queue')
+
+
+def randomGraph(seed):
+    '''
+    Returns a seeded random graph with negative lengths but without negative cycles:
+    the length of (u, v) is a non negative number plus p(u) - p(v).
+    '''
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    V = ['v' + str(i) for i in range(n)]
+    p = {v: rng.randint(0, 20) for v in V}
+    edges = {v: {} for v in V}
+    for _ in range(rng.randint(0, 4 * n)):
+        u, v = rng.choice(V), rng.choice(V)
+        edges[u][v] = rng.randint(0, 10) + p[u] - p[v]
+
+    return ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+
+def assertNegativeCycle(g, cycle):
+
+    lengths = g.getLengths()
+    edges = list(zip(cycle, cycle[1:] + cycle[:1]))
+
+    assert all(v in lengths[u] for u, v in edges)
+    assert sum(lengths[u][v] for u, v in edges) < 0
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_modes_equal_distances(seed):
+
+    g = randomGraph(seed)
+    s = g.getVertices()[0]
+    algorithms = ga.GraphAlgorithms()
+    expected = algorithms.bfs(g, s)[1]
+
+    for G in (g, g.freeze()):
+        results = [algorithms.bellmanFord(G, G.getLengths(), s, mode = mode) for mode in MODES]
+
+        assert results[0][1] == results[1][1]
+        for previous, distance in results:
+            # Same reachable nodes as the BFS, and tight previous edges
+            assert {v for v in distance if distance[v] != float('inf')} == \
+                {v for v in expected if expected[v] != float('inf')}
+            for v, u in previous.items():
+                if u is not None:
+                    assert distance[v] == distance[u] + g.getLengths()[u][v]
+
+
+@pytest.mark.parametrize('mode', MODES)
+@pytest.mark.parametrize('seed', range(20))
+def test_negative_cycle(seed, mode):
+
+    g = randomGraph(seed)
+    V = g.getVertices()
+    rng = random.Random(seed)
+
+    # A negative cycle reachable from the starting node
+    cycle = rng.sample(V, min(len(V), rng.randint(1, 4)))
+    for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+        if v in g.getLengths()[u]:
+            g.updateWeight(u, v, -50)
+        else:
+            g.addEdge(u, v, -50)
+    g.addEdge('s', cycle[0], 1)
+
+    for G in (g, g.freeze()):
+        with pytest.raises(ga.NegativeCycleError) as error:
+            ga.GraphAlgorithms().bellmanFord(G, G.getLengths(), 's', mode = mode)
+
+        assertNegativeCycle(g, error.value.cycle)
+
+
+@pytest.mark.parametrize('mode', MODES)
+def test_not_reachable_negative_cycle(mode):
+
+    g = ga.Graph(['s', 'a', 'b', 'c'], {'s': [('a', 2)], 'b': [('c', -3)], 'c': [('b', 1)]})
+
+    previous, distance = ga.GraphAlgorithms().bellmanFord(g, g.getLengths(), 's', mode = mode)
+
+    assert distance == {'s': 0, 'a': 2, 'b': float('inf'), 'c': float('inf')}
+    assert previous == {'s': None, 'a': 's', 'b': None, 'c': None}
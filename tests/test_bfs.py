@@ -0,0 +1,41 @@
+'''
+File name: test_bfs.py
+           Tests of the BFS modes: the level-synchronous and the direction-optimizing
+           modes return the same previous and distance structures as the FIFO queue
+           mode, with parallel edges and unreachable nodes.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_modes_equal_queue(seed):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 200)
+    V = ['v' + str(i) for i in range(n)]
+    rng.shuffle(V)
+    edges = {v: [(rng.choice(V), 1) for _ in range(rng.randint(0, 12))] for v in V}
+    g = ga.Graph(V, edges)
+    algorithms = ga.GraphAlgorithms()
+    previous, distance = algorithms.bfs(g, V[0])
+
+    for G in ((g.getVertices(), g.getEdges()), g, g.freeze()):
+        for mode in ('level', 'hybrid'):
+            result = algorithms.bfs(G, V[0], mode = mode)
+
+            assert result == (previous, distance)
+            assert list(result[0]) == list(previous)
@@ -0,0 +1,56 @@
+'''
+File name: test_cache.py
+           Tests of the ShortestPathCache: the cached results are the computed ones,
+           every caller gets its own copy, and the entries of a modified graph are
+           not returned.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import sys
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+def sampleGraph():
+
+    return ga.Graph(['a', 'b', 'c', 'd'], {'a': [('b', 1), ('c', 4)], 'b': [('c', 2)],
+        'c': [('d', 1)], 'd': []})
+
+
+def test_hits_are_copies():
+
+    g = sampleGraph()
+    cache = ga.ShortestPathCache()
+    algorithms = ga.GraphAlgorithms(cache = cache)
+
+    previous, distance = algorithms.dijkstra(g, g.getLengths(), 'a')
+    expected = ga.GraphAlgorithms().dijkstra(g, g.getLengths(), 'a')
+    assert (previous, distance) == expected
+
+    # Modifying a returned result does not change the cached one
+    previous['d'] = 'a'
+    distance['d'] = 0
+    assert algorithms.dijkstra(g, g.getLengths(), 'a') == expected
+
+    hit = algorithms.dijkstra(g, g.getLengths(), 'a')
+    hit[1].clear()
+    assert algorithms.dijkstra(g, g.getLengths(), 'a') == expected
+    assert cache.getStats()['hits'] == 3
+    assert cache.getStats()['misses'] == 1
+
+
+def test_modified_graph_is_recomputed():
+
+    g = sampleGraph()
+    algorithms = ga.GraphAlgorithms(cache = ga.ShortestPathCache())
+
+    assert algorithms.dijkstra(g, g.getLengths(), 'a')[1]['d'] == 4
+    g.updateWeight('a', 'c', 1)
+    assert algorithms.dijkstra(g, g.getLengths(), 'a')[1]['d'] == 2
@@ -0,0 +1,86 @@
+'''
+File name: test_contraction_hierarchy.py
+           Tests of the ContractionHierarchy: the query costs are the distances of the
+           Dijkstra's algorithm, the paths are graph paths of these costs, also with a
+           small witness search limit and after saving and opening the index.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+def randomGraph(seed):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    V = ['v' + str(i) for i in range(n)]
+    edges = {v: {} for v in V}
+    for _ in range(rng.randint(0, 4 * n)):
+        u, v = rng.choice(V), rng.choice(V)
+        if u != v:
+            edges[u][v] = rng.randint(1, 9)
+
+    return ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+
+def assertQueries(g, hierarchy):
+
+    l = g.getLengths()
+    algorithms = ga.GraphAlgorithms()
+
+    for s in g.getVertices():
+        distance = algorithms.dijkstra(g, l, s)[1]
+        for t in g.getVertices():
+            path, cost = hierarchy.query(s, t)
+
+            assert cost == distance[t]
+            if cost == float('inf'):
+                assert path == []
+            else:
+                assert path[0] == s and path[-1] == t
+                assert sum(l[u][v] for u, v in zip(path, path[1:])) == cost
+
+
+@pytest.mark.parametrize('witness_limit', (1, 500))
+@pytest.mark.parametrize('seed', range(20))
+def test_query_equals_dijkstra(seed, witness_limit):
+
+    g = randomGraph(seed)
+
+    for G in (g, g.freeze()):
+        assertQueries(g, ga.ContractionHierarchy(G, G.getLengths(), witness_limit = witness_limit))
+
+
+@pytest.mark.parametrize('mmap', (False, True))
+def test_save_and_open(tmp_path, mmap):
+
+    g = randomGraph(7)
+    hierarchy = ga.ContractionHierarchy(g, g.getLengths())
+    path = str(tmp_path / 'graph.ch')
+    hierarchy.save(path)
+
+    opened = ga.ContractionHierarchy.open(path, mmap = mmap)
+
+    assert opened.getVertices() == g.getVertices()
+    assert opened.getShortcutCount() == hierarchy.getShortcutCount()
+    assertQueries(g, opened)
+
+
+def test_non_positive_length():
+
+    g = ga.Graph(['a', 'b'], {'a': [('b', 0)]})
+
+    with pytest.raises(ValueError):
+        ga.ContractionHierarchy(g, g.getLengths())
@@ -0,0 +1,107 @@
+'''
+File name: test_csr.py
+           Tests of the CSRGraph algorithms: on a frozen graph, the algorithms which run
+           on the CSR arrays return the same structures (in the same order) as on the
+           Graph, with not sorted labels and ties between equal lengths.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+SEEDS = range(20)
+
+
+def randomGraph(seed, undirected = False):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    V = ['v' + str(i) for i in range(n)]
+    rng.shuffle(V)
+    edges = {v: {} for v in V}
+    for _ in range(rng.randint(0, 4 * n)):
+        u, v = rng.choice(V), rng.choice(V)
+        if u != v:
+            edges[u][v] = rng.randint(1, 5)
+            if undirected:
+                edges[v][u] = edges[u][v]
+
+    g = ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+    return g, g.freeze()
+
+
+def assertSame(result, expected):
+
+    assert result == expected
+    for r, e in zip(result, expected):
+        if isinstance(e, dict):
+            assert list(r) == list(e)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_traversals(seed):
+
+    g, c = randomGraph(seed)
+    s = g.getVertices()[0]
+    algorithms = ga.GraphAlgorithms()
+
+    for mode in ('queue', 'level', 'hybrid'):
+        assertSame(algorithms.bfs(c, s, mode = mode), algorithms.bfs(g, s, mode = mode))
+    assertSame(algorithms.dfs(c), algorithms.dfs(g))
+    assert list(algorithms.iterDfs(c, s, max_depth = 2)) == list(algorithms.iterDfs(g, s, max_depth = 2))
+    assert list(algorithms.iterDfs(c, limit = 5)) == list(algorithms.iterDfs(g, limit = 5))
+    assert algorithms.scc(c) == algorithms.scc(g)
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_shortest_paths(seed):
+
+    g, c = randomGraph(seed)
+    V = g.getVertices()
+    algorithms = ga.GraphAlgorithms()
+
+    for mode in ('passes', 'queue'):
+        assertSame(algorithms.bellmanFord(c, c.getLengths(), V[0], mode = mode),
+            algorithms.bellmanFord(g, g.getLengths(), V[0], mode = mode))
+    assertSame(algorithms.astar(c, c.getLengths(), V[0], V[-1], lambda v, t: 0),
+        algorithms.astar(g, g.getLengths(), V[0], V[-1], lambda v, t: 0))
+    assert algorithms.floydWarshall(c, c.getLengths()) == algorithms.floydWarshall(g, g.getLengths())
+
+    hierarchy = ga.ContractionHierarchy(c, c.getLengths())
+    expected = ga.ContractionHierarchy(g, g.getLengths())
+    assert hierarchy.getShortcutCount() == expected.getShortcutCount()
+    for t in V:
+        assert hierarchy.query(V[0], t) == expected.query(V[0], t)
+
+
+@pytest.mark.parametrize('queue', ('lazy', 'indexed'))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_prim(seed, queue):
+
+    g, c = randomGraph(seed, undirected = True)
+
+    assertSame(ga.MST().prim(c, c.getLengths(), queue = queue),
+        ga.MST().prim(g, g.getLengths(), queue = queue))
+
+
+def test_freeze_copies_vertices():
+
+    g = ga.Graph(['a', 'b'], {'a': [('b', 1)]})
+    c = g.freeze()
+    g.addEdge('b', 'c', 2.5)
+
+    assert c.getVertices() == ['a', 'b']
+    assert list(c.getWeights()) == [1] and c.getWeights().typecode == 'q'
+    assert g.freeze().getWeights().typecode == 'd'
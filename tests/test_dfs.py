@@ -0,0 +1,105 @@
+'''
+File name: test_dfs.py
+           Tests of the iterative DFS: the dfs and iterDfs methods give the same pre,
+           post and ccnum structures as the recursive explore procedure, and run on
+           paths deeper than the recursion limit.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+def recursiveDfs(V, E):
+    '''
+    The recursive DFS (see DPV, Algorithms, Chapter 3.2), the reference of the tests.
+    '''
+
+    pre = {}
+    post = {}
+    ccnum = {}
+    clock = [1]
+
+    def explore(v, cc):
+        pre[v] = clock[0]
+        clock[0] += 1
+        ccnum[v] = cc
+        for w in E[v]:
+            if w not in pre:
+                explore(w, cc)
+        post[v] = clock[0]
+        clock[0] += 1
+
+    cc = 0
+    for v in V:
+        if v not in pre:
+            cc += 1
+            explore(v, cc)
+
+    return pre, post, ccnum
+
+
+def randomGraph(seed):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 60)
+    V = ['v' + str(i) for i in range(n)]
+    rng.shuffle(V)
+    E = {v: [rng.choice(V) for _ in range(rng.randint(0, 4))] for v in V}
+
+    return V, E
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_dfs_equals_recursive(seed):
+
+    V, E = randomGraph(seed)
+    expected = recursiveDfs(V, E)
+    g = ga.Graph(V, {u: [(v, 1) for v in E[u]] for u in V})
+
+    for G in ((V, E), g, g.freeze()):
+        result = ga.GraphAlgorithms().dfs(G)
+
+        assert result == expected
+        assert [list(r) for r in result] == [list(e) for e in expected]
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_iter_dfs_equals_recursive(seed):
+
+    V, E = randomGraph(seed)
+    pre, post, _ = recursiveDfs(V, E)
+
+    events = list(ga.GraphAlgorithms().iterDfs((V, E)))
+
+    # The pre and post times are the positions of the events
+    assert {v: t for t, (event, v, _) in enumerate(events, 1) if event == 'pre'} == pre
+    assert {v: t for t, (event, v, _) in enumerate(events, 1) if event == 'post'} == post
+
+
+def test_deep_path():
+
+    n = 3 * sys.getrecursionlimit() + 10
+    V = list(range(n))
+    g = ga.Graph(V, {i: [(i + 1, 1)] for i in range(n - 1)})
+
+    for G in (g, g.freeze()):
+        pre, post, ccnum = ga.GraphAlgorithms().dfs(G)
+
+        assert pre == {i: i + 1 for i in V}
+        assert post == {i: 2 * n - i for i in V}
+        assert set(ccnum.values()) == {1}
+
+        depths = [depth for event, _, depth in ga.GraphAlgorithms().iterDfs(G, 0) if event == 'pre']
+        assert depths == V
@@ -0,0 +1,76 @@
+'''
+File name: test_engines.py
+           Tests of the integer lengths engines of Dijkstra's algorithm: the radix heap,
+           bucket queue and delta-stepping engines give the same previous and distance
+           structures as the heap engine. The delta-stepping engine is skipped when
+           NumPy is not installed.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+SEEDS = range(20)
+
+
+def randomGraph(seed):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 60)
+    V = ['v' + str(i) for i in range(n)]
+    rng.shuffle(V)
+    edges = {v: {} for v in V}
+    max_length = rng.choice((1, 3, 100))
+    for _ in range(rng.randint(0, 4 * n)):
+        u, v = rng.choice(V), rng.choice(V)
+        if u != v:
+            edges[u][v] = rng.randint(1, max_length)
+
+    return ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+
+@pytest.mark.parametrize('engine', ('radix', 'buckets'))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_engines_equal_heap(seed, engine):
+
+    g = randomGraph(seed)
+    s = g.getVertices()[0]
+    algorithms = ga.GraphAlgorithms()
+
+    for G in (g, g.freeze()):
+        assert algorithms.dijkstra(G, G.getLengths(), s, engine = engine) == \
+            algorithms.dijkstra(G, G.getLengths(), s)
+
+
+@pytest.mark.skipif(ga.np is None, reason = 'NumPy is not installed')
+@pytest.mark.parametrize('delta', (None, 1, 4))
+@pytest.mark.parametrize('seed', SEEDS)
+def test_delta_stepping_equals_heap(seed, delta):
+
+    g = randomGraph(seed)
+    s = g.getVertices()[0]
+    algorithms = ga.GraphAlgorithms()
+
+    for G in (g, g.freeze()):
+        assert algorithms.dijkstra(G, G.getLengths(), s, engine = 'delta', delta = delta) == \
+            algorithms.dijkstra(G, G.getLengths(), s)
+
+
+@pytest.mark.parametrize('engine', ('radix', 'buckets'))
+def test_not_integer_length(engine):
+
+    g = ga.Graph(['a', 'b'], {'a': [('b', 1.5)]})
+
+    with pytest.raises(ValueError):
+        ga.GraphAlgorithms().dijkstra(g, g.getLengths(), 'a', engine = engine)
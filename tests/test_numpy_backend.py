@@ -0,0 +1,106 @@
+'''
+File name: test_numpy_backend.py
+           Tests of the NumPy backend of the Bellman-Ford and Floyd-Warshall algorithms:
+           the distances are the ones of the python backend, the previous structures
+           give paths of these costs, and the negative cycles are reported. Skipped
+           when NumPy is not installed.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+pytestmark = pytest.mark.skipif(ga.np is None, reason = 'NumPy is not installed')
+
+
+def randomGraph(seed, floats = False):
+    '''
+    Returns a seeded random graph with negative lengths but without negative cycles:
+    the length of (u, v) is a non negative number plus p(u) - p(v).
+    '''
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 30)
+    V = ['v' + str(i) for i in range(n)]
+    p = {v: rng.randint(0, 20) for v in V}
+    edges = {v: {} for v in V}
+    for _ in range(rng.randint(0, 4 * n)):
+        u, v = rng.choice(V), rng.choice(V)
+        edges[u][v] = rng.randint(0, 10) + p[u] - p[v] + (0.5 if floats else 0)
+
+    return ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+
+def assertTight(l, previous, distance):
+
+    for v, u in previous.items():
+        if u is not None:
+            assert distance[v] == distance[u] + l[u][v]
+
+
+@pytest.mark.parametrize('floats', (False, True))
+@pytest.mark.parametrize('seed', range(20))
+def test_bellman_ford(seed, floats):
+
+    g = randomGraph(seed, floats)
+    s = g.getVertices()[0]
+    algorithms = ga.GraphAlgorithms()
+
+    for G in (g, g.freeze()):
+        expected = algorithms.bellmanFord(G, G.getLengths(), s)[1]
+        previous, distance = algorithms.bellmanFord(G, G.getLengths(), s, backend = 'numpy')
+
+        assert distance == expected
+        assert [type(d) for d in distance.values()] == [type(d) for d in expected.values()]
+        assertTight(g.getLengths(), previous, distance)
+
+
+@pytest.mark.parametrize('block', (1, 4, 256))
+@pytest.mark.parametrize('seed', range(20))
+def test_floyd_warshall(seed, block):
+
+    g = randomGraph(seed)
+    algorithms = ga.GraphAlgorithms()
+
+    for G in (g, g.freeze()):
+        expected = algorithms.floydWarshall(G, G.getLengths())[1]
+        previous, distance = algorithms.floydWarshall(G, G.getLengths(), backend = 'numpy',
+            block = block)
+
+        assert distance == expected
+        for u in g.getVertices():
+            assertTight(g.getLengths(), {v: p for v, p in previous[u].items() if v != u},
+                distance[u])
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_negative_cycle(seed):
+
+    g = randomGraph(seed)
+    V = g.getVertices()
+    cycle = V[:2] if len(V) > 1 else V
+    for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+        if v in g.getLengths()[u]:
+            g.updateWeight(u, v, -50)
+        else:
+            g.addEdge(u, v, -50)
+    algorithms = ga.GraphAlgorithms()
+
+    with pytest.raises(ga.NegativeCycleError) as error:
+        algorithms.bellmanFord(g, g.getLengths(), V[0], backend = 'numpy')
+    found = error.value.cycle
+    assert sum(g.getLengths()[u][v] for u, v in zip(found, found[1:] + found[:1])) < 0
+
+    with pytest.raises(ga.NegativeCycleError):
+        algorithms.floydWarshall(g, g.getLengths(), backend = 'numpy')
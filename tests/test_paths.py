@@ -0,0 +1,57 @@
+'''
+File name: test_paths.py
+           Tests of the path reconstruction methods: reconstructPath and allPaths give
+           the same paths, for the previous dictionaries and their compact arrays, and
+           allPaths shares the prefixes of the paths.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_all_paths_equal_reconstructed_paths(seed):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 50)
+    V = ['v' + str(i) for i in range(n)]
+    g = ga.Graph(V, {u: [(rng.choice(V), rng.randint(1, 9)) for _ in range(rng.randint(0, 3))]
+        for u in V})
+    algorithms = ga.GraphAlgorithms()
+    previous, distance = algorithms.dijkstra(g, g.getLengths(), V[0])
+    compact = algorithms.compactPrevious(g, previous)
+
+    paths = algorithms.allPaths(previous, V[0])
+    compact_paths = algorithms.allPaths(compact, 0)
+
+    assert set(paths) == {v for v in V if distance[v] != float('inf')}
+    for i, v in enumerate(V):
+        path = algorithms.reconstructPath(previous, V[0], v)
+        assert paths.get(v, []) == path
+        assert [V[j] for j in compact_paths.get(i, [])] == path
+
+
+def test_all_paths_share_prefixes():
+
+    n = 5000
+    g = ga.Graph(list(range(n)), {i: [(i + 1, 1)] for i in range(n - 1)})
+    previous, _ = ga.GraphAlgorithms().bfs(g, 0)
+
+    paths = ga.GraphAlgorithms().allPaths(previous, 0)
+
+    assert len(paths[n - 1]) == n
+    assert paths[n - 1][-2] == n - 2
+    assert list(paths[n - 1]) == list(range(n))
+    assert paths[3] == [0, 1, 2, 3]
@@ -0,0 +1,93 @@
+'''
+File name: test_queues.py
+           Tests of the priority queue strategies of Dijkstra's and Prim's algorithms:
+           the lazy deletion (heapq) strategy and the indexed d-ary heap strategy, for
+           every supported arity, give identical results on seeded random graphs.
+           
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+ARITIES = (2, 4, 8)
+SEEDS = range(20)
+
+
+def randomGraph(seed, undirected = False):
+    '''
+    Returns a seeded random graph (V, E, l) with integer lengths. The lengths of an
+    undirected graph are distinct, so its minimum spanning tree is unique.
+    '''
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 60)
+    V = ['v' + str(i) for i in range(n)]
+    E = {v: [] for v in V}
+    l = {v: {} for v in V}
+
+    m = rng.randint(0, 4 * n)
+    weights = rng.sample(range(1, 10 * m + 2), m)
+    for weight in weights:
+        u, v = rng.choice(V), rng.choice(V)
+        if u == v or v in l[u]:
+            continue
+        if not undirected:
+            weight = rng.randint(1, 10)
+        E[u].append(v)
+        l[u][v] = weight
+        if undirected:
+            E[v].append(u)
+            l[v][u] = weight
+
+    return V, E, l
+
+
+@pytest.mark.parametrize('arity', ARITIES)
+@pytest.mark.parametrize('seed', SEEDS)
+def test_dijkstra_queues(seed, arity):
+
+    V, E, l = randomGraph(seed)
+    s = V[0]
+    algorithms = ga.GraphAlgorithms()
+
+    lazy = algorithms.dijkstra((V, E), l, s, queue = 'lazy')
+    indexed = algorithms.dijkstra((V, E), l, s, queue = 'indexed', arity = arity)
+
+    assert indexed[1] == lazy[1]
+    assert indexed[0] == lazy[0]
+
+
+@pytest.mark.parametrize('arity', ARITIES)
+@pytest.mark.parametrize('seed', SEEDS)
+def test_prim_queues(seed, arity):
+
+    V, E, l = randomGraph(seed, undirected = True)
+    mst = ga.MST()
+
+    lazy_mst, lazy_weight = mst.prim((V, E), l, queue = 'lazy')
+    indexed_mst, indexed_weight = mst.prim((V, E), l, queue = 'indexed', arity = arity)
+
+    # The edges of an undirected tree are compared regardless of their direction
+    assert indexed_weight == lazy_weight
+    assert {frozenset(e): w for e, w in indexed_mst.items()} == \
+        {frozenset(e): w for e, w in lazy_mst.items()}
+
+
+@pytest.mark.parametrize('arity', ARITIES)
+def test_not_supported_arity(arity):
+
+    V, E, l = randomGraph(0)
+
+    with pytest.raises(ValueError):
+        ga.GraphAlgorithms().dijkstra((V, E), l, V[0], arity = arity + 1)
@@ -0,0 +1,103 @@
+'''
+File name: test_repair.py
+           Tests of the Graph mutation methods and of the dynamic shortest paths repair:
+           after random batches of edge changes, the repaired distances are the ones
+           of the dijkstra method run from scratch.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+def randomGraph(rng, n, m):
+
+    V = list(range(n))
+    edges = {v: {} for v in V}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges[u][v] = rng.randint(1, 20)
+
+    return V, ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+
+def test_vertices_are_copied():
+
+    V = ['a', 'b']
+    g = ga.Graph(V, {'a': [('b', 1)]})
+    g.addEdge('b', 'c', 2)
+
+    assert V == ['a', 'b']
+    assert g.getVertices() == ['a', 'b', 'c']
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_reverse_is_kept_up_to_date(seed):
+
+    rng = random.Random(seed)
+    _, g = randomGraph(rng, 20, 60)
+    R = g.reverse()
+
+    for _ in range(30):
+        u, v = rng.randrange(25), rng.randrange(25)
+        if v in g.getLengths().get(u, {}):
+            if rng.random() < 0.5:
+                g.removeEdge(u, v)
+            else:
+                g.updateWeight(u, v, rng.randint(1, 20))
+        else:
+            g.addEdge(u, v, rng.randint(1, 20))
+
+    expected = ga.Graph(g.getVertices(), {u: [] for u in g.getVertices()})
+    for u in g.getVertices():
+        for v in g.getEdges()[u]:
+            expected.addEdge(v, u, g.getLengths()[u][v])
+
+    assert g.reverse() is R
+    assert R.getVertices() == g.getVertices()
+    assert R.getLengths() == expected.getLengths()
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_repair_equals_dijkstra(seed):
+
+    rng = random.Random(seed)
+    V, g = randomGraph(rng, 40, 160)
+    algorithms = ga.GraphAlgorithms()
+    previous, distance = algorithms.dijkstra(g, g.getLengths(), 0)
+
+    for _ in range(5):
+        changes = []
+        for _ in range(rng.randint(1, 6)):
+            u, v = rng.randrange(45), rng.randrange(45)
+            if u == v:
+                continue
+            if v in g.getLengths().get(u, {}):
+                if rng.random() < 0.5:
+                    g.removeEdge(u, v)
+                else:
+                    g.updateWeight(u, v, rng.randint(1, 20))
+            else:
+                g.addEdge(u, v, rng.randint(1, 20))
+            changes.append((u, v))
+
+        previous, distance = algorithms.repairShortestPaths(g, g.getLengths(), 0, previous,
+            distance, changes)
+        expected = algorithms.dijkstra(g, g.getLengths(), 0)[1]
+
+        assert distance == expected
+        for v, u in previous.items():
+            if u is not None:
+                assert distance[v] == distance[u] + g.getLengths()[u][v]
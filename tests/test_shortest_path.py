@@ -0,0 +1,89 @@
+'''
+File name: test_shortest_path.py
+           Tests of the point-to-point shortest path queries: the bidirectional
+           searches give the same costs as the unidirectional ones and the single
+           source algorithms, and the returned paths have these costs.
+
+License: MIT
+
+Date last modified: 18.10.2026
+
+Python Version: 3.7
+'''
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import graphalgorithms as ga
+
+
+def randomGraph(seed):
+
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    V = ['v' + str(i) for i in range(n)]
+    edges = {v: {} for v in V}
+    for _ in range(rng.randint(0, 3 * n)):
+        u, v = rng.choice(V), rng.choice(V)
+        if u != v:
+            edges[u][v] = rng.randint(1, 9)
+
+    return ga.Graph(V, {u: list(e.items()) for u, e in edges.items()})
+
+
+def pathCost(l, path):
+
+    return sum(l[u][v] for u, v in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_bidirectional_dijkstra(seed):
+
+    g = randomGraph(seed)
+    V = g.getVertices()
+    algorithms = ga.GraphAlgorithms()
+
+    # The graph's own lengths and other lengths, which are not the ones of the cached
+    # reversed graph
+    other = {u: {v: length % 4 + 1 for v, length in e.items()} for u, e in g.getLengths().items()}
+
+    for G, l in ((g, g.getLengths()), (g.freeze(), g.freeze().getLengths()), (g, other),
+        ((V, g.getEdges()), other)):
+        s = V[0]
+        distance = algorithms.dijkstra(G, l, s)[1]
+
+        for t in V:
+            path, cost = algorithms.shortestPath(G, l, s, t)
+            bipath, bicost = algorithms.shortestPath(G, l, s, t, method = 'bidijkstra')
+
+            assert cost == bicost == distance[t]
+            if cost == float('inf'):
+                assert path == bipath == []
+            else:
+                assert path[0] == bipath[0] == s and path[-1] == bipath[-1] == t
+                assert pathCost(l, path) == pathCost(l, bipath) == cost
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_bidirectional_bfs(seed):
+
+    g = randomGraph(seed)
+    V = g.getVertices()
+    algorithms = ga.GraphAlgorithms()
+    unit = {u: {v: 1 for v in e} for u, e in g.getLengths().items()}
+
+    for G in (g, g.freeze(), (V, g.getEdges())):
+        s = V[0]
+        distance = algorithms.bfs(G, s)[1]
+
+        for t in V:
+            path, cost = algorithms.shortestPath(G, None, s, t, method = 'bfs')
+            bipath, bicost = algorithms.shortestPath(G, None, s, t, method = 'bibfs')
+
+            assert cost == bicost == distance[t]
+            if cost != float('inf'):
+                assert pathCost(unit, path) == pathCost(unit, bipath) == cost